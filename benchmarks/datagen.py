@@ -0,0 +1,105 @@
+# File: benchmarks/datagen.py
+# Description: Synthetic users and tasks for the benchmark suite.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: db.DB_PATH points at a scratch database (it is migrated here).
+# Postconditions: N users x M tasks inserted; the same seed gives the same data.
+#
+# Usage: python -m benchmarks.datagen --users 100 --tasks 50 --db /tmp/bench.db
+
+import argparse
+import random
+import sys
+from typing import NamedTuple, Sequence
+
+from src import db
+from src.db import get_connection, run_migrations
+from src.time_periods import format_hhmm
+
+DEFAULT_DURATIONS = (15, 20, 30, 45, 60, 90, 120)
+# Fixed times that many users share, so conflict detection has real work to do.
+HOT_TIMES = (8 * 60, 9 * 60, 12 * 60, 17 * 60 + 30)
+
+
+class DataSpec(NamedTuple):
+    users: int = 10
+    tasks: int = 20                 # per user
+    fixed_ratio: float = 0.2        # share of tasks that are 'fixed'
+    collision_rate: float = 0.5     # share of fixed tasks placed on a HOT_TIMES slot
+    selected_ratio: float = 0.6     # share of tasks selected for scheduling
+    durations: Sequence[int] = DEFAULT_DURATIONS
+    seed: int = 581
+
+
+def task_rows(spec:DataSpec, user_id:int, rng:random.Random):
+    """(user_id, name, duration, selected, task_type, fixed_time) rows for one user."""
+    for n in range(spec.tasks):
+        duration = rng.choice(spec.durations)
+        selected = int(rng.random() < spec.selected_ratio)
+        if rng.random() < spec.fixed_ratio:
+            if rng.random() < spec.collision_rate:
+                minute = rng.choice(HOT_TIMES)
+            else:
+                minute = rng.randrange(8 * 60, 21 * 60, 15)
+            yield (user_id, f"Task {n + 1}", duration, selected, 'fixed', format_hhmm(minute))
+        else:
+            yield (user_id, f"Task {n + 1}", duration, selected, 'flexible', None)
+
+
+def populate(spec:DataSpec):
+    """Migrate db.DB_PATH and fill it per spec. Returns the generated user ids."""
+    run_migrations()
+    rng = random.Random(spec.seed)
+    with get_connection() as conn:
+        start = conn.execute("SELECT COALESCE(MAX(id), 0) FROM users").fetchone()[0]
+        names = [(f"bench_{start + i + 1}",) for i in range(spec.users)]
+        conn.executemany("INSERT INTO users (username) VALUES (?)", names)
+        user_ids = [row[0] for row in conn.execute(
+            "SELECT id FROM users WHERE id > ? ORDER BY id", (start,))]
+        for user_id in user_ids:
+            conn.executemany(
+                "INSERT INTO tasks (user_id, name, duration_minutes, selected, task_type, fixed_time) VALUES (?, ?, ?, ?, ?, ?)",
+                task_rows(spec, user_id, rng)
+            )
+    return user_ids
+
+
+def _durations(text):
+    try:
+        values = tuple(int(v) for v in text.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError("durations must be comma-separated minutes")
+    if not values or min(values) <= 0:
+        raise argparse.ArgumentTypeError("durations must be positive")
+    return values
+
+
+def add_spec_arguments(parser):
+    """The DataSpec knobs as command-line options (shared with benchmarks.run)."""
+    defaults = DataSpec()
+    parser.add_argument("--fixed-ratio", type=float, default=defaults.fixed_ratio)
+    parser.add_argument("--collision-rate", type=float, default=defaults.collision_rate)
+    parser.add_argument("--selected-ratio", type=float, default=defaults.selected_ratio)
+    parser.add_argument("--durations", type=_durations, default=defaults.durations,
+                        help="comma-separated task lengths in minutes to draw from")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fill a database with synthetic users and tasks.")
+    parser.add_argument("--users", type=int, default=DataSpec.users)
+    parser.add_argument("--tasks", type=int, default=DataSpec.tasks, help="tasks per user")
+    parser.add_argument("--db", required=True, help="database file to fill")
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+
+    db.DB_PATH = args.db
+    spec = DataSpec(args.users, args.tasks, args.fixed_ratio, args.collision_rate,
+                    args.selected_ratio, args.durations, args.seed)
+    user_ids = populate(spec)
+    print(f"Created {len(user_ids)} users with {spec.tasks} tasks each in {args.db}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
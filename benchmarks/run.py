@@ -0,0 +1,273 @@
+# File: benchmarks/run.py
+# Description: Times the repository and scheduler hot paths on synthetic data.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: None; every size gets its own temporary scheduler.db.
+# Postconditions: Timings written as JSON; optionally compared against a saved baseline.
+#
+# Usage: python -m benchmarks.run [--sizes 10x20,100x50] [--repeat 5] [-o results.json]
+#                                 [--baseline baseline.json] [--threshold 0.10]
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time as clock
+from datetime import datetime, timezone
+
+from src import db
+from src.automatic_scheduler import AutomaticScheduler
+from src.manual_scheduler import ManualScheduler
+from src.task_repo import TaskRepo
+from benchmarks.datagen import DataSpec, add_spec_arguments, populate
+
+DEFAULT_SIZES = "10x20,100x50,500x100"
+DEFAULT_SAMPLE = 50
+
+
+# --- benchmarks: setup(user_id) runs untimed, run(state) is the timed call ---
+
+def _built_schedule(user_id):
+    scheduler = AutomaticScheduler(user_id)
+    return scheduler, scheduler.build_schedule()
+
+
+def _manual_setup(user_id):
+    scheduler = ManualScheduler(user_id)
+    return scheduler, TaskRepo(user_id).get_selected_tasks()
+
+
+def _manual_run(state):
+    """ManualScheduler.assign_task on the slot list, one task per slot in turn."""
+    scheduler, tasks = state
+    time_slots = scheduler.generate_time_slots()
+    slot_idx = 0
+    for task in tasks:
+        if slot_idx >= len(time_slots):
+            break
+        time_slots = scheduler.assign_task(time_slots, slot_idx, task)
+        slot_idx += 1
+    return time_slots
+
+
+def _interval_run(state):
+    """Assign every selected task back to back on an IntervalSchedule, the way the menu does it."""
+    scheduler, tasks = state
+    day = scheduler.new_day()
+    start = day.start
+    for task in tasks:
+        if start + task[2] > day.end:
+            break
+        day.assign(start, task)
+        start += task[2]
+    return day.slots()
+
+
+def _horizon_setup(user_id):
+    scheduler = AutomaticScheduler(user_id)
+    scheduler.quiet = True
+    return scheduler, scheduler.make_horizon(7)
+
+
+def _horizon_run(state):
+    """A week in one build; compare with automatic.build_schedule for one day."""
+    scheduler, horizon = state
+    return scheduler.build_horizon(horizon)
+
+
+def _optimal_setup(user_id):
+    """Optimal packing with a 50 ms budget: the timing is bounded by the budget, not the task count."""
+    scheduler = AutomaticScheduler(user_id)
+    scheduler.set_strategy("optimal", 0.05)
+    return scheduler
+
+
+def _portfolio_setup(user_id, workers=None):
+    """Portfolio of the default candidates with a 50 ms budget: as slow as its slowest candidate."""
+    scheduler = AutomaticScheduler(user_id)
+    scheduler.set_strategy("portfolio", 0.05, workers=workers)
+    return scheduler
+
+
+def _save_run(state):
+    scheduler, schedule = state
+    if schedule:
+        scheduler.save_schedule(schedule, "Benchmark")
+
+
+BENCHMARKS = {
+    "task_repo.list_tasks": (TaskRepo, lambda repo: repo.list_tasks()),
+    "task_repo.detect_fixed_task_conflicts": (TaskRepo, lambda repo: repo.detect_fixed_task_conflicts()),
+    "automatic.build_schedule": (AutomaticScheduler, lambda scheduler: scheduler.build_schedule()),
+    "automatic.build_schedule_1min": (lambda user_id: AutomaticScheduler(user_id, slot_minutes=1, exact=False),
+                                      lambda scheduler: scheduler.build_schedule()),
+    "automatic.build_schedule_exact": (lambda user_id: AutomaticScheduler(user_id, slot_minutes=30, exact=True),
+                                       lambda scheduler: scheduler.build_schedule()),
+    "automatic.build_schedule_optimal": (_optimal_setup, lambda scheduler: scheduler.build_schedule()),
+    "automatic.build_schedule_portfolio": (_portfolio_setup, lambda scheduler: scheduler.build_schedule()),
+    "automatic.build_schedule_portfolio_serial": (lambda user_id: _portfolio_setup(user_id, workers=1),
+                                                  lambda scheduler: scheduler.build_schedule()),
+    "automatic.build_horizon": (_horizon_setup, _horizon_run),
+    "manual.assign_task": (_manual_setup, _manual_run),
+    "manual.interval_assign": (_manual_setup, _interval_run),
+    "automatic.save_schedule": (_built_schedule, _save_run),
+}
+
+
+def parse_sizes(text):
+    """'10x20,100x50' -> [(10, 20), (100, 50)] (users x tasks per user)."""
+    sizes = []
+    for part in text.split(","):
+        users, _, tasks = part.strip().lower().partition("x")
+        if not (users.isdigit() and tasks.isdigit()) or int(users) < 1:
+            raise argparse.ArgumentTypeError(f"bad size '{part}', expected USERSxTASKS")
+        sizes.append((int(users), int(tasks)))
+    return sizes
+
+
+def time_benchmark(setup, run, user_ids, repeat):
+    """Seconds per call for each of `repeat` passes over user_ids."""
+    states = [setup(user_id) for user_id in user_ids]
+    for state in states:
+        run(state)   # warm-up: statement cache, imports, page cache
+    per_call = []
+    for _ in range(repeat):
+        began = clock.perf_counter()
+        for state in states:
+            run(state)
+        per_call.append((clock.perf_counter() - began) / len(states))
+    return per_call
+
+
+def run_size(spec, names, repeat, sample, workdir):
+    """Run the named benchmarks on a fresh database built from spec."""
+    db.DB_PATH = os.path.join(workdir, f"bench_{spec.users}x{spec.tasks}.db")
+    user_ids = populate(spec)[:sample]
+    results = {}
+    for name in names:
+        setup, run = BENCHMARKS[name]
+        # the schedulers print as they go; keep that out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            per_call = time_benchmark(setup, run, user_ids, repeat)
+        results[f"{name}@{spec.users}x{spec.tasks}"] = {
+            "bench": name,
+            "users": spec.users,
+            "tasks": spec.tasks,
+            "calls": len(user_ids),
+            "repeat": repeat,
+            "best": min(per_call),
+            "median": statistics.median(per_call),
+            "mean": statistics.fmean(per_call),
+        }
+    db.close_connections()
+    return results
+
+
+def run_suite(sizes, spec, names=None, repeat=5, sample=DEFAULT_SAMPLE, progress=None):
+    """Benchmark every size; returns the JSON-able report."""
+    names = names or list(BENCHMARKS)
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "sample": sample,
+            "spec": {k: v for k, v in spec._asdict().items() if k not in ("users", "tasks")},
+        },
+        "results": {},
+    }
+    saved_path = db.DB_PATH
+    try:
+        with tempfile.TemporaryDirectory(prefix="scheduler_bench_") as workdir:
+            for users, tasks in sizes:
+                size_spec = spec._replace(users=users, tasks=tasks)
+                results = run_size(size_spec, names, repeat, sample, workdir)
+                report["results"].update(results)
+                if progress:
+                    progress(results)
+    finally:
+        db.DB_PATH = saved_path
+    return report
+
+
+def compare(report, baseline, threshold=0.10):
+    """Rows of (key, baseline median, current median, relative change, status)."""
+    rows = []
+    for key, current in report["results"].items():
+        before = baseline.get("results", {}).get(key)
+        if before is None:
+            rows.append((key, None, current["median"], None, "new"))
+            continue
+        change = current["median"] / before["median"] - 1 if before["median"] else 0.0
+        if change > threshold:
+            status = "slower"
+        elif change < -threshold:
+            status = "faster"
+        else:
+            status = "same"
+        rows.append((key, before["median"], current["median"], change, status))
+    return rows
+
+
+def _ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.3f}"
+
+
+def print_results(results, fh=sys.stderr):
+    for key, row in results.items():
+        print(f"{key:<50} median {_ms(row['median']):>10} ms  best {_ms(row['best']):>10} ms", file=fh)
+
+
+def print_comparison(rows, fh=sys.stderr):
+    print(f"{'benchmark':<50} {'base ms':>10} {'now ms':>10} {'change':>8}", file=fh)
+    for key, before, now, change, status in rows:
+        delta = "-" if change is None else f"{change:+.1%}"
+        print(f"{key:<50} {_ms(before):>10} {_ms(now):>10} {delta:>8}  {status}", file=fh)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduler and repository hot paths.")
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes(DEFAULT_SIZES),
+                        help=f"comma-separated USERSxTASKS (default {DEFAULT_SIZES})")
+    parser.add_argument("--bench", action="append", choices=sorted(BENCHMARKS),
+                        help="only this benchmark (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes per benchmark")
+    parser.add_argument("--sample", type=int, default=DEFAULT_SAMPLE, help="users timed per size")
+    parser.add_argument("-o", "--output", help="write the JSON report here ('-' for stdout)")
+    parser.add_argument("--baseline", help="compare against a saved JSON report")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative change counted as slower/faster (default 0.10)")
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+
+    spec = DataSpec(fixed_ratio=args.fixed_ratio, collision_rate=args.collision_rate,
+                    selected_ratio=args.selected_ratio, durations=args.durations, seed=args.seed)
+    report = run_suite(args.sizes, spec, args.bench, max(1, args.repeat), max(1, args.sample),
+                       progress=print_results)
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            rows = compare(report, json.load(fh), args.threshold)
+        print_comparison(rows)
+        if any(row[4] == "slower" for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
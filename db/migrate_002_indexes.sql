@@ -0,0 +1,19 @@
+/*
+File: db/migrate_002_indexes.sql
+Project: EECS 581 - Group 32
+Description: Adds indexes for the per-user task and schedule lookups
+Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+Created: 2026-10-16
+*/
+
+-- list_tasks: WHERE user_id=? ORDER BY created_at
+CREATE INDEX IF NOT EXISTS idx_tasks_user_created
+    ON tasks (user_id, created_at);
+
+-- get_fixed_tasks / selected-task loads: covers the filter and the fixed_time sort
+CREATE INDEX IF NOT EXISTS idx_tasks_user_selected_type
+    ON tasks (user_id, selected, task_type, fixed_time);
+
+-- schedule items are only ever read through their schedule, in time order
+CREATE INDEX IF NOT EXISTS idx_schedule_items_schedule_start
+    ON schedule_items (schedule_id, start_time);
@@ -0,0 +1,18 @@
+/*
+File: db/migrate_003_schedule_cache.sql
+Project: EECS 581 - Group 32
+Description: Persisted automatic-schedule results, keyed by input fingerprint
+Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+Created: 2026-10-16
+*/
+
+CREATE TABLE IF NOT EXISTS schedule_cache (
+    fingerprint TEXT PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_schedule_cache_user
+    ON schedule_cache (user_id);
@@ -0,0 +1,11 @@
+/*
+File: db/migrate_004_schedule_lookup.sql
+Project: EECS 581 - Group 32
+Description: Index for listing a user's saved schedules, newest first
+Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+Created: 2026-10-16
+*/
+
+-- ScheduleRepo.list_schedules / latest_schedule: WHERE user_id=? ORDER BY id DESC
+CREATE INDEX IF NOT EXISTS idx_schedules_user
+    ON schedules (user_id);
@@ -0,0 +1,11 @@
+/*
+File: db/migrate_005_task_recurrence.sql
+Project: EECS 581 - Group 32
+Description: Weekdays a fixed task recurs on, for multi-day schedules
+Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+Created: 2026-10-16
+*/
+
+-- NULL = every day (what fixed tasks always meant); otherwise weekday names
+-- such as 'mon,wed,fri', normalised by time_periods.parse_recurrence
+ALTER TABLE tasks ADD COLUMN recurrence TEXT;
@@ -0,0 +1,12 @@
+/*
+File: db/migrate_006_user_slot_settings.sql
+Project: EECS 581 - Group 32
+Description: Per-user slot length and exact-minute placement for the schedulers
+Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+Created: 2026-10-16
+*/
+
+-- NULL = the 30-minute slots every schedule used before
+ALTER TABLE users ADD COLUMN slot_minutes INTEGER CHECK(slot_minutes BETWEEN 1 AND 60);
+-- 1 = tasks take exactly their duration and fixed tasks keep off-grid times
+ALTER TABLE users ADD COLUMN exact_placement INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,32 @@
+/*
+File: db/migrate_007_schedule_item_tasks.sql
+Project: EECS 581 - Group 32
+Description: Saved schedule items outlive their tasks: deleting a task clears task_id instead of failing
+Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+Created: 2026-10-16
+*/
+
+-- SQLite cannot change a foreign key in place: rebuild schedule_items with a nullable task_id
+CREATE TABLE schedule_items_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    schedule_id INTEGER NOT NULL,
+    task_id INTEGER,
+    start_time TIME NOT NULL,
+    end_time TIME NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (schedule_id) REFERENCES schedules(id),
+    FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE SET NULL
+);
+
+-- items of tasks deleted before foreign keys were enforced lose their task the same way
+INSERT INTO schedule_items_new (id, schedule_id, task_id, start_time, end_time, created_at)
+    SELECT i.id, i.schedule_id, t.id, i.start_time, i.end_time, i.created_at
+    FROM schedule_items i
+    LEFT JOIN tasks t ON t.id = i.task_id
+    WHERE i.schedule_id IN (SELECT id FROM schedules);
+
+DROP TABLE schedule_items;
+ALTER TABLE schedule_items_new RENAME TO schedule_items;
+
+CREATE INDEX IF NOT EXISTS idx_schedule_items_schedule_start
+    ON schedule_items (schedule_id, start_time);
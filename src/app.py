@@ -4,10 +4,11 @@
 # Created: 2025-10-21
 
 from src.db import run_migrations, get_connection
-from src.task_repo import TaskRepo
-from src.manual_scheduler import run_manual_scheduler
-from src.automatic_scheduler import AutomaticScheduler
+from src.task_repo import TaskRepo, TaskCache
+from src.schedule_cache import ScheduleCache
+from src.breaks import BreakPolicy, default_break_policy
 from datetime import datetime, time, timedelta
+# the schedulers and exporter are imported by the menu options that use them
 
 def _get_default_user_id() -> int:
     with get_connection() as conn:
@@ -18,7 +19,9 @@ def _get_default_user_id() -> int:
 def main():
     run_migrations()
     user_id = _get_default_user_id()
-    repo = TaskRepo(user_id=user_id)
+    schedule_cache = ScheduleCache(persist=True)
+    repo = TaskRepo(user_id=user_id, cache=TaskCache(), schedule_cache=schedule_cache)
+    break_policy = None   # set in Break Settings; used by both schedulers
     
     while True:
         # print main menu after each option
@@ -68,7 +71,7 @@ def main():
             if not rows:
                 print("(no tasks yet)")
             for t in rows:
-                task_id, name, duration, selected, task_type, fixed_time = t
+                task_id, name, duration, selected, task_type, fixed_time, *_ = t
                 status = "✓" if selected else "✗"
                 print(f"{task_id}. {name} | {duration} minutes | type:{task_type} | fixed_time:{fixed_time} | [{status}]")
         # select a task
@@ -87,14 +90,13 @@ def main():
                 task_id = int(task_id_str)
                 
                 # get current task details
-                tasks = repo.list_tasks()
-                task = next((t for t in tasks if t[0] == task_id), None)
+                task = repo.get_task(task_id)
 
                 if not task:
                     print("Task not found.")
                     continue
 
-                task_id, name, duration, selected, task_type, fixed_time = task
+                task_id, name, duration, selected, task_type, fixed_time, *_ = task
 
                 print(f"\nCurrent: {name} - Type: {task_type or 'flexible'}")
                 if fixed_time:
@@ -129,20 +131,27 @@ def main():
         
         # export task info
         elif cmd == "6":
-            rows = repo.list_tasks()
-            with open("tasks_output.txt", "w", encoding="utf-8") as f:
-                if not rows:
-                    f.write("(no tasks yet)\n")
-                else:
-                    for t in rows:
-                        line = f"{t[0]}. {t[1]} - {t[2]} min - selected={bool(t[3])}\n"
-                        f.write(line)
+            from src.export import export, FORMATS
+            what = input("Export (1) tasks or (2) saved schedules? [1]: ").strip() or "1"
+            kind = "schedules" if what == "2" else "tasks"
+            fmt = input("Format (txt/csv/jsonl/ics) [txt]: ").strip().lower() or "txt"
+            if fmt not in FORMATS:
+                print("Unknown format.")
+            else:
+                path = f"{kind}_output.{fmt}"
+                try:
+                    count = export(kind, fmt, path, user_id=user_id)
+                    print(f"Exported {count} rows to {path}.")
+                except Exception as e:
+                    print("Error:", e)
         # manual scheduler
         elif cmd == "7":
-            run_manual_scheduler(user_id)
+            from src.manual_scheduler import run_manual_scheduler
+            run_manual_scheduler(user_id, repo, break_policy)
         # automatic scheduler
         elif cmd == "8":
-            scheduler = AutomaticScheduler(user_id)
+            from src.automatic_scheduler import AutomaticScheduler
+            scheduler = AutomaticScheduler(user_id, repo, schedule_cache, break_policy)
 
             print("\nAutomatic Schedule Builder")
             print("-------------------------")
@@ -164,17 +173,31 @@ def main():
         # break settings
         elif cmd == '9':
             if  input("Enable automatic breaks (Y/N):  ").strip().lower() == 'y':
-                #duration_str = input("Duration (min, integer > 0): ").strip()
+                tasks = repo.list_tasks()
+                default = default_break_policy(tasks)
+                hint = f" [{default.break_task_id}]" if default else ""
                 try:
-                    #duration = int(duration_str)
-                    break_id = 1
-                    new_val = repo.toggle_select(break_id)
-                except Exception as e:
+                    tid_str = input(f"Break task ID{hint}: ").strip()
+                    if tid_str:
+                        task = next((t for t in tasks if t[0] == int(tid_str)), None)
+                    else:
+                        task = next((t for t in tasks if default and t[0] == default.break_task_id), None)
+                    if task is None:
+                        print("No such task. Add a task named 'Break' first.")
+                        continue
+                    work_str = input("Maximum minutes of work before a break [90]: ").strip()
+                    length_str = input(f"Break length in minutes [{task[2]}]: ").strip()
+                    candidate = BreakPolicy.for_task(task, int(work_str or 90), int(length_str or task[2]))
+                    if candidate.max_work_minutes <= 0 or candidate.break_minutes <= 0:
+                        raise ValueError("Minutes must be positive.")
+                    break_policy = candidate
+                    print(f"Automatic breaks on: '{task[1]}' ({break_policy.break_minutes} minutes) "
+                          f"after {break_policy.max_work_minutes} minutes of work.")
+                except ValueError as e:
                     print("Error:", e)
             else:
-                print('Invalid choice')
-
-
+                break_policy = None
+                print("Automatic breaks off.")
 
         # exit
         elif cmd == "10":
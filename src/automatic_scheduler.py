@@ -3,135 +3,472 @@
 # Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
 # Created: 2025-11-09
 
-from datetime import datetime, time, timedelta
-from src.db import get_connection
+import time as clock
+from datetime import date, time
 from src.task_repo import TaskRepo
-from src.time_periods import determine_period, times_for_slot, next_slot, is_time_in_slot
+from src.time_periods import (PERIOD_BY_MINUTE, MINUTES_PER_DAY, time_to_minutes,
+                              minutes_to_time, parse_12h, parse_hhmm, recurs_on)
+from src.placement import PlacementIndex
+from src.schedule_cache import schedule_fingerprint
+from src.schedule_repo import ScheduleRepo
+from src.instrument import phase
+from src.breaks import insert_breaks
+from src.interval_schedule import Interval
+from src.slot_grid import SlotGrid
+from src.strategies import OBJECTIVES, PORTFOLIO, STRATEGIES, StrategyOptions
+from src.user_repo import DEFAULT_SLOT_MINUTES, UserRepo, validate_slot_minutes
+
+PERIODS = ["morning", "afternoon", "evening", "night"]
+
+class SchedulePlan:
+    """Placement state of one build: task order, where each task went, and the free-slot index"""
+
+    def __init__(self, settings, starts):
+        self.settings = settings            # (start minute, end minute, slot minutes, exact)
+        self.starts = starts                # start minute of every slot (a range)
+        # exact placement: one-minute cells, but flexible tasks still start on the slot grid
+        self.slot_minutes = 1 if settings[3] else settings[2]
+        self.align = settings[2] if settings[3] else 1
+        self.index = PlacementIndex(PERIOD_BY_MINUTE[starts.start:starts.stop:starts.step])
+        self.order = []                     # tasks in placement order
+        self.placements = []                # first slot index per task, or None
+
+    @staticmethod
+    def order_key(task):
+        # fixed before flexible, longer first, then creation order (task ids are AUTOINCREMENT)
+        return (task[4] != 'fixed', -task[2], task[0])
+
+    def slots_needed(self, task):
+        return -(-task[2] // self.slot_minutes)  # Ceiling division
+
+    def slot_at(self, minute):
+        """Index of the slot starting at minute, or None"""
+        if minute in self.starts:
+            return (minute - self.starts.start) // self.starts.step
+        return None
+
+    def place(self, task):
+        """Place one task on the index; returns its first slot index or None"""
+        slots_needed = self.slots_needed(task)
+        if task[4] == 'fixed':
+            # Only the slot that starts at the fixed time will do
+            i = None
+            if task[5]:
+                try:
+                    i = self.slot_at(parse_hhmm(task[5]))
+                except ValueError:
+                    i = None
+            if (i is None or i + slots_needed > len(self.starts)
+                    or not self.index.can_place(i, slots_needed)):
+                return None
+        else:
+            # First run of free slots, trying each period in turn
+            for period in PERIODS:
+                i = self.index.first_fit(period, slots_needed, self.align)
+                if i is not None:
+                    break
+            else:
+                return None
+        self.index.occupy(i, slots_needed)
+        return i
+
+    def unscheduled(self):
+        return [task for task, start_idx in zip(self.order, self.placements) if start_idx is None]
+
+    def free_runs(self, count):
+        """(first slot, slots) of every free run left by the first count tasks, each inside one period
+
+        Slots outside every period (the gaps between them) are never free: greedy
+        placement cannot use them, so no other strategy may either.
+        """
+        taken = sorted((i, i + self.slots_needed(task))
+                       for task, i in zip(self.order[:count], self.placements[:count]) if i is not None)
+        runs = []
+        for start, period, tree in self.index.segments:
+            if period is None:
+                continue
+            cursor, end = start, start + tree.size
+            for first, last in taken:
+                if last <= cursor or first >= end:
+                    continue
+                if first > cursor:
+                    runs.append((cursor, first - cursor))
+                cursor = max(cursor, last)
+            if cursor < end:
+                runs.append((cursor, end - cursor))
+        return runs
 
 class AutomaticScheduler:
-    def __init__(self, user_id: int):
+    def __init__(self, user_id: int, repo: TaskRepo = None, schedule_cache=None, break_policy=None,
+                 slot_minutes: int = None, exact: bool = None):
         self.user_id = user_id
-        self.repo = TaskRepo(user_id=user_id)
+        self.repo = repo or TaskRepo(user_id=user_id)
+        self.schedule_cache = schedule_cache
+        self.break_policy = break_policy    # src.breaks.BreakPolicy, or None for no automatic breaks
+        self.unscheduled_tasks = []
+        self.last_plan = None
+        self.last_grid = None               # SlotGrid of the last build
         self.default_start = time(8, 0)
         self.default_end = time(22, 0)
         self.schedule_start = self.default_start
         self.schedule_end = self.default_end
-        self.time_slot_duration = 30
+        self.time_slot_duration = DEFAULT_SLOT_MINUTES
+        self.exact = False                  # True: place to the minute (see SchedulePlan)
+        if slot_minutes is None or exact is None:
+            settings = UserRepo(user_id).get_slot_settings()
+            slot_minutes = settings.slot_minutes if slot_minutes is None else slot_minutes
+            exact = settings.exact if exact is None else exact
+        self.set_resolution(slot_minutes, exact)
+        self.schedule_date = None           # day being planned (None: today); picks recurring fixed tasks
+        self.last_horizon = None            # src.horizon.HorizonPlan of the last build_horizon
+        self.quiet = False                  # True: no warnings on stdout (services, batch jobs)
+        self.strategy = "greedy"            # a name in src.strategies.STRATEGIES (see set_strategy)
+        self.time_budget = 0.25             # seconds the optimal search or the portfolio may take
+        self.objective = "minutes"
+        self.weights = None                 # {task id: value} overriding the objective
+        self.candidates = PORTFOLIO         # strategies the portfolio races
+        self.workers = None                 # portfolio processes (None: one per candidate, up to the CPUs)
+        self.last_search = None             # report of the last build's strategy (PackResult, PortfolioReport)
+
+    def _say(self, message):
+        """Print a warning for the interactive user unless quiet"""
+        if not self.quiet:
+            print(message)
 
     def set_time_boundaries(self, start_time, end_time):
         """Set custom schedule boundaries"""
         try:
-            new_start = datetime.strptime(start_time, '%I:%M %p').time()
-            new_end = datetime.strptime(end_time, '%I:%M %p').time()
+            new_start = parse_12h(start_time)
+            new_end = parse_12h(end_time)
         except ValueError:
-            print("Invalid time format. Use HH:MM AM/PM format.")
+            self._say("Invalid time format. Use HH:MM AM/PM format.")
             return False
 
-        # Validate schedule duration
-        start_dt = datetime.combine(datetime.today(), new_start)
-        end_dt = datetime.combine(datetime.today(), new_end)
-        if end_dt < start_dt:
-            end_dt += timedelta(days=1)
-        
-        duration = (end_dt - start_dt).total_seconds() / 3600
-        if duration < 1:
-            print("Schedule duration must be at least 1 hour.")
+        # Validate schedule duration (in minutes, wrapping past midnight)
+        duration = new_end - new_start
+        if duration < 0:
+            duration += MINUTES_PER_DAY
+
+        if duration < 60:
+            self._say("Schedule duration must be at least 1 hour.")
             return False
-        if duration > 24:
-            print("Schedule duration cannot exceed 24 hours.")
+        if duration > MINUTES_PER_DAY:
+            self._say("Schedule duration cannot exceed 24 hours.")
             return False
 
-        self.schedule_start = new_start
-        self.schedule_end = new_end
+        self.schedule_start = minutes_to_time(new_start)
+        self.schedule_end = minutes_to_time(new_end)
         return True
 
+    def set_resolution(self, slot_minutes: int, exact: bool = False):
+        """Set the slot length (1-60 minutes) and exact-minute placement for this scheduler's builds
+
+        Exact placement uses one-minute cells: every task takes exactly its
+        duration and a fixed task at an off-grid time (8:10 AM on 30-minute
+        slots) is placed there; flexible tasks still start on the slot grid.
+        """
+        self.time_slot_duration = validate_slot_minutes(slot_minutes)
+        self.exact = bool(exact)
+
+    def set_strategy(self, strategy: str, time_budget: float = None, objective: str = None, weights: dict = None,
+                     candidates=None, workers: int = None):
+        """Choose how flexible tasks are placed: "greedy" (the default) or another src.strategies name
+
+        Optimal packs the gaps left by the fixed tasks by branch and bound,
+        maximising scheduled minutes (objective "minutes"), the number of tasks
+        placed ("tasks"), or the given {task id: value} weights. It stops after
+        time_budget seconds with the best placement found, never worse than
+        greedy; self.last_search reports its gap to the bound.
+
+        Portfolio runs the candidates strategies in up to workers processes,
+        all stopping by time_budget, and keeps the best-scoring schedule;
+        self.last_search has each candidate's score and time.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'. Use one of: {', '.join(STRATEGIES)}.")
+        if candidates is not None:
+            candidates = tuple(candidates)
+            unknown = [name for name in candidates if name not in STRATEGIES or name == "portfolio"]
+            if unknown or not candidates:
+                raise ValueError(f"Portfolio candidates must be one or more of: "
+                                 f"{', '.join(name for name in STRATEGIES if name != 'portfolio')}.")
+        if workers is not None and workers < 1:
+            raise ValueError("Workers must be at least 1.")
+        if objective is not None and objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective '{objective}'. Use one of: {', '.join(OBJECTIVES)}.")
+        if time_budget is not None and not 0 < time_budget <= 60:
+            raise ValueError("Time budget must be more than 0 and at most 60 seconds.")
+        self.strategy = strategy
+        self.time_budget = self.time_budget if time_budget is None else time_budget
+        self.objective = objective or self.objective
+        self.weights = weights
+        self.candidates = candidates or self.candidates
+        self.workers = self.workers if workers is None else workers
+
+    def slot_start_minutes(self):
+        """Start minute (after midnight) of every whole slot between start and end time"""
+        step = self.time_slot_duration
+        start = time_to_minutes(self.schedule_start)
+        end = time_to_minutes(self.schedule_end)
+        return range(start, end - step + 1, step)
+
     def generate_time_slots(self):
         """Generate available time slots between start and end time"""
-        slots = []
-        curr_time = datetime.combine(datetime.today(), self.schedule_start)
-        end_datetime = datetime.combine(datetime.today(), self.schedule_end)
-
-        while curr_time < end_datetime:
-            slot_end = curr_time + timedelta(minutes=self.time_slot_duration)
-            if slot_end > end_datetime:
-                break
-            slots.append({
-                'start': curr_time.time(),
-                'end': slot_end.time(),
-                'period': determine_period(curr_time.time().strftime('%H:%M')),
-                'task_id': None,
-                'task_name': None
-            })
-            curr_time = slot_end
-        return slots
+        step = self.time_slot_duration
+        starts = self.slot_start_minutes()
+        if not starts:
+            return []
+        return SlotGrid(starts[0], starts[-1] + step, step).slots(step)
 
     def build_schedule(self):
         """Automatically build a schedule by intelligently placing tasks in time slots"""
-        # Get selected tasks
-        tasks = [t for t in self.repo.list_tasks() if t[3]]
+        grid = self.build_grid()
+        if grid is None:
+            return None
+        with phase("build.view"):
+            return self.grid_slots(grid)
+
+    def grid_slots(self, grid):
+        """Slot-dict view of a built grid: assigned slots only (whole blocks once breaks are on)"""
+        # never cut finer than the default slots: one dict per minute helps no one
+        step = max(self.time_slot_duration, DEFAULT_SLOT_MINUTES)
+        return grid.slots(None if self.break_policy else step, free=False)
+
+    def build_grid(self):
+        """Build the schedule as a compact SlotGrid (None when there is nothing to place)"""
+        # Get selected tasks (one query; type and fixed time come with each record)
+        with phase("build.load"):
+            tasks = self._occurring(self.repo.get_selected_tasks())
         if not tasks:
-            print("No tasks selected. Please select tasks first!")
+            self._say("No tasks selected. Please select tasks first!")
             return None
 
-        time_slots = self.generate_time_slots()
-        if not time_slots:
-            print("No available time slots in the schedule!")
+        if not self.slot_start_minutes():
+            self._say("No available time slots in the schedule!")
             return None
 
-        # Sort tasks by duration (longer tasks first)
-        tasks.sort(key=lambda x: x[2], reverse=True)
-
-        scheduled_slots = []
-        unscheduled_tasks = []
-
-        # Place fixed tasks first.
-        for task in (t for t in tasks if self.repo.get_task_type(t[0]) == 'fixed'):
-            task_id, name, duration, *_ = task
-            slots_needed = -(-duration // self.time_slot_duration)  # Ceiling division
-            placed = False
-            fixed_time = self.repo.get_fixed_time(task_id)
-            if fixed_time:
-                # Find slots that match the fixed time
-                for i in range(len(time_slots) - slots_needed + 1):
-                    if time_slots[i]['start'].strftime('%H:%M') == fixed_time:
-                        if self.can_place_task(time_slots, i, slots_needed):
-                            self.place_task(time_slots, i, slots_needed, task)
-                            placed = True
-                            break
-            # If can't be placed add to list.
-            if not placed:
-                unscheduled_tasks.append(task)
-
-        # Place flexible tasks second.
-        periods = ["morning", "afternoon", "evening", "night"]
-        for task in (t for t in tasks if self.repo.get_task_type(t[0]) != 'fixed'):
-            task_id, name, duration, *_ = task
-            slots_needed = -(-duration // self.time_slot_duration)  # Ceiling division
-            placed = False
-            for period in periods:
-                if placed:
-                    break
-                # Find consecutive free slots in the current period.
-                for i in range(len(time_slots) - slots_needed + 1):
-                    if (time_slots[i]['period'] == period and
-                        self.can_place_task(time_slots, i, slots_needed)):
-                        self.place_task(time_slots, i, slots_needed, task)
-                        placed = True
-                        break
-            # If can't be placed add to list.
-            if not placed:
-                unscheduled_tasks.append(task)
-
-        # Create final schedule with only assigned slots
-        final_schedule = [slot for slot in time_slots if slot['task_id'] is not None]
-        
+        key = cached = None
+        self.last_search = None
+        if self.schedule_cache is not None:
+            with phase("build.cache_lookup"):
+                key = self.fingerprint(tasks)
+                cached = self.schedule_cache.get(self.user_id, key)
+
+        if cached is not None:
+            grid, unscheduled_tasks = self._from_cached(cached, tasks)
+            self.last_plan = None   # no plan for this result: the next reschedule builds in full
+        else:
+            plan = self.last_plan = self.plan_tasks(tasks)
+            with phase("build.assemble"):
+                grid, unscheduled_tasks = self._grid_from_plan(plan)
+            with phase("build.breaks"):
+                grid, unscheduled_tasks = self._with_breaks(grid, unscheduled_tasks, tasks)
+            if key is not None:
+                with phase("build.cache_store"):
+                    self.schedule_cache.put(self.user_id, key, self._to_cached(grid, unscheduled_tasks))
+        return self._report(grid, unscheduled_tasks)
+
+    def _occurring(self, tasks):
+        """Tasks that happen on the schedule date (a fixed task may recur on some weekdays only)"""
+        weekday = (self.schedule_date or date.today()).weekday()
+        return [task for task in tasks
+                if task[4] != 'fixed' or recurs_on(getattr(task, 'recurrence', None), weekday)]
+
+    def make_horizon(self, days:int = 7, first_day:date = None, per_weekday:dict = None):
+        """DayWindows for days from first_day (default: the schedule date), inside the current boundaries
+
+        per_weekday gives some weekdays (Monday = 0) their own (start, end) minutes, or None for a day off.
+        """
+        from src.horizon import make_horizon
+        start, end = self._grid_bounds()
+        return make_horizon(first_day or self.schedule_date or date.today(), days, start, end, per_weekday)
+
+    def build_horizon(self, horizon):
+        """Plan every day of a horizon at once (see src.horizon); returns one SlotGrid per DayWindow
+
+        Recurring fixed tasks go on each day they recur on; every flexible task
+        is placed once, on the earliest day with room. self.last_horizon.unscheduled
+        says which day each missing fixed task was left off.
+        """
+        from src.horizon import plan_horizon
+        with phase("horizon.load"):
+            tasks = self.repo.get_selected_tasks()
+        with phase("horizon.place"):
+            if self.exact:
+                plan = plan_horizon(tasks, horizon, 1, self.time_slot_duration)
+            else:
+                plan = plan_horizon(tasks, horizon, self.time_slot_duration)
+            self.last_horizon = plan
+            grids = plan.grids()
+        unscheduled_tasks = plan.unscheduled_tasks()
+        if self.break_policy is not None:
+            with phase("horizon.breaks"):
+                for i, grid in enumerate(grids):
+                    grids[i], unscheduled_tasks = self._with_breaks(grid, unscheduled_tasks, tasks)
+        self.unscheduled_tasks = unscheduled_tasks
+
+        # (day, task) per missing occurrence; work the breaks pushed out has no single day
+        missed = plan.unscheduled + [(None, task) for task in unscheduled_tasks[len(plan.unscheduled_tasks()):]]
+        if missed and not self.quiet:
+            self._say("\nWarning: The following tasks could not be scheduled:")
+            for day, task in missed:
+                when = f" on {plan.horizon[day].day:%a %Y-%m-%d}" if day is not None else ""
+                self._say(f"- {task[1]} ({task[2]} minutes){when}")
+        return grids
+
+    def _report(self, grid, unscheduled_tasks):
+        """Remember the grid and print the unscheduled tasks; returns the grid"""
+        self.last_grid = grid
+        self.unscheduled_tasks = unscheduled_tasks
+
         # Report unscheduled tasks
         if unscheduled_tasks:
-            print("\nWarning: The following tasks could not be scheduled:")
+            self._say("\nWarning: The following tasks could not be scheduled:")
             for task in unscheduled_tasks:
-                print(f"- {task[1]} ({task[2]} minutes)")
+                self._say(f"- {task[1]} ({task[2]} minutes)")
+
+        return grid
+
+    def fingerprint(self, tasks):
+        """Cache key for building this schedule from the given selected tasks"""
+        extra = list(self.break_policy) if self.break_policy else None
+        start, end, slot_minutes, exact = self._settings()
+        if exact:
+            extra = [extra, 'exact']
+        if self.strategy != "greedy":
+            weights = sorted(self.weights.items()) if self.weights else None
+            extra = [extra, self.strategy, self.time_budget, self.objective, weights]
+            if self.strategy == "portfolio":
+                extra.append(list(self.candidates))
+        return schedule_fingerprint(tasks, start, end, slot_minutes, extra=extra)
+
+    def _settings(self):
+        """Everything besides the tasks that placement depends on"""
+        return (time_to_minutes(self.schedule_start), time_to_minutes(self.schedule_end),
+                self.time_slot_duration, self.exact)
+
+    def _to_cached(self, grid, unscheduled_tasks):
+        """Compact JSON-able form of a result: [start minute, task id, end minute] per block"""
+        return {
+            'slots': [[start, task_id, end] for task_id, start, end in grid.blocks()],
+            'unscheduled': [task[0] for task in unscheduled_tasks],
+        }
+
+    def _from_cached(self, cached, tasks):
+        """Rebuild a grid (and unscheduled records) from a cached result"""
+        by_id = {task[0]: task for task in tasks}
+        names = {task[0]: task[1] for task in tasks}
+        if self.break_policy:
+            names.setdefault(self.break_policy.break_task_id, self.break_policy.break_task_name)
+        step = self.time_slot_duration
+        # entries without an end minute were written before breaks: one whole slot
+        blocks = [(task_id, minute, end[0] if end else minute + step)
+                  for minute, task_id, *end in cached['slots']]
+        grid = SlotGrid.from_blocks(blocks, *self._grid_bounds(), names)
+        return grid, [by_id[task_id] for task_id in cached['unscheduled']]
 
-        return final_schedule
+    def _grid_bounds(self):
+        """(start, end) minute of the grid a build fills: the whole schedule"""
+        return time_to_minutes(self.schedule_start), time_to_minutes(self.schedule_end)
+
+    def _with_breaks(self, grid, unscheduled_tasks, tasks):
+        """Apply the break policy in one pass over the built grid (fixed tasks stay put)"""
+        if self.break_policy is None or not any(grid.cells):
+            return grid, unscheduled_tasks
+        policy = self.break_policy
+        by_id = {task[0]: task for task in tasks}
+        fixed_ids = [task[0] for task in tasks if task[4] == 'fixed']
+        intervals = [Interval(start, end, task_id, grid.names[task_id]) for task_id, start, end in grid.blocks()]
+        intervals, dropped = insert_breaks(intervals, policy, grid.end, pinned=fixed_ids)
+        grid.names.setdefault(policy.break_task_id, policy.break_task_name)
+        grid = SlotGrid.from_blocks([(i.task_id, i.start, i.end) for i in intervals], grid.start, grid.end, grid.names)
+        return grid, unscheduled_tasks + [by_id[d.task_id] for d in dropped]
+
+    def place_tasks(self, tasks):
+        """Place tasks on a fresh slot grid; returns (all time slots, unscheduled tasks)"""
+        plan = self.plan_tasks(tasks)
+        time_slots = self.generate_time_slots()
+        for task, start_idx in zip(plan.order, plan.placements):
+            if start_idx is not None:
+                self.place_task(time_slots, start_idx, plan.slots_needed(task), task)
+        return time_slots, plan.unscheduled()
+
+    def plan_tasks(self, tasks):
+        """Run placement from scratch and return the SchedulePlan"""
+        with phase("build.slots"):
+            if self.exact:
+                starts = range(*self._grid_bounds())    # every minute of the schedule
+            else:
+                starts = self.slot_start_minutes()
+            plan = SchedulePlan(self._settings(), starts)
+        # Longer tasks first (ties keep creation order); fixed tasks before flexible ones.
+        plan.order = sorted(tasks, key=plan.order_key)
+        n_fixed = sum(1 for task in plan.order if task[4] == 'fixed')
+        with phase("build.place_fixed"):
+            plan.placements = [plan.place(task) for task in plan.order[:n_fixed]]
+        with phase("build.place_flexible"):
+            self.last_search = STRATEGIES[self.strategy](plan, n_fixed, self._strategy_options())
+        return plan
+
+    def _strategy_options(self):
+        """StrategyOptions for a build starting now: the time budget runs from here"""
+        return StrategyOptions(clock.time() + self.time_budget, self.objective, self.weights,
+                               self.user_id, self.candidates, self.workers)
+
+    def reschedule(self, plan=None, added=(), removed=(), changed=()):
+        """Repair a previous plan after a task delta instead of rebuilding the day.
+
+        added/changed are TaskRecords (a changed record that is no longer
+        selected counts as removed); removed are task ids. Placement order is
+        the same as build_schedule, so everything placed before the first
+        affected task is kept and only the rest is re-placed. Falls back to a
+        full rebuild when there is no usable plan or the change reaches the
+        first task. The plan (default: the last one built) is updated in place.
+        """
+        plan = plan or self.last_plan
+        if plan is None or plan.settings != self._settings() or self.strategy != "greedy":
+            return self.build_schedule()
+
+        gone = set(removed) | {task[0] for task in changed} | {task[0] for task in added}
+        fresh = [task for task in self._occurring(list(changed) + list(added)) if task[3]]
+        order = sorted([t for t in plan.order if t[0] not in gone] + fresh, key=plan.order_key)
+        if not order:
+            return self.build_schedule()
+
+        # first position whose task differs from the previous run
+        first = 0
+        limit = min(len(order), len(plan.order))
+        while first < limit and order[first] == plan.order[first]:
+            first += 1
+
+        if first == 0:
+            # nothing can be kept: full rebuild (still no DB round trip)
+            plan = self.plan_tasks(order)
+        else:
+            for task, start_idx in zip(plan.order[first:], plan.placements[first:]):
+                if start_idx is not None:
+                    plan.index.release(start_idx, plan.slots_needed(task))
+            plan.placements = plan.placements[:first] + [plan.place(task) for task in order[first:]]
+            plan.order = order
+        self.last_plan = plan
+
+        grid, unscheduled_tasks = self._with_breaks(*self._grid_from_plan(plan), plan.order)
+        if self.schedule_cache is not None:
+            self.schedule_cache.put(self.user_id, self.fingerprint(plan.order),
+                                    self._to_cached(grid, unscheduled_tasks))
+        return self.grid_slots(self._report(grid, unscheduled_tasks))
+
+    def _grid_from_plan(self, plan):
+        """(SlotGrid of the placed tasks, unscheduled tasks) for a plan"""
+        # coarsest cells that fit the blocks: one-minute slots need not mean one-minute cells
+        blocks = []
+        names = {}
+        for task, start_idx in zip(plan.order, plan.placements):
+            if start_idx is not None:
+                minute = plan.starts[start_idx]
+                blocks.append((task[0], minute, minute + plan.slots_needed(task) * plan.slot_minutes))
+                names[task[0]] = task[1]
+        return SlotGrid.from_blocks(blocks, *self._grid_bounds(), names), plan.unscheduled()
 
     def can_place_task(self, time_slots, start_idx, slots_needed):
         """Check if a task can be placed in consecutive slots"""
@@ -155,6 +492,10 @@ class AutomaticScheduler:
             time_slots[i]['task_id'] = task_id
             time_slots[i]['task_name'] = name
 
+    def save_schedule(self, schedule, schedule_name: str = "Automatic Schedule"):
+        """Save a built schedule to the database; returns the new schedule id"""
+        return ScheduleRepo(self.user_id).save_schedule(schedule, schedule_name, 'automatic')
+
     def display_schedule(self, schedule):
         """Display the generated schedule in a readable format"""
         if not schedule:
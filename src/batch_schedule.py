@@ -0,0 +1,140 @@
+# File: src/batch_schedule.py
+# Description: Non-interactive batch run of the automatic scheduler for every user.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Database migrated; users have selected tasks.
+# Postconditions: One new 'automatic' schedule saved per user that has selected tasks.
+#
+# Usage: python -m src.batch_schedule [--workers N] [--chunk-size N] [--start "8:00 AM" --end "10:00 PM"]
+
+import argparse
+import os
+import sys
+import time as clock
+from multiprocessing import Pool
+
+from src import db
+from src.db import get_connection, run_migrations
+from src.automatic_scheduler import AutomaticScheduler
+from src.schedule_repo import insert_schedule
+from src.time_periods import MINUTES_PER_DAY, parse_12h
+
+DEFAULT_CHUNK_SIZE = 50
+
+
+def _init_worker(db_path):
+    """Point a pool worker at the same database as the parent."""
+    db.DB_PATH = db_path
+
+
+def build_user_schedule(user_id, start_time=None, end_time=None):
+    """Build one user's schedule; returns [(task_id, start_minute, end_minute), ...] or None."""
+    scheduler = AutomaticScheduler(user_id)
+    scheduler.quiet = True      # warnings on stdout are just noise in a batch run
+    if start_time and end_time and not scheduler.set_time_boundaries(start_time, end_time):
+        raise ValueError(f"Invalid schedule window {start_time} - {end_time}.")
+    grid = scheduler.build_grid()   # blocks straight off the grid: no slot dicts
+    blocks = grid.blocks() if grid is not None else []
+    return blocks or None
+
+
+def _valid_window(start_time, end_time):
+    """Whether start/end are HH:MM AM/PM times 1 to 24 hours apart (the scheduler's own rule)"""
+    try:
+        duration = (parse_12h(end_time) - parse_12h(start_time)) % MINUTES_PER_DAY
+    except ValueError:
+        return False
+    return duration >= 60
+
+
+def _build_chunk(job):
+    """Pool task: build schedules for a chunk of users."""
+    user_ids, start_time, end_time = job
+    return [(user_id, build_user_schedule(user_id, start_time, end_time)) for user_id in user_ids]
+
+
+def save_batch(results, schedule_name, schedule_type="automatic"):
+    """Write many users' schedules in a single transaction. Returns schedules written."""
+    written = 0
+    with get_connection() as conn:
+        for user_id, blocks in results:
+            if blocks:
+                insert_schedule(conn, user_id, schedule_name, schedule_type, blocks)
+                written += 1
+    return written
+
+
+def _chunks(values, size):
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def run_batch(workers=None, chunk_size=DEFAULT_CHUNK_SIZE, start_time=None, end_time=None,
+              schedule_name="Automatic Schedule", progress=None):
+    """Build and save a schedule for every user. Returns (users, schedules_saved)."""
+    with get_connection() as conn:
+        user_ids = [row[0] for row in conn.execute("SELECT id FROM users ORDER BY id")]
+    jobs = [(chunk, start_time, end_time) for chunk in _chunks(user_ids, max(1, chunk_size))]
+    workers = workers or os.cpu_count() or 1
+
+    done = saved = 0
+    if workers == 1 or len(jobs) <= 1:
+        results = map(_build_chunk, jobs)
+        pool = None
+    else:
+        pool = Pool(processes=workers, initializer=_init_worker, initargs=(str(db.DB_PATH),))
+        results = pool.imap_unordered(_build_chunk, jobs)
+    try:
+        for chunk_result in results:
+            saved += save_batch(chunk_result, schedule_name)
+            done += len(chunk_result)
+            if progress:
+                progress(done, len(user_ids), saved)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return len(user_ids), saved
+
+
+def _print_progress(done, total, saved):
+    print(f"\rScheduled {done}/{total} users ({saved} schedules saved)", end="", file=sys.stderr, flush=True)
+    if done == total:
+        print(file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build automatic schedules for every user.")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="users per worker task")
+    parser.add_argument("--start", help="schedule start, HH:MM AM/PM (default 8:00 AM)")
+    parser.add_argument("--end", help="schedule end, HH:MM AM/PM (default 10:00 PM)")
+    parser.add_argument("--name", default="Automatic Schedule", help="name for the saved schedules")
+    parser.add_argument("--db", help="database file (default scheduler.db)")
+    parser.add_argument("--quiet", action="store_true", help="no progress output")
+    args = parser.parse_args(argv)
+
+    if bool(args.start) != bool(args.end):
+        parser.error("--start and --end must be given together")
+    if args.start and not _valid_window(args.start, args.end):
+        parser.error("invalid --start/--end (HH:MM AM/PM, at least 1 hour apart)")
+    if args.db:
+        db.DB_PATH = args.db
+    run_migrations()
+
+    began = clock.perf_counter()
+    users, saved = run_batch(
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        start_time=args.start,
+        end_time=args.end,
+        schedule_name=args.name,
+        progress=None if args.quiet else _print_progress,
+    )
+    if not args.quiet:
+        print(f"Saved {saved} schedules for {users} users in {clock.perf_counter() - began:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+# File: src/breaks.py
+# Description: Inserts breaks into a built schedule in one pass (shared by both schedulers).
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Schedule given as Intervals; times in minutes after midnight.
+# Postconditions: No run of back-to-back work is longer than the policy allows where a break fits.
+#
+# Work is "continuous" while the gap between two tasks is shorter than a
+# break. When the next task would take a run past max_work_minutes, a break
+# goes in right after the previous task and later tasks slide right only as
+# far as they must (gaps absorb the shift). Pinned tasks (fixed-time tasks)
+# never move; work pushed into one, or past the end of the day, is dropped
+# and reported instead.
+
+from typing import Iterable, List, NamedTuple, Tuple
+
+from src.interval_schedule import Interval
+
+
+class BreakPolicy(NamedTuple):
+    """Which task is the break, how long work may run without one, and how long it lasts."""
+    break_task_id: int
+    break_task_name: str = "Break"
+    max_work_minutes: int = 90
+    break_minutes: int = 15
+
+    @classmethod
+    def for_task(cls, task, max_work_minutes:int = 90, break_minutes:int = None):
+        """Policy using a task record (id, name, duration, ...) as the break; its duration by default."""
+        task_id, name, duration, *_ = task
+        return cls(task_id, name, max_work_minutes, break_minutes or duration)
+
+
+def default_break_policy(tasks, max_work_minutes:int = 90):
+    """Policy using the user's task named 'Break' (None if there is none)."""
+    task = next((t for t in tasks if t[1].strip().lower() == 'break'), None)
+    return BreakPolicy.for_task(task, max_work_minutes) if task else None
+
+
+def insert_breaks(intervals:Iterable[Interval], policy:BreakPolicy, day_end:int,
+                  pinned:Iterable[int] = ()) -> Tuple[List[Interval], List[Interval]]:
+    """One pass over the schedule; returns (new intervals in time order, dropped intervals).
+
+    pinned are task ids that must keep their start time.
+    """
+    if policy.max_work_minutes <= 0 or policy.break_minutes <= 0:
+        raise ValueError("Break policy minutes must be positive.")
+    pinned = set(pinned)
+    out = []
+    origins = []         # the input interval behind each entry of out (None for inserted breaks)
+    dropped = []
+    cursor = None        # end of the last thing placed
+    run_start = None     # start of the current stretch of continuous work (None after a break)
+
+    for interval in sorted(intervals):
+        length = interval.end - interval.start
+        fixed = interval.task_id in pinned
+        is_break = interval.task_id == policy.break_task_id
+        start = interval.start if fixed or cursor is None else max(interval.start, cursor)
+
+        rest = None
+        if is_break or run_start is None or start - cursor >= policy.break_minutes:
+            run_start = start              # a rest (or the first task) starts a new run
+        elif start + length - run_start > policy.max_work_minutes and run_start < start:
+            rest = Interval(cursor, cursor + policy.break_minutes, policy.break_task_id, policy.break_task_name)
+            # a break may not push a pinned task; then the run just continues
+            if fixed and rest.end > start:
+                rest = None
+            else:
+                start = max(start, rest.end)
+
+        if not fixed and start + length > day_end:
+            dropped.append(interval)
+            continue
+        if rest is not None:
+            out.append(rest)
+            origins.append(None)
+            cursor = rest.end
+            run_start = start
+        if fixed and cursor is not None and cursor > start:
+            # earlier work was pushed into this pinned task: take it back out, along with
+            # any break left with nothing after it (inserted breaks are never pinned,
+            # even when the break task itself is a fixed task)
+            while out and (origins[-1] is None or out[-1].end > start and out[-1].task_id not in pinned):
+                out.pop()
+                origin = origins.pop()
+                if origin is not None:
+                    dropped.append(origin)
+            cursor = out[-1].end if out else None
+            run_start = start
+
+        out.append(interval._replace(start=start, end=start + length))
+        origins.append(interval)
+        cursor = start + length if cursor is None else max(cursor, start + length)
+        if is_break:
+            run_start = None
+    return out, dropped
+
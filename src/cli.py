@@ -0,0 +1,317 @@
+# File: src/cli.py
+# Description: Non-interactive command line for scripts and cron jobs; prints JSON.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: None; the database is migrated on first use.
+# Postconditions: One command run; its result printed to stdout as JSON.
+#
+# Usage: python -m src.cli [--db PATH] [--user ID] [--timings] COMMAND ...
+#   tasks add NAME MINUTES [--fixed "HH:MM AM/PM"] [--recur DAYS] [--select]
+#   tasks list [--selected]
+#   tasks rm ID [ID ...]
+#   tasks select ID [ID ...] [--off]
+#   tasks conflicts
+#   tasks recur ID [DAYS]                 (weekdays | weekends | mon,wed,fri; none: daily)
+#   schedule auto [--start "8:00 AM" --end "10:00 PM"] [--days N] [--from YYYY-MM-DD]
+#                 [--slot-minutes N] [--exact | --no-exact] [--save NAME]
+#                 [--strategy NAME] [--budget-ms N] [--objective minutes|tasks]
+#                 [--candidates NAME,NAME,...] [--workers N]      (--strategy portfolio)
+#   schedule list [--limit N]
+#   schedule show [ID]                    (default: the latest schedule)
+#   schedule export [--format csv|jsonl|ics|txt] [-o PATH]
+#   settings [--slot-minutes N] [--exact | --no-exact]   (show, or change, the user's slot settings)
+#
+# Scheduler and export modules are imported only by the commands that use
+# them, and migrations are skipped when PRAGMA user_version is current, so a
+# short command costs little more than interpreter start-up.
+
+import argparse
+import importlib
+import json
+import sys
+import time as clock
+
+_started = clock.perf_counter()
+_timings = {"import": 0.0}
+
+
+def _lazy(module:str):
+    """Import a module on first use, counting the time under 'import'."""
+    began = clock.perf_counter()
+    mod = importlib.import_module(module)
+    _timings["import"] += clock.perf_counter() - began
+    return mod
+
+
+def _print_json(value):
+    json.dump(value, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+
+def _task_repo(args):
+    return _lazy("src.task_repo").TaskRepo(args.user)
+
+
+def _record(record):
+    return record._asdict()
+
+
+# --- tasks ---
+
+def cmd_tasks_add(args):
+    repo = _task_repo(args)
+    task_id = repo.add_task(args.name, args.minutes)
+    if args.fixed:
+        try:
+            repo.set_task_type(task_id, 'fixed', args.fixed)
+            if args.recur:
+                repo.set_recurrence(task_id, args.recur)
+        except ValueError:
+            repo.delete_task(task_id)   # don't leave a half-made task behind
+            raise
+    if args.select:
+        repo.set_selected([task_id])
+    return _record(repo.get_task(task_id))
+
+
+def cmd_tasks_list(args):
+    repo = _task_repo(args)
+    tasks = repo.get_selected_tasks() if args.selected else repo.list_tasks()
+    return [_record(task) for task in tasks]
+
+
+def cmd_tasks_rm(args):
+    return _task_repo(args).delete_tasks(args.ids)
+
+
+def cmd_tasks_select(args):
+    return _task_repo(args).set_selected(args.ids, not args.off)
+
+
+def cmd_tasks_conflicts(args):
+    return _task_repo(args).detect_fixed_task_conflict_groups()
+
+
+def cmd_tasks_recur(args):
+    repo = _task_repo(args)
+    repo.set_recurrence(args.id, args.days)
+    return _record(repo.get_task(args.id))
+
+
+# --- schedules ---
+
+def cmd_schedule_auto(args):
+    scheduler_module = _lazy("src.automatic_scheduler")
+    ScheduleCache = _lazy("src.schedule_cache").ScheduleCache
+    TaskRepo = _lazy("src.task_repo").TaskRepo
+
+    schedule_cache = ScheduleCache(persist=True)
+    scheduler = scheduler_module.AutomaticScheduler(
+        args.user, TaskRepo(args.user, schedule_cache=schedule_cache), schedule_cache,
+        slot_minutes=args.slot_minutes, exact=args.exact)
+    scheduler.quiet = True   # stdout is reserved for the JSON result
+    scheduler.set_strategy(args.strategy, None if args.budget_ms is None else args.budget_ms / 1000, args.objective,
+                           candidates=args.candidates.split(",") if args.candidates else None, workers=args.workers)
+    if args.start and not scheduler.set_time_boundaries(args.start, args.end):
+        raise ValueError("Invalid --start/--end (HH:MM AM/PM, at least 1 hour apart).")
+    if args.first_day:
+        scheduler.schedule_date = _lazy("datetime").date.fromisoformat(args.first_day)
+    if args.days != 1:
+        return _schedule_horizon(args, scheduler)
+    grid = scheduler.build_grid()
+    items = _lazy("src.schedule_repo").slot_items(grid) if grid is not None else []
+
+    result = {
+        "items": [_record(item) for item in items],
+        "unscheduled": [_record(task) for task in scheduler.unscheduled_tasks],
+        "schedule_id": None,
+    }
+    if scheduler.last_search is not None:
+        result["search"] = _lazy("src.strategies").describe(scheduler.last_search)
+    if args.save and items:
+        result["schedule_id"] = scheduler.save_schedule(grid, args.save)
+    return result
+
+
+def _schedule_horizon(args, scheduler):
+    """schedule auto --days N: one entry per day; --save stores each day as 'NAME YYYY-MM-DD'."""
+    slot_items = _lazy("src.schedule_repo").slot_items
+    horizon = scheduler.make_horizon(args.days)
+    grids = scheduler.build_horizon(horizon)
+    plan = scheduler.last_horizon
+    utilisation = plan.occupancy.utilisation()
+
+    days = []
+    for window, grid, used in zip(horizon, grids, utilisation):
+        items = slot_items(grid)
+        day = {"date": window.day.isoformat(), "utilisation": round(used, 3),
+               "items": [_record(item) for item in items], "schedule_id": None}
+        if args.save and items:
+            day["schedule_id"] = scheduler.save_schedule(grid, f"{args.save} {window.day.isoformat()}")
+        days.append(day)
+    return {
+        "days": days,
+        "unscheduled": [dict(_record(task), date=horizon[day].day.isoformat() if day is not None else None)
+                        for day, task in plan.unscheduled],
+    }
+
+
+def cmd_schedule_list(args):
+    repo = _lazy("src.schedule_repo").ScheduleRepo(args.user)
+    return [_record(record) for record in repo.list_schedules(limit=args.limit)]
+
+
+def cmd_schedule_show(args):
+    repo = _lazy("src.schedule_repo").ScheduleRepo(args.user)
+    record = repo.get_schedule(args.id) if args.id else repo.latest_schedule()
+    if record is None:
+        raise LookupError("No such schedule for this user.")
+    result = _record(record)
+    result["items"] = [_record(item) for item in repo.load_items(record.id)]
+    return result
+
+
+def cmd_schedule_export(args):
+    export = _lazy("src.export").export
+    if args.output == "-":
+        count = export("schedules", args.format, sys.stdout, user_id=args.user)
+        print(f"Exported {count} schedules rows.", file=sys.stderr)
+        return None
+    return {"rows": export("schedules", args.format, args.output, user_id=args.user),
+            "output": args.output}
+
+
+# --- settings ---
+
+def cmd_settings(args):
+    repo = _lazy("src.user_repo").UserRepo(args.user)
+    if args.slot_minutes is None and args.exact is None:
+        return _record(repo.get_slot_settings())
+    return _record(repo.set_slot_settings(args.slot_minutes, args.exact))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src.cli",
+                                     description="Scriptable task and schedule commands (JSON output).")
+    parser.add_argument("--db", help="database file (default scheduler.db)")
+    parser.add_argument("--user", type=int, help="user id (default: the 'default' user)")
+    parser.add_argument("--timings", action="store_true",
+                        help="print import/migrate/command times to stderr")
+    groups = parser.add_subparsers(dest="group", required=True)
+
+    tasks = groups.add_parser("tasks", help="add, list, remove and select tasks")
+    commands = tasks.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="add a task")
+    add.add_argument("name")
+    add.add_argument("minutes", type=int)
+    add.add_argument("--fixed", metavar="TIME", help="make it a fixed task at HH:MM AM/PM")
+    add.add_argument("--recur", metavar="DAYS", help="weekdays a fixed task repeats on (default: daily)")
+    add.add_argument("--select", action="store_true", help="select it for scheduling")
+    add.set_defaults(func=cmd_tasks_add)
+    listing = commands.add_parser("list", help="list tasks")
+    listing.add_argument("--selected", action="store_true", help="only selected tasks")
+    listing.set_defaults(func=cmd_tasks_list)
+    rm = commands.add_parser("rm", help="delete tasks")
+    rm.add_argument("ids", type=int, nargs="+")
+    rm.set_defaults(func=cmd_tasks_rm)
+    select = commands.add_parser("select", help="select tasks for scheduling")
+    select.add_argument("ids", type=int, nargs="+")
+    select.add_argument("--off", action="store_true", help="unselect instead")
+    select.set_defaults(func=cmd_tasks_select)
+    conflicts = commands.add_parser("conflicts", help="groups of overlapping fixed tasks")
+    conflicts.set_defaults(func=cmd_tasks_conflicts)
+    recur = commands.add_parser("recur", help="set the weekdays a fixed task repeats on")
+    recur.add_argument("id", type=int)
+    recur.add_argument("days", nargs="?", help="weekdays, weekends or mon,wed,fri (default: daily)")
+    recur.set_defaults(func=cmd_tasks_recur)
+
+    schedule = groups.add_parser("schedule", help="build, show and export schedules")
+    commands = schedule.add_subparsers(dest="command", required=True)
+    auto = commands.add_parser("auto", help="build an automatic schedule from the selected tasks")
+    auto.add_argument("--start", help="schedule start, HH:MM AM/PM (default 8:00 AM)")
+    auto.add_argument("--end", help="schedule end, HH:MM AM/PM (default 10:00 PM)")
+    auto.add_argument("--days", type=int, default=1, help="plan this many days at once (default 1)")
+    auto.add_argument("--from", dest="first_day", metavar="DATE",
+                      help="first day, YYYY-MM-DD (default today); picks the recurring fixed tasks")
+    auto.add_argument("--slot-minutes", type=int, metavar="N",
+                      help="slot length for this build, 1-60 (default: the user's setting)")
+    auto.add_argument("--exact", action=argparse.BooleanOptionalAction,
+                      help="place to the minute: exact durations, off-grid fixed times")
+    auto.add_argument("--strategy", metavar="NAME", default="greedy",
+                      help="greedy first-fit (default), best-fit, period-balanced, shortest-first, "
+                           "random-restarts, optimal packing, or portfolio (the best of --candidates)")
+    auto.add_argument("--budget-ms", type=int, metavar="N",
+                      help="time optimal, random-restarts or the portfolio may take (default 250)")
+    auto.add_argument("--objective", choices=["minutes", "tasks"],
+                      help="what optimal maximises: scheduled minutes (default) or tasks placed")
+    auto.add_argument("--candidates", metavar="NAMES",
+                      help="comma-separated strategies the portfolio runs (default: all but optimal)")
+    auto.add_argument("--workers", type=int, metavar="N",
+                      help="processes the portfolio runs in (default: one per candidate, up to the CPUs)")
+    auto.add_argument("--save", metavar="NAME", help="save the schedule under this name")
+    auto.set_defaults(func=cmd_schedule_auto)
+    listing = commands.add_parser("list", help="saved schedules, newest first")
+    listing.add_argument("--limit", type=int, default=20)
+    listing.set_defaults(func=cmd_schedule_list)
+    show = commands.add_parser("show", help="one saved schedule with its items")
+    show.add_argument("id", type=int, nargs="?", help="schedule id (default: latest)")
+    show.set_defaults(func=cmd_schedule_show)
+    export = commands.add_parser("export", help="export saved schedules")
+    export.add_argument("--format", choices=["csv", "jsonl", "ics", "txt"], default="csv")
+    export.add_argument("-o", "--output", default="-", help="output file, '-' for stdout")
+    export.set_defaults(func=cmd_schedule_export)
+
+    settings = groups.add_parser("settings", help="show or change the user's slot settings")
+    settings.add_argument("--slot-minutes", type=int, metavar="N", help="slot length, 1-60 minutes")
+    settings.add_argument("--exact", action=argparse.BooleanOptionalAction,
+                          help="place tasks to the minute by default")
+    settings.set_defaults(func=cmd_settings, command=None)
+    return parser
+
+
+def _default_user_id(get_connection):
+    with get_connection() as conn:
+        row = conn.execute("SELECT id FROM users WHERE username=?", ("default",)).fetchone()
+    return row[0]
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.group == "schedule" and args.command == "auto" and bool(args.start) != bool(args.end):
+        print("error: --start and --end must be given together", file=sys.stderr)
+        return 2
+    if args.group == "tasks" and args.command == "add" and args.recur and not args.fixed:
+        print("error: --recur requires --fixed", file=sys.stderr)
+        return 2
+
+    began = clock.perf_counter()
+    db = _lazy("src.db")
+    if args.db:
+        db.DB_PATH = args.db
+    version = db.run_migrations()   # one PRAGMA read when the schema is current
+    if args.user is None:
+        args.user = _default_user_id(db.get_connection)
+    _timings["migrate"] = clock.perf_counter() - began - _timings["import"]
+
+    began = clock.perf_counter()
+    imported = _timings["import"]
+    status = 0
+    try:
+        result = args.func(args)
+        if result is not None:
+            _print_json(result)
+    except (ValueError, LookupError, _lazy("sqlite3").IntegrityError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        status = 1
+    _timings["command"] = clock.perf_counter() - began - (_timings["import"] - imported)
+
+    if args.timings:
+        report = {name: round(seconds * 1000, 3) for name, seconds in _timings.items()}
+        report["total"] = round((clock.perf_counter() - _started) * 1000, 3)
+        report["schema_version"] = version
+        print(json.dumps({"timings_ms": report}), file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
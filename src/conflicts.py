@@ -0,0 +1,118 @@
+# File: src/conflicts.py
+# Description: Sweep-line overlap detection for fixed-time tasks.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Fixed tasks are (id, name, duration_minutes, fixed_time 'HH:MM'[, recurrence]) rows.
+# Postconditions: Overlaps are found in O(n log n + k), including across midnight; tasks
+#                 only conflict when they recur on a common weekday.
+
+import heapq
+from src.time_periods import MINUTES_PER_DAY, parse_hhmm, recurrence_days
+
+
+def _intervals(fixed_tasks):
+    """Parse each fixed time once; return (start, end, position, task) sorted by start.
+
+    Ends are in minutes from midnight and may run past MINUTES_PER_DAY for
+    tasks that cross into the next day.
+    """
+    intervals = []
+    for pos, task in enumerate(fixed_tasks):
+        task_id, name, duration, fixed_time = task[:4]
+        if not fixed_time:
+            continue
+        start = parse_hhmm(fixed_time)
+        intervals.append((start, start + duration, pos, task))
+    intervals.sort(key=lambda iv: (iv[0], iv[2]))
+    return intervals
+
+
+def _describe(task):
+    """Task tuple in the (id, name, fixed_time, duration) shape used in reports."""
+    task_id, name, duration, fixed_time = task[:4]
+    return (task_id, name, fixed_time, duration)
+
+
+def _weekdays(intervals):
+    """({position: weekdays the task recurs on}, the weekdays that need their own sweep).
+
+    Rows without a recurrence column, or with None, repeat every day. When every
+    task does, one sweep stands for the whole week.
+    """
+    days = {pos: recurrence_days(task[4] if len(task) > 4 else None) for _, _, pos, task in intervals}
+    weekly = any(len(on) < 7 for on in days.values())
+    return days, range(7) if weekly else range(1)
+
+
+def _pieces(intervals, days, weekday):
+    """What runs on one weekday: that day's tasks plus the next-morning piece of
+    the previous day's tasks that run past midnight."""
+    yesterday = (weekday - 1) % 7
+    pieces = [iv for iv in intervals if weekday in days[iv[2]]]
+    pieces.extend((0, end - MINUTES_PER_DAY, pos, task)
+                  for start, end, pos, task in intervals
+                  if end > MINUTES_PER_DAY and yesterday in days[pos])
+    pieces.sort(key=lambda iv: (iv[0], iv[2]))
+    return pieces
+
+
+def find_conflict_pairs(fixed_tasks):
+    """Return every overlapping pair as {'task1': ..., 'task2': ...}.
+
+    'task1' is the task that starts first. Tasks that run past midnight also
+    conflict with tasks early the next morning. Tasks with no weekday in
+    common never conflict.
+    """
+    intervals = _intervals(fixed_tasks)
+    rank = {pos: i for i, (_, _, pos, _) in enumerate(intervals)}
+    days, weekdays = _weekdays(intervals)
+    found = set()
+    for weekday in weekdays:
+        active = []   # heap of (end, rank) for pieces still running
+        for start, end, pos, _ in _pieces(intervals, days, weekday):
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            mine = rank[pos]
+            for _, other in active:
+                if other != mine:
+                    found.add((other, mine) if other < mine else (mine, other))
+            heapq.heappush(active, (end, mine))
+
+    # report pairs in start order, the same way the original pairwise loop did
+    pairs = sorted(found)
+    return [
+        {'task1': _describe(intervals[i][3]), 'task2': _describe(intervals[j][3])}
+        for i, j in pairs
+    ]
+
+
+def find_conflict_groups(fixed_tasks):
+    """Group fixed tasks into clusters connected by chains of overlaps.
+
+    Returns a list of clusters, each a list of (id, name, fixed_time, duration)
+    tuples in start order. Tasks that overlap nothing are left out.
+    """
+    intervals = _intervals(fixed_tasks)
+    parent = {pos: pos for _, _, pos, _ in intervals}
+    days, weekdays = _weekdays(intervals)
+
+    def find(pos):
+        while parent[pos] != pos:
+            parent[pos] = parent[parent[pos]]
+            pos = parent[pos]
+        return pos
+
+    # one sweep per weekday: a piece starting before the running end joins the current cluster
+    for weekday in weekdays:
+        anchor, reach = None, None
+        for start, end, pos, _ in _pieces(intervals, days, weekday):
+            if anchor is not None and start < reach:
+                parent[find(pos)] = find(anchor)
+                reach = max(reach, end)
+            else:
+                anchor, reach = pos, end
+
+    groups = {}
+    for _, _, pos, task in intervals:
+        groups.setdefault(find(pos), []).append(task)
+    return [[_describe(task) for task in members] for members in groups.values() if len(members) > 1]
@@ -4,49 +4,165 @@
 # Created: 2025-10-20
 # Revisions:
 #   2025-10-22 - Added run_migrations()
-# Preconditions: SQLite3 installed; migration file exists.
+#   2026-10-16 - Reuse one tuned connection per thread instead of reconnecting
+#   2026-10-16 - Numbered migrations tracked in PRAGMA user_version
+#   2026-10-16 - Pluggable connection class (CONNECTION_FACTORY) for instrumentation
+# Preconditions: SQLite3 installed; migration files exist in db/.
 # Postconditions: Database schema ready.
 
+import os
 import sqlite3
+import threading
 from pathlib import Path
 
 DB_PATH = Path("scheduler.db")
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "db"
+
+DEFAULT_TASKS = [
+    ('Break',15), ('Breakfast',45), ('Lunch',45), ('Dinner',45), ('Exercise', 45), ('Laundry', 20),
+    ('Study', 60), ('Team Meeting', 60), ('Reading', 30), ('Email Management', 30),
+    ('Work', 90), ('Go on a Walk', 20), ('Nap', 20), ('Shower', 20), ('Clean', 90)
+]
+
+# Connection tuning, applied once when a thread first opens the database.
+BUSY_TIMEOUT_MS = 5000
+STATEMENT_CACHE_SIZE = 256
+# Class used for new connections; src.instrument swaps in a timing subclass.
+CONNECTION_FACTORY = sqlite3.Connection
+
+_local = threading.local()
+_open_connections = []
+_open_lock = threading.Lock()
+# Bumped by close_connections() so every thread drops its cached handles.
+_generation = 0
+
+
+def _open_connection(path):
+    """Open a new connection to path and apply the tuning PRAGMAs."""
+    conn = sqlite3.connect(
+        path,
+        timeout=BUSY_TIMEOUT_MS / 1000,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        factory=CONNECTION_FACTORY,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA foreign_keys=ON")
+    return conn
+
 
 def get_connection():
-    """Return a SQLite3 connection object."""
-    return sqlite3.connect(DB_PATH)
+    """Return this thread's SQLite3 connection to DB_PATH, opening it on first use.
+
+    The connection stays open between calls. Using it as a context manager
+    (`with get_connection() as conn:`) commits or rolls back on exit but does
+    not close it.
+    """
+    path = str(DB_PATH)
+    conns = getattr(_local, "conns", None)
+    if conns is None or _local.generation != _generation:
+        conns = _local.conns = {}
+        _local.generation = _generation
+    conn = conns.get(path)
+    if conn is None:
+        conn = conns[path] = _open_connection(path)
+        with _open_lock:
+            _open_connections.append(conn)
+    return conn
+
+
+def close_connections():
+    """Close every connection opened by get_connection(), in all threads."""
+    global _generation
+    with _open_lock:
+        conns = list(_open_connections)
+        _open_connections.clear()
+        _generation += 1
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.ProgrammingError:
+            # connection belongs to another (possibly finished) thread
+            pass
+
+
+def _reset_after_fork():
+    """Forked children must not share the parent's SQLite handles."""
+    global _local, _open_lock
+    _local = threading.local()
+    _open_lock = threading.Lock()
+    _open_connections.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _list_migrations():
+    """Return [(version, path)] for every db/migrate_NNN_*.sql file, oldest first."""
+    migrations = []
+    for path in MIGRATIONS_DIR.glob("migrate_*.sql"):
+        number = path.name.split("_")[1]
+        if number.isdigit():
+            migrations.append((int(number), path))
+    migrations.sort()
+    return migrations
+
+
+def schema_version(conn) -> int:
+    """Return the migration version recorded in PRAGMA user_version."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def latest_schema_version() -> int:
+    """Return the number of the newest migration file (0 if there are none)."""
+    migrations = _list_migrations()
+    return migrations[-1][0] if migrations else 0
+
+
+def _seed_defaults(conn):
+    """Ensure the default user and its starter tasks exist."""
+    # Ensure default user exists for Sprint 1 simplicity
+    conn.execute("INSERT OR IGNORE INTO users (username) VALUES (?)", ("default",))
+    user_id = conn.execute("SELECT id FROM users WHERE username=?", ("default",)).fetchone()[0]
+
+    # default tasks
+    cur = conn.execute("SELECT COUNT(*) FROM tasks WHERE user_id=?", (user_id,))
+    if cur.fetchone()[0] == 0:
+        conn.executemany(
+            "INSERT INTO tasks (user_id, name, duration_minutes, selected) VALUES (?, ?, ?, 0)",
+            [(user_id, name, duration) for name, duration in DEFAULT_TASKS]
+        )
+
 
 def run_migrations():
-    """Run initial SQL migration to create tables if needed."""
-    migration = Path("db/migrate_001_init.sql")
-    if not migration.exists():
-        raise FileNotFoundError("Migration file not found at db/migrate_001_init.sql")
+    """Apply every migration newer than the schema version, then seed defaults.
+
+    Returns the schema version. When the database is already current this is a
+    single PRAGMA read.
+    """
+    migrations = _list_migrations()
+    if not migrations:
+        raise FileNotFoundError(f"No migration files found in {MIGRATIONS_DIR}")
     with get_connection() as conn:
-        # Check if tasks table exists
-        cur = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='tasks'")
-        if cur.fetchone():
-            # Table already exists — skip migration
-            pass
-        else:
-            # Run migration file to create tables
-            sql = migration.read_text(encoding="utf-8")
-            conn.executescript(sql)
- 
-        # Ensure default user exists for Sprint 1 simplicity
-        cur = conn.execute("SELECT id FROM users WHERE username=?", ("default",))
-        if not cur.fetchone():
-            conn.execute("INSERT INTO users (username) VALUES (?)", ("default",))
-
-        # default tasks
-        cur = conn.execute("SELECT COUNT(*) FROM tasks WHERE user_id = (SELECT id FROM users WHERE username='default')")
-        if cur.fetchone()[0] == 0:
-            default_tasks = [
-                ('Break',15), ('Breakfast',45), ('Lunch',45), ('Dinner',45), ('Exercise', 45), ('Laundry', 20),
-                ('Study', 60), ('Team Meeting', 60), ('Reading', 30), ('Email Management', 30),
-                ('Work', 90), ('Go on a Walk', 20), ('Nap', 20), ('Shower', 20), ('Clean', 90)
-            ]
-            for name, duration in default_tasks:
-                conn.execute(
-                    "INSERT INTO tasks (user_id, name, duration_minutes, selected) VALUES ((SELECT id FROM users WHERE username='default'), ?, ?, 0)",
-                    (name, duration)
-                )
+        version = schema_version(conn)
+        if version >= migrations[-1][0]:
+            return version
+
+        if version == 0:
+            # Databases created before versioning already ran migration 001
+            cur = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='tasks'")
+            if cur.fetchone():
+                version = 1
+
+        for number, path in migrations:
+            if number <= version:
+                continue
+            sql = path.read_text(encoding="utf-8")
+            # migration and version bump commit together or not at all
+            conn.executescript(f"BEGIN;\n{sql}\n;PRAGMA user_version = {number};\nCOMMIT;")
+            version = number
+
+        _seed_defaults(conn)
+    return version
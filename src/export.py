@@ -0,0 +1,274 @@
+# File: src/export.py
+# Description: Streams tasks and saved schedules to CSV, JSON Lines, iCalendar or text.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Database migrated.
+# Postconditions: Export file written row by row; memory use does not grow with row count.
+#
+# Usage: python -m src.export tasks|schedules [--format csv|jsonl|ics|txt] [--user ID]
+#                              [--schedule ID] [-o PATH|-] [--gzip]
+
+import argparse
+import csv
+import gzip
+import json
+import sys
+from datetime import date, datetime, timezone
+
+from src import db
+from src.db import get_connection, run_migrations
+
+FETCH_SIZE = 1000
+FORMATS = ("csv", "jsonl", "ics", "txt")
+
+TASK_FIELDS = ["user_id", "id", "name", "duration_minutes", "selected", "task_type", "fixed_time", "recurrence",
+               "created_at"]
+SCHEDULE_FIELDS = ["schedule_id", "user_id", "schedule_name", "schedule_type", "created_at",
+                   "task_id", "task_name", "start_time", "end_time"]
+
+
+def _stream(sql, params):
+    """Yield rows as dicts straight off a cursor, FETCH_SIZE at a time."""
+    conn = get_connection()
+    cur = conn.execute(sql, params)
+    names = [col[0] for col in cur.description]
+    try:
+        while True:
+            rows = cur.fetchmany(FETCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield dict(zip(names, row))
+    finally:
+        cur.close()
+
+
+def iter_tasks(user_id=None):
+    """Task rows (all users when user_id is None), in user then creation order."""
+    sql = f"SELECT {', '.join(TASK_FIELDS)} FROM tasks"
+    if user_id is None:
+        return _stream(sql + " ORDER BY user_id, created_at, id", ())
+    return _stream(sql + " WHERE user_id=? ORDER BY created_at, id", (user_id,))
+
+
+def iter_schedule_items(user_id=None, schedule_id=None):
+    """One row per saved schedule item, with its schedule and task name, in time order."""
+    sql = """SELECT s.id AS schedule_id, s.user_id, s.name AS schedule_name, s.schedule_type,
+                    s.created_at, i.task_id, t.name AS task_name, i.start_time, i.end_time
+             FROM schedules s
+             JOIN schedule_items i ON i.schedule_id = s.id
+             LEFT JOIN tasks t ON t.id = i.task_id"""
+    where, params = [], []
+    if user_id is not None:
+        where.append("s.user_id=?")
+        params.append(user_id)
+    if schedule_id is not None:
+        where.append("s.id=?")
+        params.append(schedule_id)
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return _stream(sql + " ORDER BY s.id, i.start_time", params)
+
+
+# --- writers: each takes an iterable of row dicts and a text file, returns rows written ---
+
+def write_csv(rows, fh, fields):
+    writer = csv.DictWriter(fh, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows, fh, fields=None):
+    count = 0
+    for row in rows:
+        fh.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+        fh.write("\n")
+        count += 1
+    return count
+
+
+def write_task_text(rows, fh, fields=None):
+    """The original tasks_output.txt layout, plus type and fixed time."""
+    count = 0
+    for row in rows:
+        fixed = f" @ {row['fixed_time']}" if row.get("fixed_time") else ""
+        if fixed and row.get("recurrence"):
+            fixed += f" ({row['recurrence']})"
+        fh.write(f"{row['id']}. {row['name']} - {row['duration_minutes']} min - "
+                 f"selected={bool(row['selected'])} - {row['task_type'] or 'flexible'}{fixed}\n")
+        count += 1
+    if count == 0:
+        fh.write("(no tasks yet)\n")
+    return count
+
+
+def write_schedule_text(rows, fh, fields=None):
+    count = 0
+    current = None
+    for row in rows:
+        if row["schedule_id"] != current:
+            current = row["schedule_id"]
+            fh.write(f"\n{row['schedule_name']} ({row['schedule_type']}, {row['created_at']})\n")
+        fh.write(f"  {row['start_time']} - {row['end_time']}: {row['task_name']}\n")
+        count += 1
+    if count == 0:
+        fh.write("(no saved schedules)\n")
+    return count
+
+
+def _ics_text(value):
+    """Escape a TEXT value (RFC 5545 section 3.3.11); CRLF and bare CR count as line breaks."""
+    value = str(value).replace("\r\n", "\n").replace("\r", "\n")
+    return (value.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def _ics_line(fh, line):
+    """Write one content line, folded at 75 octets."""
+    data = line.encode("utf-8")
+    limit = 75
+    while len(data) > limit:
+        cut = limit
+        while cut > 0 and (data[cut] & 0xC0) == 0x80:   # don't split a UTF-8 sequence
+            cut -= 1
+        fh.write(data[:cut].decode("utf-8") + "\r\n ")
+        data = data[cut:]
+        limit = 74      # the leading space of a continuation line is one of its 75 octets
+    fh.write(data.decode("utf-8") + "\r\n")
+
+
+def _ics_date(created_at, fallback):
+    try:
+        return datetime.strptime(created_at[:10], "%Y-%m-%d").strftime("%Y%m%d")
+    except (TypeError, ValueError):
+        return fallback
+
+
+def _write_ics(rows, fh, component):
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    today = date.today().strftime("%Y%m%d")
+    _ics_line(fh, "BEGIN:VCALENDAR")
+    _ics_line(fh, "VERSION:2.0")
+    _ics_line(fh, "PRODID:-//EECS 581 Group 32//Smart Scheduler//EN")
+    count = 0
+    for row in rows:
+        for line in component(row, stamp, today):
+            _ics_line(fh, line)
+        count += 1
+    _ics_line(fh, "END:VCALENDAR")
+    return count
+
+
+def _task_component(row, stamp, today):
+    lines = [
+        "BEGIN:VTODO",
+        f"UID:task-{row['id']}@smart-scheduler",
+        f"DTSTAMP:{stamp}",
+        f"SUMMARY:{_ics_text(row['name'])}",
+        f"DURATION:PT{row['duration_minutes']}M",
+        f"STATUS:{'IN-PROCESS' if row['selected'] else 'NEEDS-ACTION'}",
+        f"CATEGORIES:{_ics_text(row['task_type'] or 'flexible')}",
+    ]
+    if row.get("fixed_time"):
+        # fixed tasks recur at the same time every day, or on their weekdays
+        lines.append(f"DTSTART:{today}T{row['fixed_time'].replace(':', '')}00")
+        if row.get("recurrence"):
+            byday = ",".join(day[:2].upper() for day in row["recurrence"].split(","))
+            lines.append(f"RRULE:FREQ=WEEKLY;BYDAY={byday}")
+        else:
+            lines.append("RRULE:FREQ=DAILY")
+    lines.append("END:VTODO")
+    return lines
+
+
+def _schedule_component(row, stamp, today):
+    day = _ics_date(row["created_at"], today)
+    return [
+        "BEGIN:VEVENT",
+        f"UID:schedule-{row['schedule_id']}-{row['task_id']}-{row['start_time'].replace(':', '')}@smart-scheduler",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{day}T{row['start_time'].replace(':', '')}00",
+        f"DTEND:{day}T{row['end_time'].replace(':', '')}00",
+        f"SUMMARY:{_ics_text(row['task_name'] or 'Task ' + str(row['task_id']))}",
+        f"DESCRIPTION:{_ics_text(row['schedule_name'])}",
+        "END:VEVENT",
+    ]
+
+
+def write_task_ics(rows, fh, fields=None):
+    return _write_ics(rows, fh, _task_component)
+
+
+def write_schedule_ics(rows, fh, fields=None):
+    return _write_ics(rows, fh, _schedule_component)
+
+
+WRITERS = {
+    ("tasks", "csv"): (write_csv, TASK_FIELDS),
+    ("tasks", "jsonl"): (write_jsonl, TASK_FIELDS),
+    ("tasks", "ics"): (write_task_ics, TASK_FIELDS),
+    ("tasks", "txt"): (write_task_text, TASK_FIELDS),
+    ("schedules", "csv"): (write_csv, SCHEDULE_FIELDS),
+    ("schedules", "jsonl"): (write_jsonl, SCHEDULE_FIELDS),
+    ("schedules", "ics"): (write_schedule_ics, SCHEDULE_FIELDS),
+    ("schedules", "txt"): (write_schedule_text, SCHEDULE_FIELDS),
+}
+
+
+def open_output(path, compress=None):
+    """Open path for text writing; gzip when compress is set or the name ends in .gz."""
+    if compress is None:
+        compress = str(path).endswith(".gz")
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def export(kind, fmt, out, user_id=None, schedule_id=None, compress=None):
+    """Stream tasks or schedules to out (a path or an open text file). Returns rows written."""
+    if (kind, fmt) not in WRITERS:
+        raise ValueError(f"Unsupported export: {kind} as {fmt}")
+    writer, fields = WRITERS[(kind, fmt)]
+    if kind == "tasks":
+        rows = iter_tasks(user_id)
+    else:
+        rows = iter_schedule_items(user_id, schedule_id)
+    if hasattr(out, "write"):
+        return writer(rows, out, fields)
+    with open_output(out, compress) as fh:
+        return writer(rows, fh, fields)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export tasks or saved schedules.")
+    parser.add_argument("kind", choices=["tasks", "schedules"])
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--user", type=int, help="only this user id (default: all users)")
+    parser.add_argument("--schedule", type=int, help="only this schedule id")
+    parser.add_argument("-o", "--output", default="-", help="output file, '-' for stdout")
+    parser.add_argument("--gzip", action="store_true", help="gzip the output file")
+    parser.add_argument("--db", help="database file (default scheduler.db)")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        db.DB_PATH = args.db
+    run_migrations()
+    if args.output == "-":
+        if args.gzip:
+            with gzip.open(sys.stdout.buffer, "wt", encoding="utf-8", newline="") as fh:
+                count = export(args.kind, args.format, fh, args.user, args.schedule)
+        else:
+            count = export(args.kind, args.format, sys.stdout, args.user, args.schedule)
+    else:
+        count = export(args.kind, args.format, args.output, args.user, args.schedule,
+                       compress=True if args.gzip else None)
+    print(f"Exported {count} {args.kind} rows.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+# File: src/horizon.py
+# Description: Multi-day planning horizon: per-day boundaries, weekly recurrence and placement.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Tasks are TaskRecords; day boundaries are minutes after midnight.
+# Postconditions: Fixed tasks land on every day they recur on (where they fit); flexible tasks once.
+#
+# Placement follows AutomaticScheduler's single-day rules: fixed tasks first,
+# at the slot starting at their time; then flexible tasks, longest first, into
+# the first run of free slots within one period, trying the days in order and
+# within a day the morning, afternoon, evening and night periods in turn. A
+# one-day horizon gives the same placements as build_schedule.
+#
+# Occupancy is one days x minutes matrix (src.occupancy). A recurring fixed
+# task is checked against all its days in one operation, and flexible
+# first-fit is a single bytes.find over one busy byte per slot of the whole
+# horizon, laid out in search order, so a week costs about what one day does.
+#
+# Exact placement (AutomaticScheduler.set_resolution) plans on one-minute
+# slots with align set to the slot length: tasks take exactly their duration,
+# fixed tasks keep off-grid times, and flexible tasks start on the slot grid.
+
+from datetime import date, timedelta
+from functools import lru_cache
+from math import gcd
+from typing import List, NamedTuple, Optional
+
+from src.occupancy import Occupancy
+from src.slot_grid import SlotGrid
+from src.time_periods import MINUTES_PER_DAY, PERIOD_BY_MINUTE, parse_hhmm, recurrence_days
+
+PERIODS = ["morning", "afternoon", "evening", "night"]
+
+
+class DayWindow(NamedTuple):
+    """One day of the horizon and its schedule boundaries (minutes after midnight)"""
+    day: date
+    start: int
+    end: int
+
+
+class Placement(NamedTuple):
+    task: tuple
+    day: int        # index into the horizon
+    start: int
+    end: int
+
+
+def make_horizon(first_day:date, days:int = 7, start:int = 480, end:int = 1320,
+                 per_weekday:Optional[dict] = None) -> List[DayWindow]:
+    """DayWindows for `days` consecutive days from first_day.
+
+    per_weekday maps a weekday (Monday = 0) to its own (start, end), or to
+    None for a day off, which is left out of the horizon.
+    """
+    if days <= 0:
+        raise ValueError("A horizon needs at least one day.")
+    per_weekday = per_weekday or {}
+    horizon = []
+    for offset in range(days):
+        day = first_day + timedelta(days=offset)
+        bounds = per_weekday.get(day.weekday(), (start, end))
+        if bounds is None:
+            continue
+        if not 0 <= bounds[0] < bounds[1] <= MINUTES_PER_DAY:
+            raise ValueError(f"Bad boundaries for {day:%a %Y-%m-%d}: start must be before end.")
+        horizon.append(DayWindow(day, *bounds))
+    return horizon
+
+
+@lru_cache(maxsize=64)
+def _search_order(windows, step):
+    """Every slot of the windows as (day, start minute), by day, then period, then time.
+
+    A spacer (day -1) follows each run of same-period slots so no task spans
+    two runs. Returns (days, starts, {(day, start): position}, busy bytes
+    with only the spacers set); shared between plans, so never modified.
+    """
+    days, starts = [], []
+    for day, (start, end) in enumerate(windows):
+        runs = []    # [period, [slot starts]] of back-to-back slots in one period
+        for minute in range(start, end - step + 1, step):
+            period = PERIOD_BY_MINUTE[minute]
+            if runs and runs[-1][0] == period:
+                runs[-1][1].append(minute)
+            else:
+                runs.append([period, [minute]])
+        for period in PERIODS:
+            for run_period, minutes in runs:
+                if run_period == period:
+                    days += [day] * len(minutes) + [-1]
+                    starts += minutes + [0]
+    position = {(day, minute): k for k, (day, minute) in enumerate(zip(days, starts)) if day >= 0}
+    return tuple(days), tuple(starts), position, bytes(day < 0 for day in days)
+
+
+def order_key(task):
+    # same order as SchedulePlan: fixed first, longer first, then creation order
+    return (task[4] != 'fixed', -task[2], task[0])
+
+
+class HorizonPlan:
+    """Placement state of one multi-day build"""
+
+    def __init__(self, horizon, slot_minutes:int = 30, align:int = 1):
+        self.horizon = list(horizon)
+        self.slot_minutes = slot_minutes
+        self.align = align          # flexible tasks start every align slots from the day's start
+        # whole slots only, like AutomaticScheduler.slot_start_minutes
+        windows = tuple((w.start, w.start + (w.end - w.start) // slot_minutes * slot_minutes)
+                        for w in self.horizon)
+        self.occupancy = Occupancy(windows)
+        self.placements = []        # Placement per placed task (one per day for fixed tasks)
+        self.unscheduled = []       # (day index, task) for fixed tasks, (None, task) for flexible ones
+        self._slot_days, self._slot_starts, self._slot_at, busy = _search_order(windows, slot_minutes)
+        self._busy = bytearray(busy)    # 1 per taken slot (and spacer), in search order
+
+    def _mark(self, day, start, end):
+        """Flag the slots of start..end on day as taken in the search order"""
+        for minute in range(start, end, self.slot_minutes):
+            k = self._slot_at.get((day, minute))    # slots outside every period are never searched
+            if k is not None:
+                self._busy[k] = 1
+
+    def slots_needed(self, task):
+        return -(-task[2] // self.slot_minutes)  # Ceiling division
+
+    def place(self, task):
+        if task[4] == 'fixed':
+            return self.place_fixed(task)
+        return self.place_flexible(task)
+
+    def place_fixed(self, task):
+        """Put a fixed task on every day it recurs on and fits; returns those day indexes"""
+        step = self.slot_minutes
+        length = self.slots_needed(task) * step
+        weekdays = recurrence_days(getattr(task, 'recurrence', None))
+        days = [i for i, window in enumerate(self.horizon) if window.day.weekday() in weekdays]
+        try:
+            minute = parse_hhmm(task[5]) if task[5] else None
+        except ValueError:
+            minute = None
+
+        placed = []
+        # one period for the whole task, and it must start on a slot of the day
+        if (minute is not None and minute + length <= MINUTES_PER_DAY
+                and len({PERIOD_BY_MINUTE[m] for m in range(minute, minute + length, step)}) == 1):
+            aligned = [day for day in days if (minute - self.horizon[day].start) % step == 0]
+            placed = self.occupancy.free_days(aligned, minute, minute + length)
+            self.occupancy.occupy_days(placed, minute, minute + length, task[0])
+            for day in placed:
+                self.placements.append(Placement(task, day, minute, minute + length))
+                self._mark(day, minute, minute + length)
+        missed = set(days) - set(placed)
+        self.unscheduled += [(day, task) for day in days if day in missed]
+        return placed
+
+    def place_flexible(self, task):
+        """Put a flexible task in the first free run of the horizon; returns its Placement or None"""
+        needed = self.slots_needed(task)
+        free = bytes(needed)
+        k = self._busy.find(free)
+        while k >= 0 and (self._slot_starts[k] - self.horizon[self._slot_days[k]].start) // self.slot_minutes % self.align:
+            k = self._busy.find(free, k + 1)
+        if k < 0:
+            self.unscheduled.append((None, task))
+            return None
+        self._busy[k:k + needed] = b"\x01" * needed
+        day, minute = self._slot_days[k], self._slot_starts[k]
+        placement = Placement(task, day, minute, minute + needed * self.slot_minutes)
+        self.occupancy.occupy(day, placement.start, placement.end, task[0])
+        self.placements.append(placement)
+        return placement
+
+    def unscheduled_tasks(self):
+        """Tasks with at least one occurrence left out, once each"""
+        return list(dict.fromkeys(task for _, task in self.unscheduled))
+
+    def grids(self, names:dict = None):
+        """One SlotGrid per day of the horizon, covering its boundaries; all share one name table"""
+        names = {} if names is None else names
+        grids = [SlotGrid(w.start, w.end, gcd(self.slot_minutes, w.end - w.start), names) for w in self.horizon]
+        for task, day, start, end in self.placements:
+            grids[day].assign(start, end, task[0], task[1])
+        return grids
+
+
+def plan_horizon(tasks, horizon, slot_minutes:int = 30, align:int = 1) -> HorizonPlan:
+    """Place tasks over every day of horizon (a list of DayWindows)"""
+    plan = HorizonPlan(horizon, slot_minutes, align)
+    for task in sorted(tasks, key=order_key):
+        plan.place(task)
+    return plan
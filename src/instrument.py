@@ -0,0 +1,283 @@
+# File: src/instrument.py
+# Description: Opt-in timers and SQL counters for the schedulers and repositories.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: None.
+# Postconditions: While enabled, SQL statements and named phases are counted and timed.
+#
+# Usage:
+#   from src import instrument
+#   with instrument.instrumented(profile=True, memory=True):
+#       scheduler.build_schedule()
+#   instrument.dump()                      # table on stderr, or dump(fmt="json")
+#
+#   SCHEDULER_INSTRUMENT=table|json python -m src.app   # dump to stderr at exit
+#
+# Disabled (the default), phase() returns a shared no-op context manager and
+# connections are plain sqlite3.Connection objects, so nothing is measured.
+
+import atexit
+import contextlib
+import os
+import sqlite3
+import sys
+import threading
+import time as clock
+
+from src import db
+
+_enabled = False
+_lock = threading.Lock()
+_sql = {}        # statement -> [calls, rows, seconds]
+_phases = {}     # phase name -> [calls, seconds]
+_profiler = None
+_profile_text = None
+_memory = None
+_NULL_PHASE = contextlib.nullcontext()
+
+
+def _record_sql(sql, calls, rows, seconds):
+    key = " ".join(sql.split())
+    with _lock:
+        entry = _sql.get(key)
+        if entry is None:
+            _sql[key] = [calls, rows, seconds]
+        else:
+            entry[0] += calls
+            entry[1] += rows
+            entry[2] += seconds
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that times execute and fetch calls and counts rows."""
+
+    _statement = ""
+
+    def execute(self, sql, parameters=()):
+        began = clock.perf_counter()
+        super().execute(sql, parameters)
+        self._statement = sql
+        _record_sql(sql, 1, max(self.rowcount, 0), clock.perf_counter() - began)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        began = clock.perf_counter()
+        super().executemany(sql, seq_of_parameters)
+        self._statement = sql
+        _record_sql(sql, 1, max(self.rowcount, 0), clock.perf_counter() - began)
+        return self
+
+    def _fetched(self, rows, began):
+        # rows fetched after execute() belong to the same statement, not a new call
+        _record_sql(self._statement, 0, rows, clock.perf_counter() - began)
+
+    def fetchone(self):
+        began = clock.perf_counter()
+        row = super().fetchone()
+        self._fetched(row is not None, began)
+        return row
+
+    def fetchmany(self, size=None):
+        began = clock.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._fetched(len(rows), began)
+        return rows
+
+    def fetchall(self):
+        began = clock.perf_counter()
+        rows = super().fetchall()
+        self._fetched(len(rows), began)
+        return rows
+
+    def __next__(self):
+        began = clock.perf_counter()
+        row = super().__next__()   # StopIteration passes straight through
+        self._fetched(1, began)
+        return row
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose shortcut execute methods use InstrumentedCursor."""
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+class _Phase:
+    __slots__ = ("name", "began")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.began = clock.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = clock.perf_counter() - self.began
+        with _lock:
+            entry = _phases.get(self.name)
+            if entry is None:
+                _phases[self.name] = [1, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+        return False
+
+
+def phase(name:str):
+    """Context manager timing one named phase (a shared no-op when disabled)."""
+    if not _enabled:
+        return _NULL_PHASE
+    return _Phase(name)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """Forget everything measured so far."""
+    global _profile_text, _memory
+    with _lock:
+        _sql.clear()
+        _phases.clear()
+    _profile_text = None
+    _memory = None
+
+
+def enable(sql:bool = True, profile:bool = False, memory:bool = False):
+    """Start measuring. sql swaps in counting connections (open ones are reopened);
+    profile runs cProfile and memory runs tracemalloc until disable()."""
+    global _enabled, _profiler
+    reset()
+    _enabled = True
+    if sql and db.CONNECTION_FACTORY is not InstrumentedConnection:
+        db.CONNECTION_FACTORY = InstrumentedConnection
+        db.close_connections()
+    if memory:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+    if profile:
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def disable(top:int = 15):
+    """Stop measuring; results stay available to report() until the next enable()."""
+    global _enabled, _profiler, _profile_text, _memory
+    _enabled = False
+    if _profiler is not None:
+        import io
+        import pstats
+        _profiler.disable()
+        out = io.StringIO()
+        pstats.Stats(_profiler, stream=out).sort_stats("cumulative").print_stats(top)
+        _profile_text = out.getvalue()
+        _profiler = None
+    tracemalloc = sys.modules.get("tracemalloc")
+    if tracemalloc is not None and tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        stats = tracemalloc.take_snapshot().statistics("lineno")[:top]
+        tracemalloc.stop()
+        _memory = {
+            "current_bytes": current,
+            "peak_bytes": peak,
+            "top": [{"where": str(stat.traceback), "bytes": stat.size, "blocks": stat.count}
+                    for stat in stats],
+        }
+    if db.CONNECTION_FACTORY is InstrumentedConnection:
+        db.CONNECTION_FACTORY = sqlite3.Connection
+        db.close_connections()
+
+
+@contextlib.contextmanager
+def instrumented(sql:bool = True, profile:bool = False, memory:bool = False):
+    """enable() for the duration of a with block."""
+    enable(sql, profile, memory)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def report():
+    """Everything measured, as a JSON-able dict (statements slowest first)."""
+    with _lock:
+        sql = [{"sql": key, "calls": calls, "rows": rows, "seconds": seconds}
+               for key, (calls, rows, seconds) in _sql.items()]
+        phases = {name: {"calls": calls, "seconds": seconds}
+                  for name, (calls, seconds) in _phases.items()}
+    sql.sort(key=lambda row: row["seconds"], reverse=True)
+    result = {
+        "queries": sum(row["calls"] for row in sql),
+        "sql_seconds": sum(row["seconds"] for row in sql),
+        "phases": phases,
+        "sql": sql,
+    }
+    if _memory is not None:
+        result["memory"] = _memory
+    if _profile_text is not None:
+        result["profile"] = _profile_text
+    return result
+
+
+def format_table(result=None, width:int = 72):
+    """Plain-text summary of report()."""
+    result = result or report()
+    lines = [f"{'phase':<40} {'calls':>7} {'ms':>10}"]
+    for name, row in result["phases"].items():
+        lines.append(f"{name:<40} {row['calls']:>7} {row['seconds'] * 1000:>10.3f}")
+    lines.append("")
+    lines.append(f"{result['queries']} queries, {result['sql_seconds'] * 1000:.3f} ms in SQLite")
+    lines.append(f"{'calls':>7} {'rows':>7} {'ms':>10}  statement")
+    for row in result["sql"]:
+        sql = row["sql"] if len(row["sql"]) <= width else row["sql"][:width - 3] + "..."
+        lines.append(f"{row['calls']:>7} {row['rows']:>7} {row['seconds'] * 1000:>10.3f}  {sql}")
+    if "memory" in result:
+        memory = result["memory"]
+        lines.append("")
+        lines.append(f"memory: peak {memory['peak_bytes'] / 1024:.1f} KiB, "
+                     f"current {memory['current_bytes'] / 1024:.1f} KiB")
+        for row in memory["top"]:
+            lines.append(f"  {row['bytes'] / 1024:>9.1f} KiB  {row['where']}")
+    if "profile" in result:
+        lines.append("")
+        lines.append(result["profile"].rstrip())
+    return "\n".join(lines)
+
+
+def dump(fh=None, fmt:str = "table"):
+    """Write report() to fh (default stderr) as a table or JSON."""
+    fh = fh or sys.stderr
+    if fmt == "json":
+        import json
+        json.dump(report(), fh, indent=2)
+        fh.write("\n")
+    else:
+        fh.write(format_table() + "\n")
+
+
+def _from_environment():
+    fmt = os.environ.get("SCHEDULER_INSTRUMENT", "").strip().lower()
+    if not fmt or fmt == "0":
+        return
+    enable(profile=bool(os.environ.get("SCHEDULER_PROFILE")),
+           memory=bool(os.environ.get("SCHEDULER_TRACEMALLOC")))
+
+    def finish():
+        disable()
+        dump(fmt="json" if fmt == "json" else "table")
+
+    atexit.register(finish)
+
+
+_from_environment()
@@ -0,0 +1,208 @@
+# File: src/interval_schedule.py
+# Description: One day of manual assignments kept as sorted, non-overlapping intervals.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Times are minutes after midnight (see src.time_periods).
+# Postconditions: Edits touch only the intervals they overlap; every edit can be undone.
+#
+# Only assigned intervals are stored, in three parallel lists ordered by start
+# minute, so free time is always one merged run between neighbours. Finding the
+# intervals an edit overlaps is a bisect, O(log n); applying the edit (assign,
+# clear, move, undo, redo) is a list insert or delete, O(n) in the intervals
+# held. A day holds at most one interval per minute, so n <= 1440 and the shift
+# is a single memmove of well under a microsecond. The slot-dict view the menu
+# prints is built on demand.
+
+from bisect import bisect_left, bisect_right
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.time_periods import minutes_to_time
+
+
+class Interval(NamedTuple):
+    start: int
+    end: int
+    task_id: int
+    task_name: str
+
+
+class IntervalSchedule:
+    """Assigned intervals of one day between start and end, with undo/redo."""
+
+    def __init__(self, start:int, end:int, slot_minutes:int = 30):
+        if start >= end:
+            raise ValueError("Start time must be before end time.")
+        self.start = start
+        self.end = end
+        self.slot_minutes = slot_minutes
+        self._starts = []     # sorted start minutes
+        self._ends = []
+        self._tasks = []      # (task_id, task_name)
+        self._undo = []       # each edit: [('add'|'remove', Interval), ...]
+        self._redo = []
+
+    @classmethod
+    def from_slots(cls, time_slots, start:int, end:int, slot_minutes:int = 30):
+        """Build from slot dicts (as generate_time_slots returns); adjacent slots of a task merge."""
+        from src.schedule_repo import coalesce_slots
+        names = {slot['task_id']: slot['task_name'] for slot in time_slots}
+        day = cls(start, end, slot_minutes)
+        for task_id, block_start, block_end in coalesce_slots(time_slots):
+            day._add(Interval(block_start, block_end, task_id, names[task_id]))
+        return day
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __iter__(self):
+        for i in range(len(self._starts)):
+            yield self._interval(i)
+
+    def _interval(self, i) -> Interval:
+        return Interval(self._starts[i], self._ends[i], *self._tasks[i])
+
+    # --- raw edits (no undo bookkeeping): bisect to find, list shift to apply ---
+
+    def _add(self, interval:Interval):
+        i = bisect_left(self._starts, interval.start)
+        self._starts.insert(i, interval.start)
+        self._ends.insert(i, interval.end)
+        self._tasks.insert(i, (interval.task_id, interval.task_name))
+
+    def _remove(self, interval:Interval):
+        i = bisect_left(self._starts, interval.start)
+        del self._starts[i], self._ends[i], self._tasks[i]
+
+    def _apply(self, edit, undo=False):
+        steps = reversed(edit) if undo else edit
+        for action, interval in steps:
+            if (action == 'add') != undo:
+                self._add(interval)
+            else:
+                self._remove(interval)
+
+    def _commit(self, edit):
+        self._apply(edit)
+        self._undo.append(edit)
+        self._redo.clear()
+
+    # --- lookups ---
+
+    def overlapping(self, start:int, end:int) -> List[Interval]:
+        """Assigned intervals that share any minute with start..end."""
+        lo = bisect_right(self._starts, start) - 1
+        if lo < 0 or self._ends[lo] <= start:
+            lo += 1
+        hi = bisect_left(self._starts, end)
+        return [self._interval(i) for i in range(lo, hi)]
+
+    def at(self, minute:int) -> Optional[Interval]:
+        """The assigned interval covering minute, if any."""
+        found = self.overlapping(minute, minute + 1)
+        return found[0] if found else None
+
+    def free_runs(self) -> List[Tuple[int, int]]:
+        """Unassigned (start, end) runs, neighbouring free time already merged."""
+        runs = []
+        cursor = self.start
+        for start, end in zip(self._starts, self._ends):
+            if start > cursor:
+                runs.append((cursor, start))
+            cursor = max(cursor, end)
+        if cursor < self.end:
+            runs.append((cursor, self.end))
+        return runs
+
+    # --- edits ---
+
+    def assign(self, start:int, task) -> List[Interval]:
+        """Put a task (id, name, duration, ...) at start; returns the assignments it replaced.
+
+        Raises ValueError when it does not fit inside the day.
+        """
+        task_id, name, duration, *_ = task
+        end = start + duration
+        if start < self.start or end > self.end:
+            raise ValueError(f"Task '{name}' ({duration} minutes) does not fit between the schedule start and end.")
+        replaced = self.overlapping(start, end)
+        self._commit([('remove', old) for old in replaced] + [('add', Interval(start, end, task_id, name))])
+        return replaced
+
+    def clear(self, minute:int) -> Optional[Interval]:
+        """Unassign whatever covers minute; returns it (None if the time was free)."""
+        interval = self.at(minute)
+        if interval is not None:
+            self._commit([('remove', interval)])
+        return interval
+
+    def move(self, minute:int, new_start:int) -> List[Interval]:
+        """Move the assignment covering minute so it starts at new_start, as one undoable edit.
+
+        Returns the other assignments it replaced.
+        """
+        interval = self.at(minute)
+        if interval is None:
+            raise ValueError("No task at that time.")
+        new_end = new_start + (interval.end - interval.start)
+        if new_start < self.start or new_end > self.end:
+            raise ValueError(f"Task '{interval.task_name}' does not fit there.")
+        moved = interval._replace(start=new_start, end=new_end)
+        replaced = [old for old in self.overlapping(new_start, new_end) if old != interval]
+        self._commit([('remove', interval)] + [('remove', old) for old in replaced] + [('add', moved)])
+        return replaced
+
+    def replace_all(self, intervals):
+        """Swap every assignment for the given (start, end, task_id, task_name) intervals, as one undoable edit"""
+        new = sorted(Interval(*interval) for interval in intervals)
+        for before, after in zip(new, new[1:]):
+            if after.start < before.end:
+                raise ValueError("Intervals overlap.")
+        if new and (new[0].start < self.start or new[-1].end > self.end):
+            raise ValueError("Intervals must lie between the schedule start and end.")
+        if new == list(self):
+            return
+        self._commit([('remove', old) for old in self] + [('add', interval) for interval in new])
+
+    def undo(self) -> bool:
+        if not self._undo:
+            return False
+        edit = self._undo.pop()
+        self._apply(edit, undo=True)
+        self._redo.append(edit)
+        return True
+
+    def redo(self) -> bool:
+        if not self._redo:
+            return False
+        edit = self._redo.pop()
+        self._apply(edit)
+        self._undo.append(edit)
+        return True
+
+    # --- views ---
+
+    def grid(self, names:dict = None):
+        """The day as a compact SlotGrid, at the coarsest resolution that holds every assignment"""
+        from src.slot_grid import SlotGrid
+        names = {} if names is None else names
+        names.update(self._tasks)
+        return SlotGrid.from_blocks([(task_id, start, end) for start, end, (task_id, _) in
+                                     zip(self._starts, self._ends, self._tasks)], self.start, self.end, names)
+
+    def slots(self):
+        """Slot dicts for display and saving: one per assignment, free runs cut into slot_minutes pieces."""
+        step = self.slot_minutes
+        pieces = [(start, end, None, None) for run_start, run_end in self.free_runs()
+                  for start, end in ((m, min(m + step, run_end)) for m in range(run_start, run_end, step))]
+        pieces += [(start, end, task_id, name)
+                   for start, end, (task_id, name) in zip(self._starts, self._ends, self._tasks)]
+        pieces.sort()
+        return [
+            {
+                'start': minutes_to_time(start),
+                'end': minutes_to_time(end),
+                'task_id': task_id,
+                'task_name': name
+            }
+            for start, end, task_id, name in pieces
+        ]
@@ -3,17 +3,26 @@
 # Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
 # Created: 2025-11-05
 
-from datetime import datetime, time, timedelta
-from src.db import get_connection
+from datetime import time
 from src.task_repo import TaskRepo
+from src.schedule_repo import ScheduleRepo
+from src.interval_schedule import IntervalSchedule
+from src.slot_grid import SlotGrid
+from src.breaks import BreakPolicy, default_break_policy, insert_breaks
+from src.time_periods import time_to_minutes, minutes_to_time, parse_hhmm, format_hhmm
+from src.user_repo import UserRepo, validate_slot_minutes
 
 class ManualScheduler:
-    def __init__(self, user_id:int):
+    def __init__(self, user_id:int, repo:TaskRepo = None, slot_minutes:int = None):
         self.user_id = user_id
-        self.repo = TaskRepo(user_id=user_id)
+        self.repo = repo or TaskRepo(user_id=user_id)
         self.default_start = time(8, 0)    # default: 8:00 AM
         self.default_end = time(22, 0)     # default: 10:00 PM
-        self.time_slot_duration = 30        # 30 min intervals
+        # length of the free slots offered to pick from (the user's setting, 30 min by default);
+        # assignments always take exactly the task's duration
+        if slot_minutes is None:
+            slot_minutes = UserRepo(user_id).get_slot_settings().slot_minutes
+        self.time_slot_duration = validate_slot_minutes(slot_minutes)
         # current boundaries start as default
         self.schedule_start = self.default_start
         self.schedule_end = self.default_end
@@ -22,95 +31,74 @@ class ManualScheduler:
         """Set custom schedule boundaries"""
         # if user left either input blank, use original defaults
         if not start_time:
-            start_time = self.default_start.strftime('%H:%M')
+            start_time = format_hhmm(time_to_minutes(self.default_start))
         if not end_time:
-            end_time = self.default_end.strftime('%H:%M')
+            end_time = format_hhmm(time_to_minutes(self.default_end))
 
 
         try:
-            new_start = datetime.strptime(start_time, '%H:%M').time()
-            new_end = datetime.strptime(end_time, '%H:%M').time()
+            new_start = parse_hhmm(start_time)
+            new_end = parse_hhmm(end_time)
         except ValueError:
             print("Invalid time format. Use HH:MM (24-hour format).")
             return False
         
         # start must be before end
-        if datetime.combine(datetime.today(), new_start) >= datetime.combine(datetime.today(), new_end):
+        if new_start >= new_end:
             print("Start time must be before end time.")
             return False
         
-        self.schedule_start = new_start
-        self.schedule_end = new_end
+        self.schedule_start = minutes_to_time(new_start)
+        self.schedule_end = minutes_to_time(new_end)
         return True
     
     def generate_time_slots(self):
         """Generate time slots from start to end time"""
-        slots = []
-        # create datetime object using today's date and the schedule start/end time -- needed to do time arithmetic
-        curr_time = datetime.combine(datetime.today(), self.schedule_start)
-        end_datetime = datetime.combine(datetime.today(), self.schedule_end)
-
-        while curr_time < end_datetime:
-            slot_end = curr_time + timedelta(minutes=self.time_slot_duration) # add time slot duration to the current time
-            # prevents creating partial slots & breaks out of loop
-            if slot_end > end_datetime:
-                break
-            # append slot data
-            slots.append({
-                'start': curr_time.time(),
-                'end': slot_end.time(),
-                'task_id': None,
-                'task_name': None
-            })
-            curr_time = slot_end # make curr_time the slot_end to move forward
-        return slots
+        # work in minutes after midnight -- plain integer arithmetic
+        start = time_to_minutes(self.schedule_start)
+        end = time_to_minutes(self.schedule_end)
+        return self._empty_slots(start, end)
+
+    def _empty_slots(self, start:int, end:int):
+        """Unassigned whole slots covering minutes start..end (partial slots are dropped)"""
+        step = self.time_slot_duration
+        end = start + (end - start) // step * step
+        if end <= start:
+            return []
+        return SlotGrid(start, end, step).slots(step, periods=False)
     
+    def new_day(self) -> IntervalSchedule:
+        """Empty interval schedule between the current boundaries"""
+        return IntervalSchedule(time_to_minutes(self.schedule_start), time_to_minutes(self.schedule_end),
+                                self.time_slot_duration)
+
+    def new_horizon(self, horizon) -> list:
+        """One empty interval schedule per DayWindow of a horizon (see src.horizon), with its own boundaries"""
+        return [IntervalSchedule(window.start, window.end, self.time_slot_duration) for window in horizon]
+
     def assign_task(self, time_slots, slot_idx, task):
-        """Assign a task to a specific time slot"""
+        """Assign a task to a specific time slot (slot-list API; the menu edits an IntervalSchedule)"""
         task_id, name, duration, *_ = task
-        
-        # compute new end datetime for task
-        slot_start_time = time_slots[slot_idx]['start']
-        slot_start_datetime = datetime.combine(datetime.today(), slot_start_time)
-        new_end_datetime = slot_start_datetime + timedelta(minutes=duration)
-        schedule_end_datetime = datetime.combine(datetime.today(), self.schedule_end)
-
-        # check if task fits in schedule
-        if new_end_datetime > schedule_end_datetime:
-            print(f"Task '{name}' ({duration} minutes) exceeds schedule end time!")
+        start = time_to_minutes(time_slots[slot_idx]['start'])
+        day = IntervalSchedule.from_slots(time_slots, time_to_minutes(self.schedule_start),
+                                          time_to_minutes(self.schedule_end), self.time_slot_duration)
+        if not self._assign(day, start, task):
             return time_slots
-        
-        new_slots = time_slots[:slot_idx]  # slots before the assigned slot
-
-        # add adjusted slot for task
-        new_slots.append({
-            'start': slot_start_time,
-            'end': new_end_datetime.time(),
-            'task_id': task_id,
-            'task_name': name
-        })
-
-        # notify if this overwrites existing future assignments
-        overwritten = [s for s in time_slots[slot_idx+1:] if s.get('task_id')]
-        if overwritten:
-            print("Warning: This assignment clears later tasks that overlap with the new timing.")
-
-        # generate remaining slots after task assignment
-        curr = new_end_datetime
-        while curr < schedule_end_datetime:
-            slot_end = curr + timedelta(minutes=self.time_slot_duration)
-            if slot_end > schedule_end_datetime:
-                break
-            new_slots.append({
-                'start': curr.time(),
-                'end': slot_end.time(),
-                'task_id': None,
-                'task_name': None
-            })
-            curr = slot_end
-
-        return new_slots
-    
+        return day.slots()
+
+    def _assign(self, day, start, task):
+        """Assign on an IntervalSchedule, printing what happened; False if it didn't fit"""
+        try:
+            replaced = day.assign(start, task)
+        except ValueError:
+            print(f"Task '{task[1]}' ({task[2]} minutes) exceeds schedule end time!")
+            return False
+        # notify if this overwrites existing assignments
+        if replaced:
+            names = ", ".join(f"'{old.task_name}'" for old in replaced)
+            print(f"Warning: This assignment replaces {names}, which overlapped the new timing.")
+        return True
+
     def display_schedule_grid(self, available_tasks):
         """Display schedule grid with current assignments"""
         print("\n" + "="*70)
@@ -125,43 +113,25 @@ class ManualScheduler:
         
         # display selected tasks
         for task in selected_tasks:
-            task_id, name, duration = task
+            task_id, name, duration, *_ = task
             print(f'{task_id:2d}. {name} ({duration} minutes)')
 
         print("-"*70)
 
     def save_schedule(self, time_slots, schedule_name: str = "Manual Schedule"):
-        """Save manual schedule to database"""
+        """Save manual schedule (slot dicts or a SlotGrid) to database"""
         try:
-                with get_connection() as conn:
-                    # create schedule record
-                    cur = conn.execute(
-                        "INSERT INTO schedules (user_id, name, schedule_type, created_at) VALUES (?, ?, ?, datetime('now'))",
-                        (self.user_id, schedule_name, 'manual')
-                    )
-                    schedule_id = cur.lastrowid
-                    
-                    # save schedule items
-                    for slot in time_slots:
-                        if slot['task_id']:
-                            conn.execute(
-                                """INSERT INTO schedule_items
-                                   (schedule_id, task_id, start_time, end_time)
-                                   VALUES (?, ?, ?, ?)""",
-                                   (schedule_id, slot['task_id'],
-                                    slot['start'].strftime('%H:%M'),
-                                    slot['end'].strftime('%H:%M'))
-                            )
-                    conn.commit()
-                    print(f"Schedule '{schedule_name}' saved successfully!")
-                    return True
+            # one transaction; back-to-back slots of a task are stored as one item
+            ScheduleRepo(self.user_id).save_schedule(time_slots, schedule_name, 'manual')
+            print(f"Schedule '{schedule_name}' saved successfully!")
+            return True
         except Exception as e:
             print(f'Error saving schedule: {e}')
             return False
 
-def run_manual_scheduler(user_id:int):
+def run_manual_scheduler(user_id:int, repo:TaskRepo = None, break_policy:BreakPolicy = None):
     """Main function to run the manual scheduler"""
-    scheduler = ManualScheduler(user_id)
+    scheduler = ManualScheduler(user_id, repo)
 
     print("\n" + "="*60)
     print("               MANUAL SCHEDULE BUILDER")
@@ -175,8 +145,29 @@ def run_manual_scheduler(user_id:int):
         print("No tasks selected. Select tasks first!")
         return
 
-    # Generate empty time slots
-    time_slots = scheduler.generate_time_slots()
+    # Empty day; assignments are kept as sorted intervals
+    day = scheduler.new_day()
+
+    def print_schedule(time_slots):
+        for i, slot in enumerate(time_slots, start=1):
+            start = slot['start'].strftime("%H:%M") # start time
+            end = slot['end'].strftime("%H:%M") # end time
+            task_name = slot['task_name'] or "-" # task name
+            print(f"{i:2d}. {start} - {end}: {task_name}")
+
+    def pick_slot(time_slots):
+        """Ask for a slot number; returns its start minute or None"""
+        slot_num = input("Enter time slot number: ").strip() # user input for slot number
+        if not slot_num.isdigit() or not 1 <= int(slot_num) <= len(time_slots):
+            print("Invalid slot number.")
+            return None
+        return time_to_minutes(time_slots[int(slot_num) - 1]['start'])
+
+    def print_tasks():
+        print("\nAvailable Tasks:")
+        for t in available_tasks:
+            task_id, name, duration, *_ = t
+            print(f"{task_id:2d}. {name} ({duration} minutes)")
 
     # Menu loop
     while True:
@@ -188,27 +179,23 @@ def run_manual_scheduler(user_id:int):
         print("5. Save Schedule")
         print("6. Change schedule time boundaries")
         print("7. Insert Breaks")
-        print("8. Quit")
+        print("8. Move a task")
+        print("9. Undo")
+        print("10. Redo")
+        print("11. Quit")
 
         choice = input("> ").strip().lower()
 
         if choice == '1':
             """View tasks"""
 
-            print("\nAvailable Tasks:")
-            for t in available_tasks:
-                task_id, name, duration, *_ = t
-                print(f"{task_id:2d}. {name} ({duration} minutes)")
+            print_tasks()
 
         elif choice == '2':
             """View schedule"""
 
             print("\nCurrent Schedule:")
-            for i, slot in enumerate(time_slots, start=1):
-                start = slot['start'].strftime("%H:%M")
-                end = slot['end'].strftime("%H:%M")
-                task_name = slot['task_name'] or "-"
-                print(f"{i:2d}. {start} - {end}: {task_name}")
+            print_schedule(day.slots())
 
         elif choice == '3':
             """Assign a task to a time slot"""
@@ -217,76 +204,48 @@ def run_manual_scheduler(user_id:int):
             print("\nAssign a task to a time slot")
 
             print("\nCurrent Schedule:")
-            for i, slot in enumerate(time_slots, start=1):
-                start = slot['start'].strftime("%H:%M")
-                end = slot['end'].strftime("%H:%M")
-                task_name = slot['task_name'] or "-"
-                print(f"{i:2d}. {start} - {end}: {task_name}")
-
-            slot_num = input("Enter time slot number: ").strip()
+            time_slots = day.slots()
+            print_schedule(time_slots)
 
-            print("\nAvailable Tasks:")
-            for t in available_tasks:
-                task_id, name, duration, *_ = t
-                print(f"{task_id:2d}. {name} ({duration} minutes)")
+            start = pick_slot(time_slots)
+            if start is None:
+                continue
 
+            print_tasks()
             task_num = input("Enter task ID to assign: ").strip()
 
-            if not (slot_num.isdigit() and task_num.isdigit()):
+            if not task_num.isdigit():
                 print("Invalid input. Enter numeric values.")
                 continue
 
-            slot_idx = int(slot_num) - 1
-            task_id = int(task_num)
-
-            if slot_idx < 0 or slot_idx >= len(time_slots):
-                print("Invalid slot number.")
-                continue
-
-            task = next((t for t in available_tasks if t[0] == task_id), None)
+            task = next((t for t in available_tasks if t[0] == int(task_num)), None)
             if not task:
                 print("Invalid task ID.")
                 continue
-            
-            # assign + rebuild slots based on task duration
-            time_slots = scheduler.assign_task(time_slots, slot_idx, task)
-            assigned = time_slots[slot_idx]
-            print(f"Assigned '{assigned['task_name']}' to slot {assigned['start'].strftime('%H:%M')} - {assigned['end'].strftime('%H:%M')}")
+
+            # only the assignments the task overlaps are touched
+            if scheduler._assign(day, start, task):
+                assigned = day.at(start)
+                print(f"Assigned '{assigned.task_name}' to slot {format_hhmm(assigned.start)} - {format_hhmm(assigned.end)}")
 
         elif choice == '4':
             """Clear a slot on the schedule"""
 
             # print current schedule
             print("\n Current Schedule:")
-            for i, slot in enumerate(time_slots, start=1):
-                start = slot['start'].strftime("%H:%M") # start time
-                end = slot['end'].strftime("%H:%M") # end time
-                task_name = slot['task_name'] or "-" # task name
-                print(f"{i:2d}. {start} - {end}: {task_name}")
-
-            slot_num = input("Enter time slot number: ").strip() # user input for slot number
-
-            # checks if slot num is a digit
-            if slot_num.isdigit():
-                slot_idx = int(slot_num) - 1
-
-                # checks if slot num is a valid time slot
-                if 0 <= slot_idx < len(time_slots):
-
-                    # checks if time slot is currently assigned to a task
-                    if time_slots[slot_idx]['task_name']:
-                        cleared_task = time_slots[slot_idx]['task_name'] # store cleared task for confirmation msg
-                        # reset task_id and task_name to None to clear time slot
-                        time_slots[slot_idx]['task_id'] = None
-                        time_slots[slot_idx]['task_name'] = None
-                        print(f"Cleared '{cleared_task}' from slot {slot_num}")
-                    else:
-                        print("Slot is already empty")
-
-                else:
-                    print("Invalid slot number")
+            time_slots = day.slots()
+            print_schedule(time_slots)
+
+            start = pick_slot(time_slots)
+            if start is None:
+                continue
+
+            # freed time merges with the free time around it
+            cleared = day.clear(start)
+            if cleared:
+                print(f"Cleared '{cleared.task_name}' from {format_hhmm(cleared.start)} - {format_hhmm(cleared.end)}")
             else:
-                print("Please enter a valid number")
+                print("Slot is already empty")
 
         elif choice == '5':
             """Save the schedule"""
@@ -297,7 +256,7 @@ def run_manual_scheduler(user_id:int):
             # default name
             if not name:
                 name = "Manual Schedule"
-            if scheduler.save_schedule(time_slots, name):
+            if scheduler.save_schedule(day.grid(), name):
                 print("Schedule saved!")
             else:
                 print("Failed to save schedule.")
@@ -308,37 +267,56 @@ def run_manual_scheduler(user_id:int):
             start = input("Enter new start time (HH:MM): ")
             end = input("Enter new end time (HH:MM): ")
             if scheduler.set_time_boundaries(start, end):
-                time_slots = scheduler.generate_time_slots()
+                day = scheduler.new_day()
                 print("Updated schedule boundaries!")
             else:
                 print("Failed to update time boundaries. Please use HH:MM format.")
         elif choice == '7':
             """Insert Breaks"""
 
-            for i in range(len(time_slots)-2):
-                if (time_slots[i]['task_id'] !=1 and time_slots[i+1]['task_id']!=1):
-                        if (time_slots[i]['task_id'] and time_slots[i+1]['task_id']):
-                            if (time_slots[i+2]['task_id'] == None):
-                                
-                                task_id = int(time_slots[i+1]['task_id'])
-                                task = next((t for t in available_tasks if t[0] == task_id), None)
-                                time_slots[i+1]['task_id'] = None
-                                time_slots[i+1]['task_name'] = None
-                                break_task = next((t for t in available_tasks if t[0] == 1), None)
-                                time_slots=scheduler.assign_task(time_slots,i+1,break_task)
-                                time_slots=scheduler.assign_task(time_slots,i+2,task)
-                                
-                                print("Inserted breaks")
-                        
+            policy = break_policy or default_break_policy(scheduler.repo.list_tasks())
+            if policy is None:
+                print("No break task. Add a task named 'Break' or choose one in Break Settings.")
+                continue
 
+            # one pass over the day; applied as a single undoable edit
+            intervals, dropped = insert_breaks(day, policy, day.end)
+            added = len(intervals) + len(dropped) - len(day)
+            day.replace_all(intervals)
+            print(f"Inserted {added} break(s) after every {policy.max_work_minutes} minutes of work.")
+            for old in dropped:
+                print(f"Warning: '{old.task_name}' no longer fits before the schedule end and was removed.")
 
         elif choice == '8':
+            """Move a task to another start time"""
+
+            print("\nCurrent Schedule:")
+            time_slots = day.slots()
+            print_schedule(time_slots)
+            start = pick_slot(time_slots)
+            if start is None:
+                continue
+            new_start = input("New start time (HH:MM): ").strip()
+            try:
+                replaced = day.move(start, parse_hhmm(new_start))
+            except ValueError as e:
+                print(f"Error: {e}")
+                continue
+            if replaced:
+                names = ", ".join(f"'{old.task_name}'" for old in replaced)
+                print(f"Warning: The move replaced {names}.")
+            print("Task moved.")
+
+        elif choice == '9':
+            print("Undone." if day.undo() else "Nothing to undo.")
+
+        elif choice == '10':
+            print("Redone." if day.redo() else "Nothing to redo.")
+
+        elif choice == '11':
             """Exit manual scheduler"""
             print("Exiting manual scheduler...")
             break
 
         else:
             print("Invalid option. Try again.")
-
-        
-
@@ -0,0 +1,124 @@
+# File: src/occupancy.py
+# Description: Days x minutes occupancy matrix for multi-day planning (NumPy when installed).
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: One (start, end) window per day, in minutes after midnight (end <= 1440).
+# Postconditions: Each cell holds the task id using that minute, FREE, or BLOCKED outside the window.
+#
+# With NumPy the matrix is one int32 array, so checking a recurring task
+# against all of its days, finding every free run and per-day utilisation are
+# single array operations over the whole horizon. NumPy is optional: without
+# it each day is an array('i') row and the same methods loop over the days.
+
+from array import array
+from itertools import groupby
+
+try:
+    import numpy as np
+except ImportError:     # optional dependency (requirements.txt); rows of array('i') instead
+    np = None
+
+from src.time_periods import MINUTES_PER_DAY
+
+FREE = 0
+BLOCKED = -1
+
+
+class Occupancy:
+    """Task id per minute of every day in a horizon"""
+
+    def __init__(self, windows, use_numpy:bool = None):
+        self.windows = [tuple(window) for window in windows]    # (start, end) per day
+        self.days = len(self.windows)
+        self.numpy = np is not None and use_numpy is not False
+        if self.numpy:
+            self.matrix = np.full((self.days, MINUTES_PER_DAY), BLOCKED, dtype=np.int32)
+            for day, (start, end) in enumerate(self.windows):
+                self.matrix[day, start:end] = FREE
+        else:
+            self.matrix = []
+            for start, end in self.windows:
+                row = array('i', [BLOCKED]) * MINUTES_PER_DAY
+                row[start:end] = array('i', [FREE]) * max(end - start, 0)
+                self.matrix.append(row)
+
+    # --- checks ---
+
+    def is_free(self, day:int, start:int, end:int) -> bool:
+        """True when every minute start..end of day is free (outside the window counts as taken)"""
+        if not 0 <= start < end <= MINUTES_PER_DAY:
+            return False
+        if self.numpy:
+            return not self.matrix[day, start:end].any()
+        return self.matrix[day][start:end].count(FREE) == end - start
+
+    def free_days(self, days, start:int, end:int):
+        """The days (in the order given) on which start..end is free, checked all at once"""
+        days = list(days)
+        if not days or not 0 <= start < end <= MINUTES_PER_DAY:
+            return []
+        if self.numpy:
+            rows = np.asarray(days, dtype=np.intp)
+            taken = self.matrix[rows, start:end].any(axis=1)
+            return rows[~taken].tolist()
+        return [day for day in days if self.is_free(day, start, end)]
+
+    def task_at(self, day:int, minute:int):
+        """Task id using minute on day, or None"""
+        value = int(self.matrix[day][minute])
+        return value if value > FREE else None
+
+    # --- edits ---
+
+    def occupy(self, day:int, start:int, end:int, task_id:int):
+        """Give start..end of day to task_id"""
+        self.occupy_days([day], start, end, task_id)
+
+    def occupy_days(self, days, start:int, end:int, task_id:int):
+        """Give start..end to task_id on every day in days"""
+        days = list(days)
+        if not days or start >= end:
+            return
+        if self.numpy:
+            self.matrix[np.asarray(days, dtype=np.intp), start:end] = task_id
+            return
+        block = array('i', [task_id]) * (end - start)
+        for day in days:
+            self.matrix[day][start:end] = block
+
+    def release(self, day:int, start:int, end:int):
+        """Free start..end of day again"""
+        self.occupy_days([day], start, end, FREE)
+
+    # --- stats ---
+
+    def free_runs(self, min_minutes:int = 1):
+        """(day, start, end) of every free run at least min_minutes long, in day then time order"""
+        if self.numpy:
+            free = np.zeros((self.days, MINUTES_PER_DAY + 2), dtype=np.int8)
+            free[:, 1:-1] = self.matrix == FREE
+            edges = np.diff(free, axis=1)          # 1 where a run starts, -1 where it has ended
+            starts = np.argwhere(edges == 1)
+            ends = np.argwhere(edges == -1)[:, 1]
+            keep = ends - starts[:, 1] >= min_minutes
+            return [tuple(run) for run in np.column_stack((starts[keep], ends[keep])).tolist()]
+        runs = []
+        for day, row in enumerate(self.matrix):
+            minute = 0
+            for value, group in groupby(row):
+                length = sum(1 for _ in group)
+                if value == FREE and length >= min_minutes:
+                    runs.append((day, minute, minute + length))
+                minute += length
+        return runs
+
+    def busy_minutes(self):
+        """Minutes given to tasks, per day"""
+        if self.numpy:
+            return (self.matrix > FREE).sum(axis=1).tolist()
+        return [len(row) - row.count(FREE) - row.count(BLOCKED) for row in self.matrix]
+
+    def utilisation(self):
+        """Share of each day's window given to tasks (0.0 for an empty window)"""
+        return [busy / (end - start) if end > start else 0.0
+                for busy, (start, end) in zip(self.busy_minutes(), self.windows)]
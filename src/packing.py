@@ -0,0 +1,119 @@
+# File: src/packing.py
+# Description: Branch-and-bound packing of tasks into free gaps, within a wall-clock budget.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Item sizes and gap capacities are positive whole numbers of slots.
+# Postconditions: Returns the most valuable assignment found and how far it can be from the best.
+#
+# This is a multiple knapsack: every gap holds tasks back to back up to its
+# capacity and a task goes into at most one gap. The search is depth-first over
+# the items in value-per-slot order; each node either puts the next item into
+# a gap (gaps with the same room left are tried once) or leaves it out. The
+# bound of a node is the fractional knapsack over the items still to decide
+# and all the room left, and nodes that cannot beat the best assignment found
+# so far are cut. The same bound at the root is what `gap` is measured against,
+# so a search cut short by the budget still says how good its answer is.
+
+from time import perf_counter
+from typing import List, NamedTuple, Optional
+
+
+class PackResult(NamedTuple):
+    """Outcome of pack(): gap index per item (None = left out), or bins None when nothing beat floor"""
+    bins: Optional[List[Optional[int]]]
+    value: float
+    bound: float        # no assignment is worth more than this
+    nodes: int
+    seconds: float
+    complete: bool      # the search finished, so value is the best possible
+
+    @property
+    def gap(self) -> float:
+        """Share of the bound that value may be short of the best possible (0.0 when proven optimal)"""
+        if self.bound <= 0:
+            return 0.0
+        return max(self.bound - self.value, 0) / self.bound
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+def pack(sizes, values, capacities, budget:float = 0.25, floor:float = 0) -> PackResult:
+    """Assign items to gaps, maximising the total value of the items placed.
+
+    floor is a value already reached some other way (the greedy schedule);
+    only assignments worth more are looked for. The search stops after
+    budget seconds and returns the best it has.
+    """
+    began = perf_counter()
+    deadline = began + budget
+    largest = max(capacities, default=0)
+    order = sorted((i for i in range(len(sizes)) if 0 < sizes[i] <= largest and values[i] > 0),
+                   key=lambda i: (-values[i] / sizes[i], -sizes[i], i))
+    whole = all(float(values[i]).is_integer() for i in order)
+    remaining = list(capacities)
+    assigned = [None] * len(sizes)
+    best = {"value": floor, "bins": None}
+    nodes = 0
+
+    def bound(k, room, fits):
+        """Fractional knapsack over order[k:] into room slots (items larger than fits are out)"""
+        total = 0.0
+        for i in order[k:]:
+            size = sizes[i]
+            if size > fits:
+                continue
+            if size <= room:
+                room -= size
+                total += values[i]
+            else:
+                total += values[i] * room / size
+                break
+        return int(total + 1e-9) if whole else total
+
+    def search(k, value, room, skipped_twin):
+        """One node; yields the arguments of each child (run by the loop below, not recursion)"""
+        nonlocal nodes
+        nodes += 1
+        if not nodes & 63 and perf_counter() > deadline:
+            raise _OutOfTime
+        if value > best["value"]:
+            best["value"], best["bins"] = value, list(assigned)
+        if k == len(order) or room <= 0:
+            return
+        fits = max(remaining)
+        if value + bound(k, room, fits) <= best["value"]:
+            return
+        i = order[k]
+        size = sizes[i]
+        twin = k + 1 < len(order) and (sizes[order[k + 1]], values[order[k + 1]]) == (size, values[i])
+        if not skipped_twin and size <= fits:
+            tried = set()
+            for b, left in enumerate(remaining):
+                if left >= size and left not in tried:
+                    tried.add(left)     # gaps with the same room left lead to the same packings
+                    remaining[b] -= size
+                    assigned[i] = b
+                    yield k + 1, value + values[i], room - size, False
+                    remaining[b] += size
+                    assigned[i] = None
+        # leaving an item out: leave its identical twin out as well (placing it instead is the same packing)
+        yield k + 1, value, room, twin
+
+    root = bound(0, sum(capacities), largest)
+    complete = True
+    if root > floor:
+        # an explicit stack of nodes: a user may have more tasks than Python's recursion limit
+        stack = [search(0, 0, sum(capacities), False)]
+        try:
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    stack.pop()
+                else:
+                    stack.append(search(*child))
+        except _OutOfTime:
+            complete = False
+    bound = best["value"] if complete else max(root, best["value"])    # a finished search proves its value
+    return PackResult(best["bins"], best["value"], bound, nodes, perf_counter() - began, complete)
@@ -0,0 +1,194 @@
+# File: src/placement.py
+# Description: Free-time index used by the automatic scheduler to place tasks.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Slots are consecutive and labelled with their time period.
+# Postconditions: First-fit lookups and placements run in O(log n) per segment.
+#
+# Building an index costs O(1) per segment whatever its length: a new tree is
+# one all-free root, and nodes below it are filled in by the lazy push the
+# first time a lookup or edit walks through them. One-minute slots (1440 per
+# day) therefore cost little more to set up than thirty-minute ones.
+
+from itertools import groupby
+
+
+class FreeRunTree:
+    """Segment tree over a run of slots that tracks the longest free stretch.
+
+    Positions are offsets 0..size-1. Every node stores the free prefix, free
+    suffix and longest free run of its range, so the leftmost free run of a
+    given length can be found by walking a single root-to-leaf path.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        n = 4 * max(size, 1)
+        self.pre = [0] * n
+        self.suf = [0] * n
+        self.best = [0] * n
+        self.lazy = [None] * n   # None, True (all free) or False (all taken)
+        if size:
+            self._apply(1, 0, size - 1, True)   # children are filled in by _push when first visited
+
+    def _apply(self, node, lo, hi, free):
+        length = hi - lo + 1 if free else 0
+        self.pre[node] = self.suf[node] = self.best[node] = length
+        self.lazy[node] = free
+
+    def _push(self, node, lo, mid, hi):
+        free = self.lazy[node]
+        if free is not None:
+            self._apply(2 * node, lo, mid, free)
+            self._apply(2 * node + 1, mid + 1, hi, free)
+            self.lazy[node] = None
+
+    def _pull(self, node, lo, mid, hi):
+        left, right = 2 * node, 2 * node + 1
+        left_len, right_len = mid - lo + 1, hi - mid
+        pre, suf = self.pre, self.suf
+        pre[node] = pre[left] if pre[left] < left_len else left_len + pre[right]
+        suf[node] = suf[right] if suf[right] < right_len else right_len + suf[left]
+        self.best[node] = max(self.best[left], self.best[right], suf[left] + pre[right])
+
+    def _assign(self, node, lo, hi, start, end, free):
+        if end < lo or hi < start:
+            return
+        if start <= lo and hi <= end:
+            self._apply(node, lo, hi, free)
+            return
+        mid = (lo + hi) // 2
+        self._push(node, lo, mid, hi)
+        self._assign(2 * node, lo, mid, start, end, free)
+        self._assign(2 * node + 1, mid + 1, hi, start, end, free)
+        self._pull(node, lo, mid, hi)
+
+    def _longest(self, node, lo, hi, start, end):
+        """Return (prefix, suffix, best, length) of the free runs inside [start, end]."""
+        if start <= lo and hi <= end:
+            return self.pre[node], self.suf[node], self.best[node], hi - lo + 1
+        mid = (lo + hi) // 2
+        self._push(node, lo, mid, hi)
+        if end <= mid:
+            return self._longest(2 * node, lo, mid, start, end)
+        if start > mid:
+            return self._longest(2 * node + 1, mid + 1, hi, start, end)
+        lp, ls, lb, ln = self._longest(2 * node, lo, mid, start, end)
+        rp, rs, rb, rn = self._longest(2 * node + 1, mid + 1, hi, start, end)
+        return (
+            lp if lp < ln else ln + rp,
+            rs if rs < rn else rn + ls,
+            max(lb, rb, ls + rp),
+            ln + rn,
+        )
+
+    def _fit_from(self, node, lo, hi, start, length, run):
+        """Leftmost fit at or after start inside node's range.
+
+        run is the number of free offsets (all >= start) just before lo.
+        Returns (offset or None, free offsets >= start ending at hi).
+        """
+        if hi < start:
+            return None, 0
+        size = hi - lo + 1
+        if start <= lo:
+            if run + self.pre[node] >= length:
+                return lo - run, 0
+            if self.best[node] < length:
+                return None, self.suf[node] if self.suf[node] < size else run + size
+        mid = (lo + hi) // 2
+        self._push(node, lo, mid, hi)
+        found, run = self._fit_from(2 * node, lo, mid, start, length, run)
+        if found is not None:
+            return found, 0
+        return self._fit_from(2 * node + 1, mid + 1, hi, start, length, run)
+
+    def first_fit(self, length: int, start: int = 0):
+        """Return the lowest offset >= start beginning `length` free slots, or None."""
+        if length <= 0 or self.size == 0 or self.best[1] < length:
+            return None
+        if start > 0:
+            return self._fit_from(1, 0, self.size - 1, start, length, 0)[0]
+        node, lo, hi = 1, 0, self.size - 1
+        while lo != hi:
+            mid = (lo + hi) // 2
+            self._push(node, lo, mid, hi)
+            left = 2 * node
+            if self.best[left] >= length:
+                node, hi = left, mid
+            elif self.suf[left] + self.pre[left + 1] >= length:
+                return mid - self.suf[left] + 1
+            else:
+                node, lo = left + 1, mid + 1
+        return lo
+
+    def is_free(self, start: int, length: int) -> bool:
+        """Check whether offsets start..start+length-1 are all free."""
+        if length <= 0 or start < 0 or start + length > self.size:
+            return False
+        return self._longest(1, 0, self.size - 1, start, start + length - 1)[2] == length
+
+    def occupy(self, start: int, length: int):
+        """Mark offsets start..start+length-1 as taken."""
+        if length > 0:
+            self._assign(1, 0, self.size - 1, start, start + length - 1, False)
+
+    def release(self, start: int, length: int):
+        """Mark offsets start..start+length-1 as free again."""
+        if length > 0:
+            self._assign(1, 0, self.size - 1, start, start + length - 1, True)
+
+
+class PlacementIndex:
+    """Free-slot index over a day of slots, split into same-period segments.
+
+    A task may only occupy consecutive slots of one period, so every maximal run
+    of slots sharing a period gets its own FreeRunTree. Slot indexes passed in
+    and returned are positions in the original slot list.
+    """
+
+    def __init__(self, periods):
+        self.segments = []       # [start_idx, period, tree], in slot order
+        self.by_period = {}      # period -> its segments, in slot order
+        self.segment_of = []     # slot index -> segment
+        start = 0
+        for period, run in groupby(periods):
+            size = len(list(run))
+            segment = (start, period, FreeRunTree(size))
+            self.segments.append(segment)
+            self.by_period.setdefault(period, []).append(segment)
+            self.segment_of.extend([segment] * size)
+            start += size
+
+    def first_fit(self, period, length: int, align: int = 1):
+        """Return the first slot index starting `length` free slots in period, or None.
+
+        With align > 1 only slot indexes that are multiples of align may start the run.
+        """
+        for start, _, tree in self.by_period.get(period, ()):
+            offset = tree.first_fit(length)
+            while offset is not None and (start + offset) % align:
+                offset += -(start + offset) % align      # next allowed start
+                if tree.is_free(offset, length):
+                    break
+                offset = tree.first_fit(length, offset + 1)
+            if offset is not None:
+                return start + offset
+        return None
+
+    def can_place(self, start_idx: int, length: int) -> bool:
+        """Same rule as AutomaticScheduler.can_place_task: free and within one period."""
+        if start_idx < 0 or start_idx >= len(self.segment_of):
+            return False
+        start, _, tree = self.segment_of[start_idx]
+        return tree.is_free(start_idx - start, length)
+
+    def occupy(self, start_idx: int, length: int):
+        """Mark length slots from start_idx as taken."""
+        start, _, tree = self.segment_of[start_idx]
+        tree.occupy(start_idx - start, length)
+
+    def release(self, start_idx: int, length: int):
+        """Mark length slots from start_idx as free again."""
+        start, _, tree = self.segment_of[start_idx]
+        tree.release(start_idx - start, length)
@@ -0,0 +1,105 @@
+# File: src/schedule_cache.py
+# Description: Memoizes automatic schedules by a fingerprint of their inputs.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Migration 003 applied when persistence is enabled.
+# Postconditions: Unchanged inputs return the stored schedule without rebuilding.
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from src.db import get_connection
+
+
+def schedule_fingerprint(tasks, start_minute, end_minute, slot_minutes, extra=None):
+    """Stable hash of everything build_schedule's result depends on.
+
+    tasks are TaskRecords (only id, name, duration, type and fixed time are
+    used); extra is any further JSON-able setting that changes the result.
+    """
+    payload = [
+        [start_minute, end_minute, slot_minutes, extra],
+        sorted((t.id, t.name, t.duration, t.task_type or 'flexible', t.fixed_time or '') for t in tasks),
+    ]
+    encoded = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class ScheduleCache:
+    """LRU of built schedules keyed by fingerprint, optionally backed by SQLite.
+
+    Values are whatever JSON-able result the scheduler stores. With persist=True
+    results are also written to the schedule_cache table, so other processes
+    using the same database can reuse them.
+    """
+
+    def __init__(self, max_entries:int = 1024, persist:bool = False):
+        self.max_entries = max_entries
+        self.persist = persist
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # fingerprint -> (user_id, result)
+        self._lock = threading.Lock()
+
+    def get(self, user_id:int, fingerprint:str):
+        """Return the stored result for fingerprint, or None."""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None:
+                self._entries.move_to_end(fingerprint)
+                self.hits += 1
+                return entry[1]
+        if self.persist:
+            with get_connection() as conn:
+                row = conn.execute(
+                    "SELECT result FROM schedule_cache WHERE fingerprint=? AND user_id=?",
+                    (fingerprint, user_id)
+                ).fetchone()
+            if row:
+                result = json.loads(row[0])
+                self._remember(user_id, fingerprint, result)
+                with self._lock:
+                    self.hits += 1
+                return result
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, user_id:int, fingerprint:str, result):
+        """Store a result (in memory, and in SQLite when persisting)."""
+        self._remember(user_id, fingerprint, result)
+        if self.persist:
+            with get_connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO schedule_cache (fingerprint, user_id, result) VALUES (?, ?, ?)",
+                    (fingerprint, user_id, json.dumps(result, separators=(',', ':')))
+                )
+
+    def _remember(self, user_id, fingerprint, result):
+        with self._lock:
+            self._entries[fingerprint] = (user_id, result)
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id:int = None):
+        """Drop one user's schedules, or all of them when user_id is None."""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                for key in [k for k, (owner, _) in self._entries.items() if owner == user_id]:
+                    del self._entries[key]
+        if self.persist:
+            with get_connection() as conn:
+                if user_id is None:
+                    conn.execute("DELETE FROM schedule_cache")
+                else:
+                    conn.execute("DELETE FROM schedule_cache WHERE user_id=?", (user_id,))
+
+    def stats(self):
+        """Hit/miss counters and current in-memory size."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
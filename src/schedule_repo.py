@@ -0,0 +1,152 @@
+# File: src/schedule_repo.py
+# Description: Repository layer for saved schedules and their items.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Migrations 001-007 applied.
+# Postconditions: Schedules are saved in one transaction and read back without rebuilding.
+
+from typing import List, NamedTuple, Optional
+from src.db import get_connection
+from src.slot_grid import SlotGrid
+from src.time_periods import PERIOD_BY_MINUTE, format_hhmm, minutes_to_time, parse_hhmm, time_to_minutes
+
+class ScheduleRecord(NamedTuple):
+    """One row of the schedules table."""
+    id: int
+    user_id: int
+    name: str
+    schedule_type: str
+    created_at: str
+
+class ScheduleItem(NamedTuple):
+    """One saved block: a task from start to end ('HH:MM')."""
+    task_id: Optional[int]          # None once the task has been deleted
+    task_name: Optional[str]
+    start_time: str
+    end_time: str
+
+SCHEDULE_COLUMNS = "id, user_id, name, schedule_type, created_at"
+
+def coalesce_slots(time_slots):
+    """Collapse assigned slot dicts (or a SlotGrid) into (task_id, start_minute, end_minute) blocks.
+
+    Consecutive slots of the same task that touch are merged into one block;
+    empty slots are skipped.
+    """
+    if isinstance(time_slots, SlotGrid):
+        return time_slots.blocks()
+    blocks = []
+    assigned = sorted(
+        (time_to_minutes(slot['start']), time_to_minutes(slot['end']), slot['task_id'])
+        for slot in time_slots if slot['task_id']
+    )
+    for start, end, task_id in assigned:
+        if blocks and blocks[-1][0] == task_id and blocks[-1][2] == start:
+            blocks[-1][2] = end
+        else:
+            blocks.append([task_id, start, end])
+    return [tuple(block) for block in blocks]
+
+def slot_items(time_slots) -> List[ScheduleItem]:
+    """Slot dicts (or a SlotGrid) as ScheduleItems (one per back-to-back block), like load_items returns."""
+    if isinstance(time_slots, SlotGrid):
+        names = time_slots.names
+    else:
+        names = {slot['task_id']: slot['task_name'] for slot in time_slots}
+    return [ScheduleItem(task_id, names[task_id], format_hhmm(start), format_hhmm(end))
+            for task_id, start, end in coalesce_slots(time_slots)]
+
+def insert_schedule(conn, user_id:int, name:str, schedule_type:str, blocks) -> int:
+    """Insert a schedule row and its blocks on an open connection. Returns the schedule id."""
+    cur = conn.execute(
+        "INSERT INTO schedules (user_id, name, schedule_type, created_at) VALUES (?, ?, ?, datetime('now'))",
+        (user_id, name, schedule_type)
+    )
+    schedule_id = cur.lastrowid
+    conn.executemany(
+        "INSERT INTO schedule_items (schedule_id, task_id, start_time, end_time) VALUES (?, ?, ?, ?)",
+        [(schedule_id, task_id, format_hhmm(start), format_hhmm(end)) for task_id, start, end in blocks]
+    )
+    return schedule_id
+
+class ScheduleRepo:
+    """Data access class for the 'schedules' and 'schedule_items' tables."""
+
+    def __init__(self, user_id:int):
+        self.user_id = user_id
+
+    def save_schedule(self, time_slots, name:str, schedule_type:str = "manual") -> int:
+        """Save slot dicts (or a SlotGrid) as one schedule in a single transaction. Returns the schedule id."""
+        with get_connection() as conn:
+            return insert_schedule(conn, self.user_id, name, schedule_type, coalesce_slots(time_slots))
+
+    def list_schedules(self, limit:int = 20, before_id:Optional[int] = None) -> List[ScheduleRecord]:
+        """This user's schedules, newest first.
+
+        Pages are keyed on id: pass the last id of one page as before_id to get
+        the next one.
+        """
+        with get_connection() as conn:
+            if before_id is None:
+                cur = conn.execute(
+                    f"SELECT {SCHEDULE_COLUMNS} FROM schedules WHERE user_id=? ORDER BY id DESC LIMIT ?",
+                    (self.user_id, limit)
+                )
+            else:
+                cur = conn.execute(
+                    f"SELECT {SCHEDULE_COLUMNS} FROM schedules WHERE user_id=? AND id<? ORDER BY id DESC LIMIT ?",
+                    (self.user_id, before_id, limit)
+                )
+            return list(map(ScheduleRecord._make, cur))
+
+    def latest_schedule(self) -> Optional[ScheduleRecord]:
+        """This user's most recently saved schedule, or None."""
+        schedules = self.list_schedules(limit=1)
+        return schedules[0] if schedules else None
+
+    def get_schedule(self, schedule_id:int) -> Optional[ScheduleRecord]:
+        """One of this user's schedules by id, or None."""
+        with get_connection() as conn:
+            row = conn.execute(
+                f"SELECT {SCHEDULE_COLUMNS} FROM schedules WHERE id=? AND user_id=?",
+                (schedule_id, self.user_id)
+            ).fetchone()
+            return ScheduleRecord._make(row) if row else None
+
+    def load_items(self, schedule_id:int) -> List[ScheduleItem]:
+        """Items of one of this user's schedules, in start-time order."""
+        with get_connection() as conn:
+            cur = conn.execute(
+                """SELECT i.task_id, t.name, i.start_time, i.end_time
+                   FROM schedule_items i
+                   JOIN schedules s ON s.id = i.schedule_id
+                   LEFT JOIN tasks t ON t.id = i.task_id
+                   WHERE i.schedule_id=? AND s.user_id=?
+                   ORDER BY i.start_time""",
+                (schedule_id, self.user_id)
+            )
+            return list(map(ScheduleItem._make, cur))
+
+    def load_schedule(self, schedule_id:int):
+        """Saved schedule as slot dicts (start/end as datetime.time), ready for display."""
+        slots = []
+        for task_id, task_name, start_time, end_time in self.load_items(schedule_id):
+            start = parse_hhmm(start_time)
+            slots.append({
+                'start': minutes_to_time(start),
+                'end': minutes_to_time(parse_hhmm(end_time)),
+                'period': PERIOD_BY_MINUTE[start],
+                'task_id': task_id,
+                'task_name': task_name
+            })
+        return slots
+
+def latest_schedules() -> List[ScheduleRecord]:
+    """The most recent schedule of every user that has one."""
+    with get_connection() as conn:
+        cur = conn.execute(
+            f"""SELECT {SCHEDULE_COLUMNS} FROM schedules
+                WHERE id IN (SELECT MAX(id) FROM schedules GROUP BY user_id)
+                ORDER BY user_id"""
+        )
+        return list(map(ScheduleRecord._make, cur))
@@ -0,0 +1,412 @@
+# File: src/service.py
+# Description: Local HTTP/JSON service over TaskRepo, the automatic scheduler and saved schedules.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Database migrated (done on start-up).
+# Postconditions: Serves many clients from one process until interrupted.
+#
+# Usage: python -m src.service [--host 127.0.0.1] [--port 8581] [--workers 4]
+#                              [--max-concurrency 64] [--timeout 10] [--db PATH]
+#
+# Routes (all bodies and responses are JSON):
+#   GET    /health
+#   GET    /users/{uid}/tasks[?selected=1]        POST /users/{uid}/tasks
+#   GET    /users/{uid}/tasks/{tid}               PATCH / DELETE /users/{uid}/tasks/{tid}
+#   GET    /users/{uid}/conflicts
+#   POST   /users/{uid}/schedule                  {"start", "end", "save", "slot_minutes", "exact",
+#                                                  "strategy", "budget_ms", "objective", "candidates"}
+#                                                  all optional
+#   GET    /users/{uid}/schedules[?limit=&before=]
+#   GET    /users/{uid}/schedules/{sid|latest}
+#
+# SQLite work runs on a bounded thread pool; get_connection() keeps one
+# connection per pool thread. Identical schedule builds that overlap share
+# one build.
+
+import argparse
+import asyncio
+import json
+import re
+import sqlite3
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from src import db
+from src.automatic_scheduler import AutomaticScheduler
+from src.schedule_cache import ScheduleCache
+from src.schedule_repo import ScheduleRepo, slot_items
+from src.strategies import describe
+from src.task_repo import TaskCache, TaskRepo
+from src.user_repo import validate_slot_minutes
+
+DEFAULT_PORT = 8581
+MAX_BODY_BYTES = 1 << 20
+MAX_LINE_BYTES = 8192
+BUILD_OPTIONS = ("slot_minutes", "exact", "strategy", "budget_ms", "objective", "candidates")
+
+
+class HTTPError(Exception):
+    def __init__(self, status:int, message:str):
+        super().__init__(message)
+        self.status = status
+
+
+def _int_param(query, name, default=None):
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        return int(values[0])
+    except ValueError:
+        raise HTTPError(400, f"{name} must be an integer.")
+
+
+def _as_dict(record):
+    return record._asdict() if record is not None else None
+
+
+class SchedulerService:
+    """Routes requests to the repositories; blocking calls go to the thread pool."""
+
+    ROUTES = [
+        ("GET", r"/health", "health"),
+        ("GET", r"/users/(\d+)/tasks", "list_tasks"),
+        ("POST", r"/users/(\d+)/tasks", "create_task"),
+        ("GET", r"/users/(\d+)/tasks/(\d+)", "get_task"),
+        ("PATCH", r"/users/(\d+)/tasks/(\d+)", "update_task"),
+        ("DELETE", r"/users/(\d+)/tasks/(\d+)", "delete_task"),
+        ("GET", r"/users/(\d+)/conflicts", "conflicts"),
+        ("POST", r"/users/(\d+)/schedule", "build_schedule"),
+        ("GET", r"/users/(\d+)/schedules", "list_schedules"),
+        ("GET", r"/users/(\d+)/schedules/(\d+|latest)", "get_schedule"),
+    ]
+
+    def __init__(self, workers:int = 4, max_concurrency:int = 64, timeout:float = 10.0):
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scheduler-db")
+        self.task_cache = TaskCache()
+        self.schedule_cache = ScheduleCache()
+        self.stats = {"requests": 0, "builds": 0, "coalesced": 0, "timeouts": 0, "errors": 0}
+        self._routes = [(method, re.compile(pattern + r"/?"), name) for method, pattern, name in self.ROUTES]
+        self._inflight = {}   # (user_id, start, end) -> Future of a running build
+        self._limit = None
+        self._server = None
+
+    # --- lifecycle ---
+
+    async def start(self, host:str = "127.0.0.1", port:int = DEFAULT_PORT):
+        """Migrate, then listen. Returns the asyncio server (port 0 picks a free port)."""
+        self._limit = asyncio.Semaphore(self.max_concurrency)
+        await self._run(db.run_migrations)
+        self._server = await asyncio.start_server(self._handle_connection, host, port,
+                                                  limit=MAX_LINE_BYTES)
+        return self._server
+
+    @property
+    def port(self):
+        return self._server.sockets[0].getsockname()[1] if self._server else None
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self.executor.shutdown(wait=True)
+        db.close_connections()
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    # --- HTTP ---
+
+    async def _read_request(self, reader):
+        """(method, target, body, keep_alive), or None when the client has gone."""
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(400, "Malformed request line.")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = headers.get("content-length", "0")
+        if not length.isdigit():
+            raise HTTPError(400, "Bad Content-Length.")
+        if int(length) > MAX_BODY_BYTES:
+            raise HTTPError(413, "Request body too large.")
+        body = await reader.readexactly(int(length)) if int(length) else b""
+        keep_alive = (version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                      or headers.get("connection", "").lower() == "keep-alive")
+        return method.upper(), target, body, keep_alive
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, target, body, keep_alive = request
+                    status, payload = await self._respond(method, target, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+                    status, payload = 400, {"error": "Malformed request."}
+                data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method, target, body):
+        """Run one request under the concurrency limit and timeout; returns (status, payload)."""
+        self.stats["requests"] += 1
+        try:
+            return 200, await asyncio.wait_for(self._limited(method, target, body), self.timeout)
+        except asyncio.TimeoutError:
+            # the pool thread may still finish the work; the client just stops waiting
+            self.stats["timeouts"] += 1
+            return 504, {"error": f"Request took longer than {self.timeout}s."}
+        except HTTPError as e:
+            return e.status, {"error": str(e)}
+        except (ValueError, sqlite3.IntegrityError) as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            self.stats["errors"] += 1
+            traceback.print_exc(file=sys.stderr)
+            return 500, {"error": f"Internal error: {e.__class__.__name__}"}
+
+    async def _limited(self, method, target, body):
+        async with self._limit:
+            return await self.dispatch(method, target, body)
+
+    async def dispatch(self, method, target, body=b""):
+        """Route one request; returns the JSON-able result or raises HTTPError."""
+        url = urlsplit(target)
+        allowed = False
+        for route_method, pattern, name in self._routes:
+            match = pattern.fullmatch(url.path)
+            if match:
+                allowed = True
+                if route_method == method:
+                    data = json.loads(body) if body else {}
+                    if not isinstance(data, dict):
+                        raise HTTPError(400, "Body must be a JSON object.")
+                    return await getattr(self, "_" + name)(*match.groups(), query=parse_qs(url.query), data=data)
+        if allowed:
+            raise HTTPError(405, f"{method} not allowed on {url.path}.")
+        raise HTTPError(404, f"No route for {url.path}.")
+
+    # --- handlers ---
+
+    def _repo(self, user_id):
+        return TaskRepo(int(user_id), cache=self.task_cache, schedule_cache=self.schedule_cache)
+
+    def _changed(self, user_id):
+        """A task changed: later schedule requests must not join a build started before it."""
+        for key in [key for key in self._inflight if key[0] == int(user_id)]:
+            del self._inflight[key]
+
+    async def _health(self, query, data):
+        return {"status": "ok", "workers": self.workers, **self.stats}
+
+    async def _list_tasks(self, user_id, query, data):
+        repo = self._repo(user_id)
+        fn = repo.get_selected_tasks if _int_param(query, "selected", 0) else repo.list_tasks
+        return [task._asdict() for task in await self._run(fn)]
+
+    def _create_task_sync(self, user_id, data):
+        if data.get("task_type") == "fixed" and not data.get("fixed_time"):
+            raise HTTPError(400, "A fixed task needs a fixed_time.")
+        repo = self._repo(user_id)
+        task_id = repo.add_task(data.get("name"), data.get("duration"))
+        try:
+            if data.get("task_type", "flexible") != "flexible" or data.get("fixed_time"):
+                repo.set_task_type(task_id, data.get("task_type", "fixed"), data.get("fixed_time", ""))
+        except ValueError:
+            repo.delete_task(task_id)   # don't leave a half-made task behind
+            raise
+        if data.get("selected"):
+            repo.set_selected([task_id])
+        return repo.get_task(task_id)
+
+    async def _create_task(self, user_id, query, data):
+        try:
+            return _as_dict(await self._run(self._create_task_sync, user_id, data))
+        finally:
+            self._changed(user_id)
+
+    async def _get_task(self, user_id, task_id, query, data):
+        task = await self._run(self._repo(user_id).get_task, int(task_id))
+        if task is None:
+            raise HTTPError(404, "No such task for this user.")
+        return task._asdict()
+
+    def _update_task_sync(self, user_id, task_id, data):
+        repo = self._repo(user_id)
+        if repo.get_task(task_id) is None:
+            raise HTTPError(404, "No such task for this user.")
+        if "task_type" in data or "fixed_time" in data:
+            repo.set_task_type(task_id, data.get("task_type", "fixed"), data.get("fixed_time") or "")
+        if "selected" in data:
+            repo.set_selected([task_id], bool(data["selected"]))
+        return repo.get_task(task_id)
+
+    async def _update_task(self, user_id, task_id, query, data):
+        try:
+            return _as_dict(await self._run(self._update_task_sync, user_id, int(task_id), data))
+        finally:
+            self._changed(user_id)
+
+    async def _delete_task(self, user_id, task_id, query, data):
+        try:
+            deleted = await self._run(self._repo(user_id).delete_task, int(task_id))
+        finally:
+            self._changed(user_id)
+        if not deleted:
+            raise HTTPError(404, "No such task for this user.")
+        return {"deleted": int(task_id)}
+
+    async def _conflicts(self, user_id, query, data):
+        return await self._run(self._repo(user_id).detect_fixed_task_conflict_groups)
+
+    def _build_sync(self, user_id, start, end, options):
+        scheduler = AutomaticScheduler(user_id, self._repo(user_id), self.schedule_cache,
+                                       slot_minutes=options.get("slot_minutes"), exact=options.get("exact"))
+        scheduler.quiet = True
+        if start and not scheduler.set_time_boundaries(start, end):
+            raise ValueError("Invalid start/end (HH:MM AM/PM, at least 1 hour apart).")
+        if options.get("strategy"):
+            budget = options.get("budget_ms")
+            # a portfolio races its candidates inside this request's thread: no processes forked from the service
+            scheduler.set_strategy(options["strategy"], None if budget is None else budget / 1000, options.get("objective"),
+                                   candidates=options.get("candidates"), workers=1)
+        return scheduler.build_grid(), scheduler.unscheduled_tasks, scheduler.last_search
+
+    async def build(self, user_id:int, start=None, end=None, **options):
+        """(SlotGrid or None, unscheduled, strategy report or None) for a user.
+
+        options are slot_minutes, exact, strategy, budget_ms, objective and candidates (None: the default).
+        Concurrent identical requests share one build.
+        """
+        key = (user_id, start, end, tuple(sorted(options.items())))
+        future = self._inflight.get(key)
+        if future is None:
+            self.stats["builds"] += 1
+            future = asyncio.ensure_future(self._run(self._build_sync, user_id, start, end, options))
+            self._inflight[key] = future
+
+            def forget(done, key=key):
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+            future.add_done_callback(forget)
+        else:
+            self.stats["coalesced"] += 1
+        # shield: one caller timing out must not cancel the build the others wait on
+        return await asyncio.shield(future)
+
+    async def _build_schedule(self, user_id, query, data):
+        # these go into the build's cache key, so they must be plain (hashable) text
+        for name in ("start", "end", "strategy", "objective", "save"):
+            if data.get(name) is not None and not isinstance(data[name], str):
+                raise HTTPError(400, f"{name} must be text.")
+        start, end = data.get("start"), data.get("end")
+        if bool(start) != bool(end):
+            raise HTTPError(400, "start and end must be given together.")
+        options = {name: data.get(name) for name in BUILD_OPTIONS}
+        if options["slot_minutes"] is not None:
+            validate_slot_minutes(options["slot_minutes"])
+        if options["exact"] is not None and not isinstance(options["exact"], bool):
+            raise HTTPError(400, "exact must be true or false.")
+        budget = options["budget_ms"]
+        if budget is not None and (not isinstance(budget, int) or not 0 < budget < self.timeout * 1000):
+            raise HTTPError(400, "budget_ms must be a positive whole number below the request timeout.")
+        if options["candidates"] is not None:
+            if not isinstance(options["candidates"], list) or not all(isinstance(c, str) for c in options["candidates"]):
+                raise HTTPError(400, "candidates must be a list of strategy names.")
+            options["candidates"] = tuple(options["candidates"])
+        grid, unscheduled, search = await self.build(int(user_id), start, end, **options)
+        items = slot_items(grid) if grid is not None else []
+        result = {
+            "items": [item._asdict() for item in items],
+            "unscheduled": [task._asdict() for task in unscheduled],
+            "schedule_id": None,
+        }
+        if search is not None:
+            result["search"] = describe(search)
+        if data.get("save") and items:
+            repo = ScheduleRepo(int(user_id))
+            result["schedule_id"] = await self._run(repo.save_schedule, grid, str(data["save"]), "automatic")
+        return result
+
+    async def _list_schedules(self, user_id, query, data):
+        repo = ScheduleRepo(int(user_id))
+        records = await self._run(repo.list_schedules, _int_param(query, "limit", 20),
+                                  _int_param(query, "before"))
+        return [record._asdict() for record in records]
+
+    def _get_schedule_sync(self, user_id, schedule_id):
+        repo = ScheduleRepo(user_id)
+        record = repo.latest_schedule() if schedule_id == "latest" else repo.get_schedule(int(schedule_id))
+        if record is None:
+            raise HTTPError(404, "No such schedule for this user.")
+        result = record._asdict()
+        result["items"] = [item._asdict() for item in repo.load_items(record.id)]
+        return result
+
+    async def _get_schedule(self, user_id, schedule_id, query, data):
+        return await self._run(self._get_schedule_sync, int(user_id), schedule_id)
+
+
+async def serve(host, port, workers, max_concurrency, timeout):
+    service = SchedulerService(workers, max_concurrency, timeout)
+    server = await service.start(host, port)
+    print(f"Serving on http://{host}:{service.port} ({workers} workers)", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP/JSON service for tasks and schedules.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=4, help="database worker threads")
+    parser.add_argument("--max-concurrency", type=int, default=64, help="requests handled at once")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds before a request gets 504")
+    parser.add_argument("--db", help="database file (default scheduler.db)")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        db.DB_PATH = args.db
+    try:
+        asyncio.run(serve(args.host, args.port, max(1, args.workers), max(1, args.max_concurrency), args.timeout))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+# File: src/slot_grid.py
+# Description: Compact schedule: one task id per cell of an array('i'), names in a side table.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Times are minutes after midnight of the first day (a grid may run past 1440).
+# Postconditions: Slot dicts exist only while a view of the grid is being displayed or saved.
+#
+# A grid cuts start..end into cells of `resolution` minutes; cell i holds the
+# id of the task at start + i * resolution, or FREE. Task names live in one
+# dict (task id -> name) that all grids of a user can share. A week at
+# 5-minute resolution is 2016 cells, about 8 KB, so a week for each of
+# thousands of users fits in tens of megabytes. The dict-per-slot view the
+# menus print (two datetime.time objects, a period and a name each) is built
+# on demand by slots().
+
+from array import array
+from itertools import groupby
+from math import gcd
+
+from src.time_periods import MINUTES_PER_DAY, PERIOD_BY_MINUTE, minutes_to_time
+
+FREE = 0    # task ids are AUTOINCREMENT, so never 0
+_TIMES = [minutes_to_time(minute) for minute in range(MINUTES_PER_DAY)]   # time objects are immutable: share them
+
+
+class SlotGrid:
+    """Task id per `resolution`-minute cell between start and end, plus a task name table."""
+
+    __slots__ = ("start", "end", "resolution", "cells", "names")
+
+    def __init__(self, start:int, end:int, resolution:int = 30, names:dict = None):
+        if start >= end:
+            raise ValueError("Start time must be before end time.")
+        if resolution <= 0 or (end - start) % resolution:
+            raise ValueError("Resolution must be positive and divide the schedule length.")
+        self.start = start
+        self.end = end
+        self.resolution = resolution
+        self.cells = array('i', [FREE]) * ((end - start) // resolution)
+        self.names = {} if names is None else names
+
+    @classmethod
+    def from_blocks(cls, blocks, start:int, end:int, names:dict = None):
+        """Grid holding (task_id, start, end) blocks, at the coarsest resolution that fits them all."""
+        blocks = list(blocks)
+        resolution = gcd(end - start, *(minute - start for block in blocks for minute in block[1:3]))
+        grid = cls(start, end, resolution, names)
+        for task_id, block_start, block_end in blocks:
+            grid.assign(block_start, block_end, task_id)
+        return grid
+
+    def __len__(self):
+        return len(self.cells)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the cells (the name table is shared)"""
+        return self.cells.itemsize * len(self.cells)
+
+    def _cell(self, minute:int) -> int:
+        offset = minute - self.start
+        if offset % self.resolution or not 0 <= offset <= self.end - self.start:
+            raise ValueError(f"Minute {minute} is not on the {self.resolution}-minute grid.")
+        return offset // self.resolution
+
+    # --- edits ---
+
+    def assign(self, start:int, end:int, task_id:int, name:str = None):
+        """Give every cell of start..end to task_id (whatever was there is overwritten)"""
+        i, j = self._cell(start), self._cell(end)
+        if i >= j or task_id == FREE:
+            raise ValueError("Nothing to assign.")
+        self.cells[i:j] = array('i', [task_id]) * (j - i)
+        if name is not None:
+            self.names[task_id] = name
+
+    def clear(self, start:int, end:int):
+        """Free every cell of start..end"""
+        i, j = self._cell(start), self._cell(end)
+        self.cells[i:j] = array('i', [FREE]) * max(j - i, 0)
+
+    # --- lookups ---
+
+    def task_at(self, minute:int):
+        """Task id covering minute, or None when it is free or off the grid"""
+        if not self.start <= minute < self.end:
+            return None
+        return self.cells[(minute - self.start) // self.resolution] or None
+
+    def runs(self):
+        """(task_id or None, start, end) for every run of equal cells, in time order"""
+        runs = []
+        minute = self.start
+        for task_id, group in groupby(self.cells):
+            length = len(list(group)) * self.resolution
+            runs.append((task_id or None, minute, minute + length))
+            minute += length
+        return runs
+
+    def blocks(self):
+        """Assigned runs as (task_id, start, end), the form coalesce_slots returns"""
+        return [run for run in self.runs() if run[0] is not None]
+
+    # --- views ---
+
+    def slots(self, step:int = None, free:bool = True, periods:bool = True):
+        """Slot dicts for display and saving, in time order.
+
+        Each run is cut into step-minute pieces (whole runs when step is None);
+        free runs are left out unless free is set.
+        """
+        view = []
+        for task_id, run_start, run_end in self.runs():
+            if task_id is None and not free:
+                continue
+            name = self.names.get(task_id) if task_id is not None else None
+            cut = step or run_end - run_start
+            for minute in range(run_start, run_end, cut):
+                start = minute % MINUTES_PER_DAY
+                end = min(minute + cut, run_end) % MINUTES_PER_DAY
+                if periods:
+                    view.append({'start': _TIMES[start], 'end': _TIMES[end], 'period': PERIOD_BY_MINUTE[start],
+                                 'task_id': task_id, 'task_name': name})
+                else:
+                    view.append({'start': _TIMES[start], 'end': _TIMES[end],
+                                 'task_id': task_id, 'task_name': name})
+        return view
@@ -0,0 +1,361 @@
+# File: src/strategies.py
+# Description: Registry of placement strategies for the automatic scheduler, and a portfolio that races them.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: A SchedulePlan whose fixed tasks (plan.order[:n_fixed]) are placed.
+# Postconditions: The flexible tasks are placed; plan.order and plan.placements say where.
+#
+# A strategy is a function (plan, n_fixed, options) registered under a name.
+# It may reorder plan.order[n_fixed:], must set plan.placements[n_fixed:] and
+# leave the plan's index holding exactly those placements, and returns a
+# report for AutomaticScheduler.last_search (or None).
+#
+# "portfolio" runs several strategies on copies of the plan, in a process
+# pool, and keeps the placement with the best score_plan(). Every candidate
+# gets the same absolute deadline (options.deadline, wall-clock seconds):
+# anytime strategies (random-restarts, optimal) stop there, and results that
+# arrive later than LATE_SECONDS after it are dropped, so a slow candidate
+# costs no more than the budget. With one worker, or inside a pool worker
+# (batch runs), the candidates run one after another in this process and
+# split what is left of the budget between them.
+# The pool is kept between builds; close_pool() stops it, and runs at exit.
+
+import atexit
+import os
+import random
+import time as clock
+from typing import NamedTuple, Optional, Tuple
+
+from src.packing import PackResult, pack
+
+PERIODS = ["morning", "afternoon", "evening", "night"]
+OBJECTIVES = ("minutes", "tasks")
+PORTFOLIO = ("greedy", "best-fit", "period-balanced", "shortest-first", "random-restarts")
+RESTARTS = 32           # random-restarts stops after this many orders even with time left
+LATE_SECONDS = 0.05     # how long past the deadline the portfolio still waits for a candidate
+STRATEGIES = {}         # name -> strategy function
+
+# score_plan: points per scheduled minute, unscheduled task, free fragment and unit of imbalance
+SCORE_WEIGHTS = {"minutes": 1.0, "unscheduled": -30.0, "fragments": -10.0, "imbalance": -60.0}
+
+
+def register(name):
+    """Decorator: add a strategy function to STRATEGIES under name"""
+    def add(strategy):
+        STRATEGIES[name] = strategy
+        return strategy
+    return add
+
+
+class StrategyOptions(NamedTuple):
+    """What a strategy may use besides the plan (see AutomaticScheduler.set_strategy)"""
+    deadline: float                     # time.time() by which anytime strategies stop
+    objective: str = "minutes"
+    weights: Optional[dict] = None      # {task id: value} overriding the objective
+    seed: int = 0
+    candidates: Tuple[str, ...] = PORTFOLIO
+    workers: Optional[int] = None       # portfolio processes (None: one per candidate, up to the CPUs)
+
+
+class ScheduleScore(NamedTuple):
+    total: float
+    minutes: int            # of the placed tasks
+    unscheduled: int
+    fragments: int          # runs of free slots left, each inside one period
+    imbalance: float        # busiest minus idlest period, as shares of their slots
+
+
+class Candidate(NamedTuple):
+    """One strategy's run in a portfolio; score and seconds are None when it missed the deadline"""
+    strategy: str
+    score: Optional[ScheduleScore]
+    seconds: Optional[float]
+
+
+class PortfolioReport(NamedTuple):
+    winner: str
+    candidates: Tuple[Candidate, ...]   # in the order they were asked for
+    seconds: float
+    workers: int                        # processes used (1: ran in this process)
+
+
+def task_value(task, options):
+    """What placing a task is worth to the optimal strategy"""
+    if options.weights and task[0] in options.weights:
+        return options.weights[task[0]]
+    return 1 if options.objective == "tasks" else task[2]
+
+
+def score_plan(plan):
+    """ScheduleScore of a plan: more minutes placed, fewer tasks left out, fewer gaps, even periods"""
+    minutes = unscheduled = 0
+    size, busy = {}, {}
+    for _, period, tree in plan.index.segments:
+        size[period] = size.get(period, 0) + tree.size
+        busy[period] = 0
+    for task, i in zip(plan.order, plan.placements):
+        if i is None:
+            unscheduled += 1
+        else:
+            minutes += task[2]
+            busy[plan.index.segment_of[i][1]] += plan.slots_needed(task)
+    # the gaps between periods hold only fixed tasks, so they take no part in the balance
+    shares = [busy[period] / size[period] for period in size if period is not None and size[period]]
+    imbalance = max(shares) - min(shares) if shares else 0.0
+    fragments = len(plan.free_runs(len(plan.order)))
+    total = (SCORE_WEIGHTS["minutes"] * minutes + SCORE_WEIGHTS["unscheduled"] * unscheduled
+             + SCORE_WEIGHTS["fragments"] * fragments + SCORE_WEIGHTS["imbalance"] * imbalance)
+    return ScheduleScore(round(total, 6), minutes, unscheduled, fragments, round(imbalance, 6))
+
+
+def _release(plan, n_fixed):
+    """Take the flexible tasks off the plan's index again"""
+    for task, i in zip(plan.order[n_fixed:], plan.placements[n_fixed:]):
+        if i is not None:
+            plan.index.release(i, plan.slots_needed(task))
+
+
+def _occupy(plan, n_fixed):
+    for task, i in zip(plan.order[n_fixed:], plan.placements[n_fixed:]):
+        if i is not None:
+            plan.index.occupy(i, plan.slots_needed(task))
+
+
+# --- strategies ---
+
+@register("greedy")
+def greedy(plan, n_fixed, options):
+    """Each task in plan order into the first free run, trying the periods in day order"""
+    plan.placements[n_fixed:] = [plan.place(task) for task in plan.order[n_fixed:]]
+
+
+@register("shortest-first")
+def shortest_first(plan, n_fixed, options):
+    """Greedy with the shortest tasks first: as many tasks as will fit"""
+    plan.order[n_fixed:] = sorted(plan.order[n_fixed:], key=lambda task: (task[2], task[0]))
+    greedy(plan, n_fixed, options)
+
+
+@register("best-fit")
+def best_fit(plan, n_fixed, options):
+    """Longest first, each into the free run it leaves the least room in"""
+    align = plan.align
+    gaps = plan.free_runs(n_fixed)      # (first slot, slots), split as tasks go in
+    placements = []
+    for task in plan.order[n_fixed:]:
+        needed = plan.slots_needed(task)
+        best = None
+        for k, (first, length) in enumerate(gaps):
+            start = first + -first % align
+            left = first + length - start - needed
+            if left >= 0 and (best is None or left < best[0]):
+                best = (left, start, k)
+        if best is None:
+            placements.append(None)
+            continue
+        left, start, k = best
+        first, length = gaps[k]
+        gaps[k:k + 1] = [gap for gap in ((first, start - first), (start + needed, left)) if gap[1] > 0]
+        plan.index.occupy(start, needed)
+        placements.append(start)
+    plan.placements[n_fixed:] = placements
+
+
+@register("period-balanced")
+def period_balanced(plan, n_fixed, options):
+    """Longest first, each into the period with the smallest share of its slots taken so far"""
+    size, busy = {}, {}
+    for _, period, tree in plan.index.segments:
+        size[period] = size.get(period, 0) + tree.size
+        busy[period] = 0
+    for task, i in zip(plan.order[:n_fixed], plan.placements[:n_fixed]):
+        if i is not None:
+            busy[plan.index.segment_of[i][1]] += plan.slots_needed(task)
+    ranked = [period for period in PERIODS if size.get(period)]
+    placements = []
+    for task in plan.order[n_fixed:]:
+        needed = plan.slots_needed(task)
+        ranked.sort(key=lambda period: busy[period] / size[period])     # stable: day order on ties
+        for period in ranked:
+            i = plan.index.first_fit(period, needed, plan.align)
+            if i is not None:
+                plan.index.occupy(i, needed)
+                busy[period] += needed
+                break
+        else:
+            i = None
+        placements.append(i)
+    plan.placements[n_fixed:] = placements
+
+
+@register("random-restarts")
+def random_restarts(plan, n_fixed, options):
+    """Greedy, then greedy over randomly perturbed longest-first orders; keeps the best score
+
+    Stops at the deadline or after RESTARTS orders, whichever comes first.
+    """
+    rng = random.Random(options.seed)
+    flexible = plan.order[n_fixed:]
+    greedy(plan, n_fixed, options)
+    best = (score_plan(plan).total, plan.order[n_fixed:], plan.placements[n_fixed:])
+    for _ in range(RESTARTS):
+        if clock.time() >= options.deadline:
+            break
+        _release(plan, n_fixed)
+        plan.order[n_fixed:] = sorted(flexible, key=lambda task: (-task[2] * rng.uniform(0.5, 1.5), task[0]))
+        greedy(plan, n_fixed, options)
+        total = score_plan(plan).total
+        if total > best[0]:
+            best = (total, plan.order[n_fixed:], plan.placements[n_fixed:])
+    if plan.placements[n_fixed:] != best[2] or plan.order[n_fixed:] != best[1]:
+        _release(plan, n_fixed)
+        plan.order[n_fixed:], plan.placements[n_fixed:] = best[1], best[2]
+        _occupy(plan, n_fixed)
+
+
+@register("optimal")
+def optimal(plan, n_fixed, options) -> PackResult:
+    """Greedy, then the flexible tasks re-placed by branch and bound (src.packing)
+
+    Fixed tasks stay put and the free runs around them are the gaps. In
+    exact mode a gap is counted in whole slots from its first slot-grid
+    start. The greedy placement stays unless the search finds better.
+    """
+    greedy(plan, n_fixed, options)
+    flexible = plan.order[n_fixed:]
+    align = plan.align
+    gaps = []       # (first slot, capacity in units of align slots)
+    for first, length in plan.free_runs(n_fixed):
+        start = first + -first % align
+        if (first + length - start) // align > 0:
+            gaps.append((start, (first + length - start) // align))
+    sizes = [-(-plan.slots_needed(task) // align) for task in flexible]
+    values = [task_value(task, options) for task in flexible]
+    floor = sum(value for value, i in zip(values, plan.placements[n_fixed:]) if i is not None)
+    result = pack(sizes, values, [capacity for _, capacity in gaps],
+                  max(options.deadline - clock.time(), 0), floor)
+    if result.bins is None:
+        return result
+
+    _release(plan, n_fixed)
+    cursor = [start for start, _ in gaps]     # next free slot of each gap (tasks go back to back)
+    placements = []
+    for task, size, gap in zip(flexible, sizes, result.bins):
+        if gap is None:
+            placements.append(None)
+            continue
+        placements.append(cursor[gap])
+        plan.index.occupy(cursor[gap], plan.slots_needed(task))
+        cursor[gap] += size * align
+    plan.placements[n_fixed:] = placements
+    return result
+
+
+# --- portfolio ---
+
+def _run_candidate(job):
+    """Pool task: one strategy on a fresh copy of a plan; returns (name, task ids, placements, score, seconds)"""
+    # imported here: the scheduler module imports this one
+    from src.automatic_scheduler import SchedulePlan
+    name, settings, starts, order, n_fixed, options = job
+    began = clock.perf_counter()
+    plan = SchedulePlan(settings, starts)
+    plan.order = list(order)
+    plan.placements = [plan.place(task) for task in plan.order[:n_fixed]]
+    STRATEGIES[name](plan, n_fixed, options)
+    score = score_plan(plan)
+    return name, [task[0] for task in plan.order], plan.placements, score, clock.perf_counter() - began
+
+
+_pool = None        # (processes, multiprocessing.Pool), kept between builds
+
+
+def _get_pool(processes):
+    """A pool of the given size, started on first use and reused after that"""
+    global _pool
+    from multiprocessing import Pool
+    if _pool is None or _pool[0] != processes:
+        close_pool()
+        _pool = (processes, Pool(processes=processes))
+    return _pool[1]
+
+
+def close_pool():
+    """Stop the portfolio's pool if it was started; the next portfolio build starts a new one"""
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool[1], None
+        pool.terminate()
+        pool.join()
+
+
+def _forget_pool_after_fork():
+    """A forked child does not own the parent's pool; it starts its own if it needs one."""
+    global _pool
+    _pool = None
+
+
+atexit.register(close_pool)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_pool_after_fork)
+
+
+def _portfolio_workers(options):
+    """Processes to race the candidates in (1: one after another in this process)"""
+    from multiprocessing import current_process
+    if current_process().daemon:
+        return 1        # pool workers may not start pools of their own
+    workers = options.workers if options.workers is not None else (os.cpu_count() or 1)
+    return max(1, min(workers, len(options.candidates)))
+
+
+@register("portfolio")
+def portfolio(plan, n_fixed, options) -> PortfolioReport:
+    """Run options.candidates on copies of the plan and keep the best-scoring placement"""
+    from multiprocessing import TimeoutError
+    began = clock.perf_counter()
+    workers = _portfolio_workers(options)
+    jobs = [(name, plan.settings, plan.starts, plan.order, n_fixed, options) for name in options.candidates]
+    results = {}    # name -> _run_candidate result, in candidate order
+    if workers == 1:
+        for k, job in enumerate(jobs):
+            left = options.deadline - clock.time()
+            if left <= 0 and results:
+                break
+            # an even share of what is left of the budget for each candidate still to run
+            share = options._replace(deadline=clock.time() + max(left, 0) / (len(jobs) - k))
+            results[job[0]] = _run_candidate(job[:-1] + (share,))
+    else:
+        pool = _get_pool(workers)
+        pending = [(job[0], pool.apply_async(_run_candidate, (job,))) for job in jobs]
+        cutoff = options.deadline + LATE_SECONDS
+        for name, result in pending:
+            try:
+                results[name] = result.get(max(cutoff - clock.time(), 0))
+            except TimeoutError:
+                pass    # missed the deadline; it stops soon and the pool takes new work after
+    if not results:
+        # nothing came back in time: the greedy placement, here
+        results["greedy"] = _run_candidate(("greedy",) + jobs[0][1:])
+
+    # ties go to the candidate asked for first
+    winner, ids, placements, _, _ = max(results.values(), key=lambda result: result[3].total)
+    by_id = {task[0]: task for task in plan.order[n_fixed:]}
+    plan.order[n_fixed:] = [by_id[task_id] for task_id in ids[n_fixed:]]
+    plan.placements[n_fixed:] = placements[n_fixed:]
+    _occupy(plan, n_fixed)
+    candidates = tuple(Candidate(name, *results[name][3:]) if name in results else Candidate(name, None, None)
+                       for name in options.candidates)
+    return PortfolioReport(winner, candidates, clock.perf_counter() - began, workers)
+
+
+def describe(report):
+    """JSON-able summary of a strategy report (PackResult or PortfolioReport)"""
+    if isinstance(report, PortfolioReport):
+        return {"winner": report.winner, "ms": round(report.seconds * 1000, 3), "workers": report.workers,
+                "candidates": [{"strategy": c.strategy,
+                                "score": c.score._asdict() if c.score else None,
+                                "ms": round(c.seconds * 1000, 3) if c.seconds is not None else None}
+                               for c in report.candidates]}
+    return {"value": report.value, "bound": report.bound, "gap": round(report.gap, 4),
+            "optimal": report.complete, "nodes": report.nodes, "ms": round(report.seconds * 1000, 3)}
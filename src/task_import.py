@@ -0,0 +1,210 @@
+# File: src/task_import.py
+# Description: Bulk import of tasks from CSV or JSON Lines files.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Database migrated; target user exists.
+# Postconditions: Valid rows inserted in batches; rejected rows written to the reject file.
+#
+# Usage: python -m src.task_import FILE [--user ID] [--format csv|jsonl]
+#                                  [--batch-size N] [--rejects PATH]
+#
+# Columns: name, duration (or duration_minutes), and optionally selected,
+# task_type ('flexible'/'fixed'), fixed_time ('HH:MM AM/PM'; the 24-hour
+# 'HH:MM' that the exporter writes is accepted too) and recurrence ('daily',
+# 'weekdays' or weekday names like 'mon,wed').
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import sys
+from typing import NamedTuple
+
+from src import db
+from src.db import get_connection, run_migrations
+from src.task_repo import _task_type_values, _validate_new_task
+from src.time_periods import format_hhmm, parse_hhmm, parse_recurrence
+
+DEFAULT_BATCH_SIZE = 1000
+
+class ImportResult(NamedTuple):
+    inserted: int
+    rejected: int
+
+def _open_text(path):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+def _detect_format(path):
+    name = str(path).lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return "jsonl" if name.endswith((".jsonl", ".json", ".ndjson")) else "csv"
+
+def read_rows(fh, fmt="csv"):
+    """Yield (line_number, row dict) from an open CSV or JSON Lines file, lazily."""
+    if fmt == "csv":
+        reader = csv.DictReader(fh)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_no, line in enumerate(fh, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_no, {"_error": f"Invalid JSON: {e}", "_raw": line}
+            continue
+        if not isinstance(row, dict):
+            row = {"_error": "Each line must be a JSON object.", "_raw": line}
+        yield line_no, row
+
+def _parse_selected(value):
+    if value in (None, ""):
+        return 0
+    if isinstance(value, bool):
+        return int(value)
+    text = str(value).strip().lower()
+    if text in ("1", "true", "yes", "y"):
+        return 1
+    if text in ("0", "false", "no", "n"):
+        return 0
+    raise ValueError("selected must be 0/1 or true/false.")
+
+def _text(row, field, default=""):
+    """A field that must be text when given (CSV cells are; JSON values may not be), stripped"""
+    value = row.get(field)
+    if value is None or value == "":
+        return default
+    if not isinstance(value, str):
+        raise ValueError(f"{field} must be text.")
+    return value.strip()
+
+def validate_row(row):
+    """Check one row with the add_task / set_task_type rules.
+
+    Returns (name, duration, selected, task_type, fixed_time, recurrence) ready to insert,
+    or raises ValueError with the reason.
+    """
+    if "_error" in row:
+        raise ValueError(row["_error"])
+    duration = row.get("duration", row.get("duration_minutes"))
+    if isinstance(duration, str) and duration.strip().isdigit():
+        duration = int(duration.strip())
+    elif isinstance(duration, bool):
+        raise ValueError("Duration must be an integer.")
+    name = row.get("name")
+    if isinstance(name, (dict, list)):
+        raise ValueError("name must be text.")
+    if not isinstance(name, str):
+        name = None if name is None else str(name)
+    name, duration = _validate_new_task(name and name.strip(), duration)
+    selected = _parse_selected(row.get("selected"))
+
+    task_type = _text(row, "task_type", "flexible").lower()
+    fixed_time = _text(row, "fixed_time")
+    if task_type not in ("flexible", "fixed"):
+        raise ValueError("task_type must be 'flexible' or 'fixed'.")
+    if task_type == "fixed":
+        # validate_fixed_time trigger: fixed tasks need a time
+        if not fixed_time:
+            raise ValueError("Fixed tasks must have a fixed_time")
+        try:
+            fixed_time = format_hhmm(parse_hhmm(fixed_time))   # already 24-hour
+        except ValueError:
+            task_type, fixed_time = _task_type_values(task_type, fixed_time)
+    else:
+        fixed_time = None
+    recurrence = row.get("recurrence")
+    if isinstance(recurrence, list):        # JSON lines may list the weekdays
+        recurrence = ",".join(map(str, recurrence))
+    elif recurrence is not None and not isinstance(recurrence, str):
+        raise ValueError("recurrence must be text or a list of weekdays.")
+    recurrence = parse_recurrence(recurrence)
+    return name, duration, selected, task_type, fixed_time, recurrence
+
+def import_rows(user_id, rows, batch_size=DEFAULT_BATCH_SIZE, rejects=None):
+    """Validate and insert (line_number, row) pairs for a user in batches.
+
+    Each batch is one transaction with one executemany. Rejected rows are
+    written to `rejects` (a text file) as JSON lines with the reason.
+    """
+    with get_connection() as conn:
+        if conn.execute("SELECT 1 FROM users WHERE id=?", (user_id,)).fetchone() is None:
+            raise ValueError(f"No user with id {user_id}.")
+    inserted = rejected = 0
+    batch = []
+
+    def flush():
+        with get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO tasks (user_id, name, duration_minutes, selected, task_type, fixed_time, recurrence) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                batch
+            )
+        count = len(batch)
+        batch.clear()
+        return count
+
+    for line_no, row in rows:
+        try:
+            batch.append((user_id,) + validate_row(row))
+        except ValueError as e:
+            rejected += 1
+            if rejects is not None:
+                raw = row.get("_raw", row) if isinstance(row, dict) else row
+                rejects.write(json.dumps({"line": line_no, "reason": str(e), "row": raw}, ensure_ascii=False) + "\n")
+            continue
+        if len(batch) >= batch_size:
+            inserted += flush()
+    if batch:
+        inserted += flush()
+    return ImportResult(inserted, rejected)
+
+def import_file(user_id, path, fmt=None, batch_size=DEFAULT_BATCH_SIZE, reject_path=None):
+    """Stream a CSV/JSONL file (optionally .gz) into a user's tasks. Returns ImportResult."""
+    fmt = fmt or _detect_format(path)
+    rejects = open(reject_path, "w", encoding="utf-8") if reject_path else None
+    try:
+        with _open_text(path) as fh:
+            return import_rows(user_id, read_rows(fh, fmt), batch_size, rejects)
+    finally:
+        if rejects is not None:
+            rejects.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import tasks from a CSV or JSON Lines file.")
+    parser.add_argument("file", help="input file ('-' for stdin); .gz is decompressed")
+    parser.add_argument("--user", type=int, help="user id (default: the 'default' user)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="default: from the file name")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--rejects", help="write rejected rows here (JSON lines)")
+    parser.add_argument("--db", help="database file (default scheduler.db)")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        db.DB_PATH = args.db
+    run_migrations()
+    user_id = args.user
+    if user_id is None:
+        with get_connection() as conn:
+            user_id = conn.execute("SELECT id FROM users WHERE username=?", ("default",)).fetchone()[0]
+
+    if args.file == "-":
+        stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+        rejects = open(args.rejects, "w", encoding="utf-8") if args.rejects else None
+        try:
+            result = import_rows(user_id, read_rows(stdin, args.format or "csv"), max(1, args.batch_size), rejects)
+        finally:
+            if rejects is not None:
+                rejects.close()
+    else:
+        result = import_file(user_id, args.file, args.format, max(1, args.batch_size), args.rejects)
+    print(f"Imported {result.inserted} tasks, rejected {result.rejected}.", file=sys.stderr)
+    return 0 if result.rejected == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,130 +3,378 @@
 # Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
 # Created: 2025-10-21
 
-from typing import List, Tuple
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 from src.db import get_connection
-from datetime import datetime, time, timedelta
+from src.conflicts import find_conflict_groups, find_conflict_pairs
+from src.time_periods import parse_12h, parse_recurrence, format_hhmm
+
+class TaskRecord(NamedTuple):
+    """One task row, in list_tasks() column order (unpacks like the old tuples)."""
+    id: int
+    name: str
+    duration: int
+    selected: int
+    task_type: str
+    fixed_time: Optional[str]
+    recurrence: Optional[str] = None    # weekdays a fixed task repeats on; None = every day
+
+TASK_COLUMNS = "id, name, duration_minutes, selected, task_type, fixed_time, recurrence"
+
+def _validate_new_task(name, duration):
+    """Same rules as add_task; returns the cleaned (name, duration)."""
+    if not isinstance(duration, int):
+        raise ValueError("Duration must be an integer.")
+    if not name or duration <= 0:
+        raise ValueError("Invalid name or duration.")
+    return name.strip(), duration
+
+def _validate_task_ids(task_ids):
+    """Check every ID is a positive int; returns them de-duplicated, in order."""
+    ids = list(dict.fromkeys(task_ids))
+    for task_id in ids:
+        if not isinstance(task_id, int) or task_id <= 0:
+            raise ValueError("Invalid task ID.")
+    return ids
+
+def _task_type_values(task_type, fixed_time):
+    """(task_type, stored fixed_time) for a set_task_type request."""
+    if task_type == 'fixed' and fixed_time:
+        # convert HH:MM AM/PM to 24-hour HH:MM
+        try:
+            return task_type, format_hhmm(parse_12h(fixed_time))
+        except ValueError:
+            raise ValueError("Invalid time format. Use HH:MM AM/PM.")
+    # flexible task - clear fixed_time
+    return "flexible", None
+
+class TaskCache:
+    """In-process LRU cache of each user's tasks, indexed by task id.
+
+    Shared by every TaskRepo given the same instance; their mutating methods
+    keep it current. Writes made outside those repos are not seen until the
+    user is invalidated or evicted. Tables are copied on write, so a table
+    returned by get() is never modified underneath its reader.
+    """
+
+    def __init__(self, max_users:int = 256):
+        self.max_users = max_users
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._users = OrderedDict()   # user_id -> {task_id: TaskRecord}, in list order
+        self._lock = threading.Lock()
+
+    def get(self, user_id:int):
+        """Return the cached {task_id: TaskRecord} table for a user, or None."""
+        with self._lock:
+            tasks = self._users.get(user_id)
+            if tasks is None:
+                self.misses += 1
+                return None
+            self._users.move_to_end(user_id)
+            self.hits += 1
+            return tasks
+
+    def put(self, user_id:int, records):
+        """Cache a user's full task list, evicting the least recently used user if full."""
+        tasks = {record.id: record for record in records}
+        with self._lock:
+            self._users[user_id] = tasks
+            self._users.move_to_end(user_id)
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+                self.evictions += 1
+        return tasks
+
+    def update(self, user_id:int, record:TaskRecord):
+        """Insert or replace one task if the user is cached."""
+        with self._lock:
+            tasks = self._users.get(user_id)
+            if tasks is not None:
+                tasks = self._users[user_id] = dict(tasks)
+                tasks[record.id] = record
+
+    def patch(self, user_id:int, task_id:int, **fields):
+        """Change fields of one cached task (no-op if the user or task is not cached)."""
+        with self._lock:
+            tasks = self._users.get(user_id)
+            if tasks is not None and task_id in tasks:
+                tasks = self._users[user_id] = dict(tasks)
+                tasks[task_id] = tasks[task_id]._replace(**fields)
+
+    def discard(self, user_id:int, task_id:int):
+        """Drop one task if the user is cached."""
+        with self._lock:
+            tasks = self._users.get(user_id)
+            if tasks is not None and task_id in tasks:
+                tasks = self._users[user_id] = dict(tasks)
+                del tasks[task_id]
+
+    def invalidate(self, user_id:Optional[int] = None):
+        """Forget one user's tasks, or everything when user_id is None."""
+        with self._lock:
+            if user_id is None:
+                self._users.clear()
+            else:
+                self._users.pop(user_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions, 'users': len(self._users)}
 
 class TaskRepo:
     """Data access class for the 'tasks' table (US-02, US-03, US-04)."""
 
-    def __init__(self, user_id:int):
+    def __init__(self, user_id:int, cache:Optional[TaskCache] = None, schedule_cache=None):
         self.user_id = user_id
+        self.cache = cache
+        # optional ScheduleCache; every mutation drops this user's memoized schedules
+        self.schedule_cache = schedule_cache
 
     # BLOCK: validate_and_insert (US-02)
     # Purpose: Validate name/duration, then insert task in one transaction.
     def add_task(self, name:str, duration:int) -> int:
         """Add a new task (US-02). Raises ValueError if invalid. Returns task id."""
-        if not isinstance(duration, int):
-            raise ValueError("Duration must be an integer.")
-        if not name or duration <= 0:
-            raise ValueError("Invalid name or duration.")
+        name, duration = _validate_new_task(name, duration)
         with get_connection() as conn:
             cur = conn.execute(
                 "INSERT INTO tasks (user_id, name, duration_minutes, selected, task_type, fixed_time) VALUES (?, ?, ?, ?, ?, NULL)",
-                (self.user_id, name.strip(), duration, 0, "flexible"),
+                (self.user_id, name, duration, 0, "flexible"),
             )
-            return cur.lastrowid
+            task_id = cur.lastrowid
+        if self.cache is not None:
+            self.cache.update(self.user_id, TaskRecord(task_id, name, duration, 0, "flexible", None))
+        self._schedules_changed()
+        return task_id
+
+    def add_tasks(self, tasks: Iterable[Tuple[str, int]]) -> List[int]:
+        """Add many (name, duration) tasks in one transaction. Returns their ids in order.
+
+        Every row is validated like add_task first; one bad row rejects the batch.
+        """
+        rows = [(self.user_id,) + _validate_new_task(name, duration) for name, duration in tasks]
+        if not rows:
+            return []
+        sql = ("INSERT INTO tasks (user_id, name, duration_minutes, selected, task_type, fixed_time) "
+               "VALUES (?, ?, ?, 0, 'flexible', NULL) RETURNING id")
+        with get_connection() as conn:
+            # one statement per row: RETURNING gives no order guarantee across a multi-row insert
+            task_ids = [conn.execute(sql, row).fetchone()[0] for row in rows]
+        self._invalidate()
+        return task_ids
         
     def delete_task(self, task_id: int) -> bool:
         """Delete a task by ID. Returns True if deleted, False if not found."""
         if not isinstance(task_id, int) or task_id <= 0:
             raise ValueError("Invalid task ID.")
         with get_connection() as conn:
-            # Check if exists
             cur = conn.execute(
-                "SELECT 1 FROM tasks WHERE id = ? AND user_id = ?",
-                (task_id, self.user_id),
-            )
-            row = cur.fetchone()
-            if row is None:
-                return False
-            # Remove in SQL
-            conn.execute(
                 "DELETE FROM tasks WHERE id = ? AND user_id = ?",
                 (task_id, self.user_id),
             )
-            return True
+            deleted = cur.rowcount > 0
+        if self.cache is not None:
+            self.cache.discard(self.user_id, task_id)
+        self._schedules_changed()
+        return deleted
+
+    def import_tasks(self, path, fmt:Optional[str] = None, batch_size:int = 1000,
+                     reject_path:Optional[str] = None):
+        """Stream tasks from a CSV/JSONL file in batched transactions (see src.task_import).
 
-    def list_tasks(self) -> List[Tuple[int, str, int, int, str, str]]:
+        Returns ImportResult(inserted, rejected); rejected rows and reasons go to reject_path.
+        """
+        from src.task_import import import_file
+        result = import_file(self.user_id, path, fmt, batch_size, reject_path)
+        self._invalidate()
+        return result
+
+    def _invalidate(self):
+        """Forget everything cached for this user after a bulk change."""
+        if self.cache is not None:
+            self.cache.invalidate(self.user_id)
+        self._schedules_changed()
+
+    def _schedules_changed(self):
+        if self.schedule_cache is not None:
+            self.schedule_cache.invalidate(self.user_id)
+
+    def _update_many(self, conn, sql, params, ids):
+        """Run `sql ... AND id IN (<ids>) RETURNING id`; returns the ids it touched."""
+        cur = conn.execute(
+            sql + " AND id IN (SELECT value FROM json_each(?)) RETURNING id",
+            (*params, self.user_id, json.dumps(ids)),
+        )
+        return {row[0] for row in cur}
+
+    @staticmethod
+    def _split_found(ids, touched, key):
+        return {key: [i for i in ids if i in touched], 'not_found': [i for i in ids if i not in touched]}
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> Dict[str, List[int]]:
+        """Delete many tasks in one statement. Returns {'deleted': [...], 'not_found': [...]}."""
+        ids = _validate_task_ids(task_ids)
+        if not ids:
+            return {'deleted': [], 'not_found': []}
+        with get_connection() as conn:
+            touched = self._update_many(conn, "DELETE FROM tasks WHERE user_id=?", (), ids)
+        self._invalidate()
+        return self._split_found(ids, touched, 'deleted')
+
+    def set_selected(self, task_ids: Iterable[int], selected: bool = True) -> Dict[str, List[int]]:
+        """Select (or unselect) many tasks at once. Returns {'updated': [...], 'not_found': [...]}."""
+        ids = _validate_task_ids(task_ids)
+        if not ids:
+            return {'updated': [], 'not_found': []}
+        with get_connection() as conn:
+            touched = self._update_many(conn, "UPDATE tasks SET selected=? WHERE user_id=?", (1 if selected else 0,), ids)
+        self._invalidate()
+        return self._split_found(ids, touched, 'updated')
+
+    def clear_selected(self) -> int:
+        """Unselect every task for this user. Returns how many were selected."""
+        with get_connection() as conn:
+            cur = conn.execute(
+                "UPDATE tasks SET selected=0 WHERE user_id=? AND selected=1",
+                (self.user_id,)
+            )
+            cleared = cur.rowcount
+        self._invalidate()
+        return cleared
+
+    def _task_table(self):
+        """{task_id: TaskRecord} for this user, from the cache when there is one."""
+        tasks = self.cache.get(self.user_id) if self.cache is not None else None
+        if tasks is None:
+            with get_connection() as conn:
+                cur = conn.execute(
+                    f"SELECT {TASK_COLUMNS} FROM tasks WHERE user_id=? ORDER BY created_at, id",
+                    (self.user_id,)
+                )
+                records = list(map(TaskRecord._make, cur))
+            if self.cache is None:
+                return {record.id: record for record in records}
+            tasks = self.cache.put(self.user_id, records)
+        return tasks
+
+    def list_tasks(self) -> List[TaskRecord]:
         """Return all tasks for this user (US-03)."""
+        return list(self._task_table().values())
+
+    def get_task(self, task_id:int) -> Optional[TaskRecord]:
+        """Return one task by ID, or None if this user has no such task."""
+        if self.cache is not None:
+            return self._task_table().get(task_id)
+        with get_connection() as conn:
+            cur = conn.execute(
+                f"SELECT {TASK_COLUMNS} FROM tasks WHERE id=? AND user_id=?",
+                (task_id, self.user_id)
+            )
+            row = cur.fetchone()
+            return TaskRecord._make(row) if row else None
+
+    def get_selected_tasks(self) -> List[TaskRecord]:
+        """Return a snapshot of the selected tasks, with type and fixed time, in one query."""
+        if self.cache is not None:
+            return [t for t in self._task_table().values() if t.selected]
         with get_connection() as conn:
             cur = conn.execute(
-                "SELECT id, name, duration_minutes, selected, task_type, fixed_time FROM tasks WHERE user_id=? ORDER BY created_at",
+                f"SELECT {TASK_COLUMNS} FROM tasks WHERE user_id=? AND selected=1 ORDER BY created_at, id",
                 (self.user_id,)
             )
-            return cur.fetchall()
+            return list(map(TaskRecord._make, cur))
 
     def toggle_select(self, task_id:int) -> int:
         """Toggle task 'selected' flag (US-04). Returns new selected value (0/1)."""
         with get_connection() as conn:
             cur = conn.execute(
-                "SELECT selected FROM tasks WHERE id=? AND user_id=?",
+                "UPDATE tasks SET selected = CASE WHEN selected THEN 0 ELSE 1 END WHERE id=? AND user_id=? RETURNING selected",
                 (task_id, self.user_id)
             )
             row = cur.fetchone()
             if not row:
                 raise ValueError("Task not found.")
-            new_value = 0 if row[0] else 1
-            conn.execute(
-                "UPDATE tasks SET selected=? WHERE id=? AND user_id=?",
-                (new_value, task_id, self.user_id)
-            )
-            return new_value
+        if self.cache is not None:
+            self.cache.patch(self.user_id, task_id, selected=row[0])
+        self._schedules_changed()
+        return row[0]
 
     def set_task_type(self, task_id:int, task_type:str, fixed_time:str=""):
         """Set the task_type field for a task."""
+        task_type, stored_time = _task_type_values(task_type, fixed_time)
         with get_connection() as conn:
-                if task_type == 'fixed' and fixed_time:
-                    # validate fixed_time format HH:MM
-                    try:
-                        # convert HH:MM AM/PM to 24-hour HH:MM
-                        time_obj = datetime.strptime(fixed_time, "%I:%M %p").time()
-                        conn.execute(
-                            "UPDATE tasks SET task_type=?, fixed_time=? WHERE id=? AND user_id=?",
-                            (task_type, time_obj.strftime("%H:%M"), task_id, self.user_id)
-                        )
-                    except ValueError:
-                        raise ValueError("Invalid time format. Use HH:MM AM/PM.")
-                else:
-                    # flexible task - clear fixed_time
-                    conn.execute(
-                        "UPDATE tasks SET task_type=?, fixed_time=NULL WHERE id=? AND user_id=?",
-                        ("flexible", task_id, self.user_id)
+                conn.execute(
+                    "UPDATE tasks SET task_type=?, fixed_time=? WHERE id=? AND user_id=?",
+                    (task_type, stored_time, task_id, self.user_id)
                 )
                 conn.commit()
+        if self.cache is not None:
+            self.cache.patch(self.user_id, task_id, task_type=task_type, fixed_time=stored_time)
+        self._schedules_changed()
+
+    def set_recurrence(self, task_id:int, recurrence:Optional[str]) -> Optional[str]:
+        """Set the weekdays a fixed task repeats on ('daily', 'weekdays', 'mon,wed,fri', ...).
+
+        Returns the stored form (None for every day). Raises ValueError for an
+        unknown weekday or task.
+        """
+        stored = parse_recurrence(recurrence)
+        with get_connection() as conn:
+            cur = conn.execute(
+                "UPDATE tasks SET recurrence=? WHERE id=? AND user_id=?",
+                (stored, task_id, self.user_id)
+            )
+            if cur.rowcount == 0:
+                raise ValueError("Task not found.")
+        if self.cache is not None:
+            self.cache.patch(self.user_id, task_id, recurrence=stored)
+        self._schedules_changed()
+        return stored
+
+    def set_task_types(self, updates: Iterable[Tuple[int, str, str]]) -> Dict[str, List[int]]:
+        """Apply many (task_id, task_type, fixed_time) changes in one transaction.
+
+        Same rules as set_task_type; all times are validated before anything is
+        written. Returns {'updated': [...], 'not_found': [...]}.
+        """
+        groups = {}
+        ids = []
+        for task_id, task_type, fixed_time in updates:
+            ids.append(task_id)
+            groups.setdefault(_task_type_values(task_type, fixed_time), []).append(task_id)
+        ids = _validate_task_ids(ids)
+        touched = set()
+        with get_connection() as conn:
+            # one UPDATE per distinct (type, time) value
+            for (task_type, stored_time), group_ids in groups.items():
+                touched |= self._update_many(
+                    conn, "UPDATE tasks SET task_type=?, fixed_time=? WHERE user_id=?",
+                    (task_type, stored_time), list(dict.fromkeys(group_ids))
+                )
+        self._invalidate()
+        return self._split_found(ids, touched, 'updated')
+
     def get_fixed_tasks(self):
         """Get all fixed tasks for the user"""
         with get_connection() as conn:
             cur = conn.execute(
-                "SELECT id, name, duration_minutes, fixed_time FROM tasks WHERE user_id=? AND task_type='fixed' AND selected=1 ORDER BY fixed_time",
+                "SELECT id, name, duration_minutes, fixed_time, recurrence FROM tasks WHERE user_id=? AND task_type='fixed' AND selected=1 ORDER BY fixed_time",
                 (self.user_id,)
             )
             return cur.fetchall()
         
     def detect_fixed_task_conflicts(self):
-        """Detect time conflicts between fixed tasks"""
-        fixed_tasks = self.get_fixed_tasks()
-        conflicts = []
-
-        # Check each pair of fixed tasks for overlap
-        for i in range(len(fixed_tasks)):
-            for j in range(i + 1, len(fixed_tasks)):
-                task1_id, task1_name, task1_duration, task1_time = fixed_tasks[i]
-                task2_id, task2_name, task2_duration, task2_time = fixed_tasks[j]
-
-                # convert times to datetime for comparison
-                time1 = datetime.strptime(task1_time, "%H:%M")
-                time2 = datetime.strptime(task2_time, "%H:%M")
-                end_time1 = time1 + timedelta(minutes=task1_duration)
-
-                # Check for overlap
-                if time2 < end_time1:
-                    conflicts.append({
-                        'task1': (task1_id, task1_name, task1_time, task1_duration),
-                        'task2': (task2_id, task2_name, task2_time, task2_duration)
-                    })
-        return conflicts
+        """Detect time conflicts between fixed tasks (pairs, earlier task first)"""
+        return find_conflict_pairs(self.get_fixed_tasks())
+
+    def detect_fixed_task_conflict_groups(self):
+        """Group fixed tasks that overlap, directly or through a chain of overlaps"""
+        return find_conflict_groups(self.get_fixed_tasks())
 
     def get_task_type(self, task_id):
         """Get the type (fixed/flexible) of a task"""
@@ -147,3 +395,29 @@ class TaskRepo:
             )
             result = cur.fetchone()
             return result[0] if result else None
+
+def detect_all_fixed_task_conflicts():
+    """Conflict groups for every user in one pass: {user_id: [cluster, ...]}.
+
+    Users without conflicts are left out. Meant for bulk validation jobs.
+    """
+    with get_connection() as conn:
+        cur = conn.execute(
+            "SELECT user_id, id, name, duration_minutes, fixed_time, recurrence FROM tasks "
+            "WHERE task_type='fixed' AND selected=1 ORDER BY user_id, fixed_time"
+        )
+        results = {}
+        user_id, fixed_tasks = None, []
+        for row in cur:
+            if row[0] != user_id:
+                if fixed_tasks:
+                    groups = find_conflict_groups(fixed_tasks)
+                    if groups:
+                        results[user_id] = groups
+                user_id, fixed_tasks = row[0], []
+            fixed_tasks.append(row[1:])
+        if fixed_tasks:
+            groups = find_conflict_groups(fixed_tasks)
+            if groups:
+                results[user_id] = groups
+        return results
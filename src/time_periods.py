@@ -3,7 +3,7 @@
 # Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
 # Created: 2025-11-26
 
-from datetime import datetime, time
+from datetime import time
 
 # Slots dict for periods with proper time objects
 slots = {
@@ -13,15 +13,123 @@ slots = {
     "night": (time(21, 0), time(4, 0))        # 9:00 PM - 4:00 AM
 }
 
+MINUTES_PER_DAY = 24 * 60
+
+# Integer minute-of-day API: times are ints 0..1439 (minutes after midnight).
+# Convert to datetime.time or strings only when displaying or persisting.
+
+def _period_table():
+    """Build the period of every minute of the day (None between night and morning)."""
+    table = [None] * MINUTES_PER_DAY
+    for period, (start, end) in slots.items():
+        start_m = start.hour * 60 + start.minute
+        end_m = end.hour * 60 + end.minute
+        if period == "night":
+            # crosses midnight; the end minute itself still counts as night
+            for m in range(start_m, MINUTES_PER_DAY):
+                table[m] = period
+            for m in range(0, end_m + 1):
+                table[m] = period
+        else:
+            for m in range(start_m, end_m):
+                table[m] = period
+    return table
+
+PERIOD_BY_MINUTE = _period_table()
+
+def period_of_minute(minute):
+    """Period for a minute of the day (wraps past midnight)"""
+    return PERIOD_BY_MINUTE[minute % MINUTES_PER_DAY]
+
+def time_to_minutes(value):
+    """Minutes after midnight for a datetime.time (seconds are dropped)"""
+    return value.hour * 60 + value.minute
+
+def minutes_to_time(minute):
+    """datetime.time for a minute count (wraps past midnight)"""
+    minute %= MINUTES_PER_DAY
+    return time(minute // 60, minute % 60)
+
+def parse_hhmm(text):
+    """Parse 24-hour 'HH:MM' into minutes after midnight"""
+    hours, sep, minutes = text.strip().partition(':')
+    if (not sep or not hours.isdigit() or not minutes.isdigit()
+            or len(hours) > 2 or len(minutes) > 2):
+        raise ValueError("Time must be in HH:MM format")
+    h, m = int(hours), int(minutes)
+    if h > 23 or m > 59:
+        raise ValueError("Time must be in HH:MM format")
+    return h * 60 + m
+
+def parse_12h(text):
+    """Parse 'HH:MM AM/PM' into minutes after midnight"""
+    clock, _, meridiem = text.strip().rpartition(' ')
+    meridiem = meridiem.upper()
+    try:
+        minute = parse_hhmm(clock)
+    except ValueError:
+        minute = None
+    if minute is None or meridiem not in ('AM', 'PM') or not 1 <= minute // 60 <= 12:
+        raise ValueError("Time must be in HH:MM AM/PM format")
+    minute %= 720                 # 12:xx is the first hour of its half-day
+    return minute + 720 if meridiem == 'PM' else minute
+
+def format_hhmm(minute):
+    """'HH:MM' (24-hour) for a minute of the day"""
+    minute %= MINUTES_PER_DAY
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+def format_12h(minute):
+    """'HH:MM AM/PM' for a minute of the day"""
+    minute %= MINUTES_PER_DAY
+    hour = minute // 60
+    return f"{(hour - 1) % 12 + 1:02d}:{minute % 60:02d} {'AM' if hour < 12 else 'PM'}"
+
+# Weekly recurrence of fixed tasks: None means every day, otherwise a
+# comma-separated list of weekday names in date.weekday() order.
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+def parse_recurrence(text):
+    """Normalise 'daily', 'weekdays', 'weekends' or names like 'Mon, wed' to the stored form"""
+    text = (text or "").strip().lower()
+    if text in ("", "daily", "every day"):
+        return None
+    if text == "weekdays":
+        days = set(range(5))
+    elif text == "weekends":
+        days = {5, 6}
+    else:
+        days = set()
+        for part in text.replace(" ", ",").split(","):
+            if not part:
+                continue
+            if part[:3] not in WEEKDAYS:
+                raise ValueError(f"Unknown weekday '{part}'. Use mon..sun, 'weekdays' or 'daily'.")
+            days.add(WEEKDAYS.index(part[:3]))
+    if len(days) == 7:
+        return None
+    return ",".join(WEEKDAYS[day] for day in sorted(days))
+
+def recurrence_days(recurrence):
+    """Weekday numbers (Monday = 0) a stored recurrence falls on"""
+    if not recurrence:
+        return frozenset(range(7))
+    return frozenset(WEEKDAYS.index(name) for name in recurrence.split(","))
+
+def recurs_on(recurrence, weekday):
+    """Whether a stored recurrence includes a weekday (Monday = 0)"""
+    return not recurrence or WEEKDAYS[weekday] in recurrence.split(",")
+
 def determine_period(current_time):
     """Determine which period a given time falls into"""
+    if isinstance(current_time, int):
+        return period_of_minute(current_time)
     if isinstance(current_time, str):
-        try:
-            # Convert string time (HH:MM) to time object
-            current_time = datetime.strptime(current_time, '%H:%M').time()
-        except ValueError:
-            raise ValueError("Time must be in HH:MM format")
-    
+        # Convert string time (HH:MM) to minutes and use the lookup table
+        return PERIOD_BY_MINUTE[parse_hhmm(current_time)]
+    if not current_time.second and not current_time.microsecond:
+        return PERIOD_BY_MINUTE[time_to_minutes(current_time)]
+
     for period, (start, end) in slots.items():
         # Special handling for night period that crosses midnight
         if period == "night":
@@ -51,8 +159,10 @@ def next_slot(current_slot):
 
 def is_time_in_slot(check_time, period):
     """Check if a given time falls within a specific period"""
+    if isinstance(check_time, int):
+        return period_of_minute(check_time) == period
     if isinstance(check_time, str):
-        check_time = datetime.strptime(check_time, '%H:%M').time()
+        check_time = minutes_to_time(parse_hhmm(check_time))
     
     start, end = slots[period]
     
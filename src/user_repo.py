@@ -0,0 +1,59 @@
+# File: src/user_repo.py
+# Description: Repository layer for per-user scheduling settings.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: Migrations 001-006 applied.
+# Postconditions: Slot settings are read and written on the users table.
+
+from typing import NamedTuple
+from src.db import get_connection
+
+DEFAULT_SLOT_MINUTES = 30
+MAX_SLOT_MINUTES = 60
+
+class SlotSettings(NamedTuple):
+    """How finely a user's schedules are cut: slot length, and whether placement is to the minute."""
+    slot_minutes: int = DEFAULT_SLOT_MINUTES
+    exact: bool = False     # tasks take exactly their duration; fixed tasks may start between slots
+
+def validate_slot_minutes(slot_minutes) -> int:
+    """Check a slot length (1-60 minutes); returns it."""
+    if not isinstance(slot_minutes, int) or isinstance(slot_minutes, bool) \
+            or not 1 <= slot_minutes <= MAX_SLOT_MINUTES:
+        raise ValueError(f"Slot length must be a whole number of minutes from 1 to {MAX_SLOT_MINUTES}.")
+    return slot_minutes
+
+class UserRepo:
+    """Data access class for one row of the 'users' table."""
+
+    def __init__(self, user_id:int):
+        self.user_id = user_id
+
+    def get_slot_settings(self) -> SlotSettings:
+        """The user's slot settings (the defaults when none are stored or the user is unknown)."""
+        with get_connection() as conn:
+            row = conn.execute(
+                "SELECT slot_minutes, exact_placement FROM users WHERE id=?", (self.user_id,)
+            ).fetchone()
+        if row is None:
+            return SlotSettings()
+        return SlotSettings(row[0] or DEFAULT_SLOT_MINUTES, bool(row[1]))
+
+    def set_slot_settings(self, slot_minutes:int = None, exact:bool = None) -> SlotSettings:
+        """Change the slot length and/or exact placement (None leaves a setting as it is).
+
+        Returns the settings now stored. Raises ValueError for a bad length or unknown user.
+        """
+        current = self.get_slot_settings()
+        settings = SlotSettings(
+            current.slot_minutes if slot_minutes is None else validate_slot_minutes(slot_minutes),
+            current.exact if exact is None else bool(exact),
+        )
+        with get_connection() as conn:
+            cur = conn.execute(
+                "UPDATE users SET slot_minutes=?, exact_placement=? WHERE id=?",
+                (settings.slot_minutes, int(settings.exact), self.user_id)
+            )
+            if cur.rowcount == 0:
+                raise ValueError("User not found.")
+        return settings
@@ -0,0 +1,26 @@
+# File: tests/conftest.py
+# Description: Shared fixtures: a freshly migrated scheduler database per test.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+# Preconditions: pytest installed (requirements.txt).
+# Postconditions: src.db.DB_PATH points at a temporary database for the length of one test.
+
+import pytest
+
+from src import db
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Path of a new, migrated database with the default user (id 1) and its starter tasks"""
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "scheduler.db")
+    db.run_migrations()
+    yield db.DB_PATH
+    db.close_connections()
+
+
+@pytest.fixture
+def user_id(temp_db):
+    """The default user's id"""
+    with db.get_connection() as conn:
+        return conn.execute("SELECT id FROM users WHERE username='default'").fetchone()[0]
@@ -0,0 +1,28 @@
+# File: tests/test_batch_schedule.py
+# Description: Batch scheduling for every user: the schedule window is checked, not ignored.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+
+import pytest
+
+from src.batch_schedule import build_user_schedule, main
+from src.schedule_repo import ScheduleRepo
+from src.task_repo import TaskRepo
+
+
+@pytest.mark.parametrize("start, end", [("25:00 AM", "10:00 PM"), ("8:00 AM", "8:30 AM"), ("soon", "later")])
+def test_bad_window_is_an_error(temp_db, user_id, capsys, start, end):
+    with pytest.raises(SystemExit):
+        main(["--workers", "1", "--quiet", "--start", start, "--end", end])
+    assert "--start/--end" in capsys.readouterr().err
+    with pytest.raises(ValueError):
+        build_user_schedule(user_id, start, end)
+
+
+def test_batch_uses_the_window(temp_db, user_id, capsys):
+    repo = TaskRepo(user_id)
+    repo.set_selected([repo.add_task("Read", 30)])
+    assert main(["--workers", "1", "--quiet", "--start", "6:00 AM", "--end", "9:00 PM"]) == 0
+    assert capsys.readouterr().out == ""
+    items = ScheduleRepo(user_id).load_items(ScheduleRepo(user_id).latest_schedule().id)
+    assert [(item.task_name, item.start_time) for item in items] == [("Read", "06:00")]
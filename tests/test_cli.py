@@ -0,0 +1,20 @@
+# File: tests/test_cli.py
+# Description: Command-line argument checks that happen before anything is written.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+
+import json
+
+from src.cli import main
+from src.task_repo import TaskRepo
+
+
+def test_recur_needs_fixed(temp_db, user_id, capsys):
+    before = len(TaskRepo(user_id).list_tasks())
+    assert main(["tasks", "add", "Gym", "60", "--recur", "mon,wed"]) == 2
+    assert "--recur requires --fixed" in capsys.readouterr().err
+    assert len(TaskRepo(user_id).list_tasks()) == before
+
+    assert main(["tasks", "add", "Gym", "60", "--fixed", "9:00 AM", "--recur", "mon,wed"]) == 0
+    task = json.loads(capsys.readouterr().out)
+    assert (task["task_type"], task["fixed_time"], task["recurrence"]) == ("fixed", "09:00", "mon,wed")
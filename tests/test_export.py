@@ -0,0 +1,32 @@
+# File: tests/test_export.py
+# Description: Export writers: iCalendar line folding.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+
+import io
+
+from src.export import write_task_ics
+
+
+def _task_row(name):
+    return {"id": 7, "name": name, "duration_minutes": 30, "selected": 1,
+            "task_type": "flexible", "fixed_time": None, "recurrence": None}
+
+
+def test_ics_lines_fold_within_75_octets():
+    for name in ["x" * 200, "é" * 150, "a" + "日本語" * 60, "y" * 66, "z" * 67]:
+        out = io.StringIO(newline="")
+        write_task_ics([_task_row(name)], out)
+        lines = out.getvalue().split("\r\n")
+        assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+        # unfolding (drop CRLF + space) gives the SUMMARY back whole
+        unfolded = out.getvalue().replace("\r\n ", "")
+        assert f"SUMMARY:{name}\r\n" in unfolded
+
+
+def test_ics_text_line_breaks_are_escaped():
+    out = io.StringIO(newline="")
+    write_task_ics([_task_row("Call\r\nMum\rand, Dad\n")], out)
+    lines = out.getvalue().split("\r\n")
+    assert "SUMMARY:Call\\nMum\\nand\\, Dad\\n" in lines
+    assert "\r" not in out.getvalue().replace("\r\n", "")
@@ -0,0 +1,90 @@
+# File: tests/test_placement.py
+# Description: The free-slot index (src.placement) against a straightforward scan over the slots.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+
+import random
+
+import pytest
+
+from src.automatic_scheduler import PERIODS, AutomaticScheduler
+from src.placement import PlacementIndex
+from src.task_repo import TaskRecord
+from src.time_periods import parse_hhmm, time_to_minutes
+
+
+def scan_first_fit(periods, taken, period, length, align=1):
+    """First index starting length free slots, all in period (the scan the index replaced)"""
+    for i in range(0, len(periods) - length + 1, align):
+        if all(periods[k] == period and not taken[k] for k in range(i, i + length)):
+            return i
+    return None
+
+
+def scan_schedule(scheduler, tasks):
+    """{task id: first slot or None}, placing on slot dicts with can_place_task as before the index"""
+    slots = scheduler.generate_time_slots()
+    starts = [time_to_minutes(slot['start']) for slot in slots]
+    placed = {}
+    for task in sorted(tasks, key=lambda task: (task[4] != 'fixed', -task[2], task[0])):
+        needed = -(-task[2] // scheduler.time_slot_duration)
+        if task[4] == 'fixed':
+            candidates = [i for i, minute in enumerate(starts) if minute == parse_hhmm(task[5])]
+        else:
+            candidates = [i for period in PERIODS for i in range(len(slots)) if slots[i]['period'] == period]
+        placed[task[0]] = None
+        for i in candidates:
+            if scheduler.can_place_task(slots, i, needed):
+                scheduler.place_task(slots, i, needed, task)
+                placed[task[0]] = i
+                break
+    return placed
+
+
+def random_tasks(rng, count):
+    tasks = []
+    for task_id in range(1, count + 1):
+        duration = rng.choice([10, 15, 20, 30, 45, 60, 90, 120, 180])
+        if rng.random() < 0.3:
+            fixed = f"{rng.randrange(0, 24):02d}:{rng.choice([0, 15, 30, 45]):02d}"
+            tasks.append(TaskRecord(task_id, f"T{task_id}", duration, 1, 'fixed', fixed))
+        else:
+            tasks.append(TaskRecord(task_id, f"T{task_id}", duration, 1, 'flexible', None))
+    return tasks
+
+
+def test_index_matches_scan():
+    rng = random.Random(4)
+    names = ["morning", "afternoon", "evening", "night", None]
+    for _ in range(300):
+        periods = [rng.choice(names) for _ in range(rng.randrange(1, 12)) for _ in range(rng.randrange(1, 8))]
+        index = PlacementIndex(periods)
+        taken = [False] * len(periods)
+        for _ in range(40):
+            period, length, align = rng.choice(names[:4]), rng.randrange(1, 6), rng.choice([1, 1, 2, 3])
+            i = index.first_fit(period, length, align)
+            assert i == scan_first_fit(periods, taken, period, length, align)
+            start = rng.randrange(len(periods))
+            assert index.can_place(start, length) == (
+                start + length <= len(periods)
+                and all(periods[k] == periods[start] and not taken[k] for k in range(start, start + length)))
+            if i is not None:
+                index.occupy(i, length)
+                taken[i:i + length] = [True] * length
+            elif any(taken) and rng.random() < 0.5:
+                k = rng.choice([k for k, used in enumerate(taken) if used])
+                index.release(k, 1)
+                taken[k] = False
+
+
+@pytest.mark.parametrize("slot_minutes", [15, 30, 60])
+@pytest.mark.parametrize("bounds", [None, ("12:00 AM", "11:30 PM"), ("6:00 AM", "9:00 PM")])
+def test_schedule_matches_scan(temp_db, slot_minutes, bounds):
+    rng = random.Random(slot_minutes)
+    for _ in range(60):
+        scheduler = AutomaticScheduler(1, slot_minutes=slot_minutes, exact=False)
+        if bounds:
+            assert scheduler.set_time_boundaries(*bounds)
+        tasks = random_tasks(rng, rng.randrange(1, 30))
+        plan = scheduler.plan_tasks(tasks)
+        assert dict(zip((task[0] for task in plan.order), plan.placements)) == scan_schedule(scheduler, tasks)
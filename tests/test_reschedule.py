@@ -0,0 +1,79 @@
+# File: tests/test_reschedule.py
+# Description: Incremental rescheduling gives the same schedule as building from scratch.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+
+import random
+
+from src.automatic_scheduler import AutomaticScheduler
+from src.schedule_cache import ScheduleCache
+from src.task_repo import TaskRepo
+
+
+def _add(repo, rng, count):
+    """count random selected tasks, about a third of them fixed; returns their ids"""
+    ids = repo.add_tasks([(f"T{rng.randrange(1000)}", rng.choice([15, 20, 30, 45, 60, 90, 120])) for _ in range(count)])
+    for task_id in ids:
+        if rng.random() < 0.3:
+            repo.set_task_type(task_id, "fixed", _random_time(rng))
+    repo.set_selected(ids)
+    return ids
+
+
+def _random_time(rng):
+    return f"{rng.randrange(1, 13)}:{rng.choice(['00', '30'])} {rng.choice(['AM', 'PM'])}"
+
+
+def _scheduler(user_id):
+    scheduler = AutomaticScheduler(user_id, slot_minutes=30, exact=False)
+    scheduler.quiet = True
+    return scheduler
+
+
+def test_reschedule_matches_full_rebuild(user_id):
+    rng = random.Random(17)
+    repo = TaskRepo(user_id)
+    for _ in range(40):
+        repo.delete_tasks([task.id for task in repo.list_tasks()])
+        ids = _add(repo, rng, rng.randrange(5, 35))
+        scheduler = _scheduler(user_id)
+        scheduler.build_schedule()
+
+        removed = rng.sample(ids, rng.randrange(0, 4))
+        repo.delete_tasks(removed)
+        kept = [task_id for task_id in ids if task_id not in removed]
+        changed_ids = rng.sample(kept, min(len(kept), rng.randrange(0, 3)))
+        for task_id in changed_ids:
+            if rng.random() < 0.5:
+                repo.toggle_select(task_id)
+            else:
+                repo.set_task_type(task_id, "fixed", _random_time(rng))
+        added = _add(repo, rng, rng.randrange(0, 4))
+
+        slots = scheduler.reschedule(added=[repo.get_task(task_id) for task_id in added], removed=removed,
+                                     changed=[repo.get_task(task_id) for task_id in changed_ids])
+        fresh = _scheduler(user_id)
+        assert slots == fresh.build_schedule()
+        assert scheduler.last_grid.blocks() == fresh.last_grid.blocks()
+        assert [task.id for task in scheduler.unscheduled_tasks] == [task.id for task in fresh.unscheduled_tasks]
+
+
+def test_reschedule_after_a_cache_hit(user_id):
+    repo = TaskRepo(user_id)
+    repo.delete_tasks([task.id for task in repo.list_tasks()])
+    ids = repo.add_tasks([("Long", 120), ("Short", 30)])
+    repo.set_selected(ids)
+    scheduler = AutomaticScheduler(user_id, repo, ScheduleCache(), slot_minutes=30, exact=False)
+    scheduler.quiet = True
+    scheduler.build_schedule()
+    repo.toggle_select(ids[0])
+    scheduler.build_schedule()              # a new plan without Long
+    repo.toggle_select(ids[0])
+    scheduler.build_schedule()              # Long is back: the cached result of the first build
+    assert scheduler.last_plan is None
+
+    added = repo.add_task("Added", 60)
+    repo.set_selected([added])
+    slots = scheduler.reschedule(added=[repo.get_task(added)])
+    assert slots == _scheduler(user_id).build_schedule()
+    assert [task.name for task in scheduler.last_plan.order] == ["Long", "Added", "Short"]
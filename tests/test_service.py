@@ -0,0 +1,91 @@
+# File: tests/test_service.py
+# Description: The HTTP/JSON service end to end over a socket, against a temporary database.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+
+import asyncio
+import json
+
+from src.service import SchedulerService
+
+
+async def _request(port, method, path, body=None):
+    """(status, JSON payload) of one request on its own connection"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = json.dumps(body).encode("utf-8") if body is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(data)}\r\n"
+                 f"Connection: close\r\n\r\n".encode("latin-1") + data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+def _serve(scenario):
+    """Run scenario(service) against a service listening on a free port; returns its result"""
+    async def main():
+        service = SchedulerService(workers=2, max_concurrency=8, timeout=5)
+        await service.start("127.0.0.1", 0)
+        try:
+            return await scenario(service)
+        finally:
+            await service.close()
+    return asyncio.run(main())
+
+
+def test_tasks_schedule_and_saved_schedule(temp_db, user_id):
+    async def scenario(service):
+        port = service.port
+        status, health = await _request(port, "GET", "/health")
+        assert status == 200 and health["status"] == "ok"
+
+        status, gym = await _request(port, "POST", f"/users/{user_id}/tasks",
+                                     {"name": "Gym", "duration": 60, "task_type": "fixed",
+                                      "fixed_time": "9:00 AM", "selected": True})
+        assert status == 200 and (gym["task_type"], gym["fixed_time"], gym["selected"]) == ("fixed", "09:00", 1)
+        status, read = await _request(port, "POST", f"/users/{user_id}/tasks", {"name": "Read", "duration": 30})
+        assert status == 200
+        assert (await _request(port, "POST", f"/users/{user_id}/tasks", {"name": "Bad", "duration": 0}))[0] == 400
+        assert (await _request(port, "PATCH", f"/users/{user_id}/tasks/{read['id']}", {"selected": True}))[1]["selected"] == 1
+        assert (await _request(port, "GET", f"/users/{user_id}/tasks/999999"))[0] == 404
+
+        status, built = await _request(port, "POST", f"/users/{user_id}/schedule", {"save": "Daily"})
+        assert status == 200 and built["unscheduled"] == []
+        assert [(item["task_name"], item["start_time"], item["end_time"]) for item in built["items"]] == [
+            ("Read", "08:00", "08:30"), ("Gym", "09:00", "10:00")]
+
+        # a task in a saved schedule can still be deleted; the saved block stays
+        assert await _request(port, "DELETE", f"/users/{user_id}/tasks/{gym['id']}") == (200, {"deleted": gym["id"]})
+        status, saved = await _request(port, "GET", f"/users/{user_id}/schedules/latest")
+        assert status == 200 and saved["id"] == built["schedule_id"]
+        assert [(item["task_id"], item["start_time"]) for item in saved["items"]] == [(read["id"], "08:00"), (None, "09:00")]
+        assert (await _request(port, "GET", f"/users/{user_id}/schedules/{built['schedule_id'] + 1}"))[0] == 404
+    _serve(scenario)
+
+
+def test_identical_concurrent_builds_share_one_build(temp_db, user_id):
+    async def scenario(service):
+        await _request(service.port, "POST", f"/users/{user_id}/tasks", {"name": "Read", "duration": 30, "selected": True})
+        results = await asyncio.gather(*[service.build(user_id) for _ in range(10)])
+        assert (service.stats["builds"], service.stats["coalesced"]) == (1, 9)
+        assert all(result is results[0] for result in results)
+        status, built = await _request(service.port, "POST", f"/users/{user_id}/schedule", {})
+        assert status == 200 and [item["task_name"] for item in built["items"]] == ["Read"]
+    _serve(scenario)
+
+
+def test_malformed_bodies_are_bad_requests(temp_db, user_id):
+    async def scenario(service):
+        port = service.port
+        before = len((await _request(port, "GET", f"/users/{user_id}/tasks"))[1])
+        status, error = await _request(port, "POST", f"/users/{user_id}/tasks",
+                                       {"name": "Gym", "duration": 60, "task_type": "fixed"})
+        assert status == 400 and "fixed_time" in error["error"]
+        assert len((await _request(port, "GET", f"/users/{user_id}/tasks"))[1]) == before
+        for body in [{"strategy": ["greedy"]}, {"objective": {"minutes": 1}}, {"save": ["Daily"]},
+                     {"start": [8], "end": "10:00 PM"}]:
+            status, error = await _request(port, "POST", f"/users/{user_id}/schedule", body)
+            assert status == 400 and "must be text" in error["error"]
+        assert service.stats["errors"] == 0
+    _serve(scenario)
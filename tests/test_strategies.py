@@ -0,0 +1,61 @@
+# File: tests/test_strategies.py
+# Description: Every placement strategy gives a valid schedule inside the periods greedy can use.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+
+import os
+import random
+
+import pytest
+
+from src.automatic_scheduler import AutomaticScheduler
+from src import strategies
+from src.strategies import STRATEGIES, close_pool
+from tests.test_placement import random_tasks
+
+
+@pytest.mark.parametrize("exact", [False, True])
+@pytest.mark.parametrize("strategy", list(STRATEGIES))
+def test_strategies_place_flexible_tasks_inside_periods(temp_db, strategy, exact):
+    rng = random.Random(24)
+    for _ in range(15):
+        scheduler = AutomaticScheduler(1, slot_minutes=30, exact=exact)
+        # a whole-day schedule includes the early-morning slots that belong to no period
+        assert scheduler.set_time_boundaries("12:00 AM", "11:30 PM")
+        scheduler.set_strategy(strategy, time_budget=0.2, workers=1)
+        tasks = random_tasks(rng, rng.randrange(10, 45))
+        plan = scheduler.plan_tasks(tasks)
+
+        taken = set()
+        for task, i in zip(plan.order, plan.placements):
+            if i is None:
+                continue
+            slots = range(i, i + plan.slots_needed(task))
+            assert taken.isdisjoint(slots)
+            taken.update(slots)
+            if task[4] != 'fixed':
+                assert i % plan.align == 0
+                assert len({id(plan.index.segment_of[k]) for k in slots}) == 1
+                assert plan.index.segment_of[i][1] is not None
+
+
+def test_portfolio_pool_is_closed_and_not_inherited(temp_db):
+    scheduler = AutomaticScheduler(1, slot_minutes=30, exact=False)
+    scheduler.set_strategy("portfolio", time_budget=2, workers=2)
+    plan = scheduler.plan_tasks(random_tasks(random.Random(25), 30))
+    assert scheduler.last_search.workers == 2 and scheduler.last_search.winner in STRATEGIES
+    workers = strategies._pool[1]._pool
+    assert all(process.is_alive() for process in workers)
+
+    if hasattr(os, "fork"):
+        child = os.fork()
+        if child == 0:
+            os._exit(0 if strategies._pool is None else 1)
+        assert os.waitpid(child, 0)[1] == 0
+
+    close_pool()
+    assert strategies._pool is None
+    assert not any(process.is_alive() for process in workers)
+    close_pool()    # stopping twice is harmless
+    assert scheduler.plan_tasks(plan.order).placements == plan.placements and strategies._pool is not None
+    close_pool()
@@ -0,0 +1,33 @@
+# File: tests/test_task_import.py
+# Description: Batched task import: bad rows go to the reject file, the rest are inserted.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+
+import json
+
+from src.task_repo import TaskRepo
+
+
+def test_wrongly_typed_json_values_are_rejected_not_fatal(user_id, tmp_path):
+    rows = [
+        {"name": "Good", "duration": 30},
+        {"name": "Type", "duration": 30, "task_type": 5},
+        {"name": "Time", "duration": 30, "task_type": "fixed", "fixed_time": 900},
+        {"name": ["Listed"], "duration": 30},
+        {"name": "Days", "duration": 30, "task_type": "fixed", "fixed_time": "9:00 AM", "recurrence": 3},
+        {"name": "Float", "duration": 30.5},
+        {"name": "Fixed", "duration": 45, "task_type": "fixed", "fixed_time": "9:00 AM", "recurrence": ["mon", "wed"]},
+    ]
+    source = tmp_path / "tasks.jsonl"
+    source.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+    rejects = tmp_path / "rejects.jsonl"
+
+    repo = TaskRepo(user_id)
+    before = len(repo.list_tasks())
+    result = repo.import_tasks(source, reject_path=rejects, batch_size=2)
+
+    assert (result.inserted, result.rejected) == (2, 5)
+    assert [json.loads(line)["line"] for line in rejects.read_text(encoding="utf-8").splitlines()] == [2, 3, 4, 5, 6]
+    added = repo.list_tasks()[before:]
+    assert [(task.name, task.task_type, task.fixed_time, task.recurrence) for task in added] == [
+        ("Good", "flexible", None, None), ("Fixed", "fixed", "09:00", "mon,wed")]
@@ -0,0 +1,78 @@
+# File: tests/test_task_repo.py
+# Description: TaskRepo behaviour against a real (temporary) database.
+# Programmer(s): Jace Keagy, K Li, Lan Lim, Jenna Luong, Kit Magar, Bryce Martin
+# Created: 2026-10-16
+
+from src.db import get_connection
+from src.schedule_repo import ScheduleRepo, insert_schedule
+from src.task_repo import TaskRepo, detect_all_fixed_task_conflicts
+
+
+def _saved_schedule(user_id, *task_ids):
+    """Save one 30-minute block per task from 9:00 AM; returns the schedule id"""
+    blocks = [(task_id, 540 + 30 * k, 570 + 30 * k) for k, task_id in enumerate(task_ids)]
+    with get_connection() as conn:
+        return insert_schedule(conn, user_id, "Saved", "automatic", blocks)
+
+
+def test_delete_task_in_saved_schedule(user_id):
+    repo = TaskRepo(user_id)
+    kept = repo.add_task("Kept", 30)
+    gone = repo.add_task("Gone", 30)
+    schedule_id = _saved_schedule(user_id, kept, gone)
+
+    assert repo.delete_task(gone) is True
+    assert repo.get_task(gone) is None
+    # the saved schedule keeps the block; it just no longer names a task
+    items = ScheduleRepo(user_id).load_items(schedule_id)
+    assert [(item.task_id, item.task_name, item.start_time) for item in items] == [
+        (kept, "Kept", "09:00"), (None, None, "09:30")]
+
+
+def test_delete_tasks_in_saved_schedule(user_id):
+    repo = TaskRepo(user_id)
+    ids = repo.add_tasks([("A", 30), ("B", 30), ("C", 30)])
+    schedule_id = _saved_schedule(user_id, *ids)
+
+    assert repo.delete_tasks(ids[:2] + [999999]) == {"deleted": ids[:2], "not_found": [999999]}
+    items = ScheduleRepo(user_id).load_items(schedule_id)
+    assert [item.task_id for item in items] == [None, None, ids[2]]
+
+
+def test_add_tasks_returns_the_new_ids(user_id):
+    repo = TaskRepo(user_id)
+    # a gap below the highest id must not shift the ids add_tasks reports
+    first = repo.add_task("First", 10)
+    repo.delete_task(first)
+    ids = repo.add_tasks([("A", 15), ("B", 30), ("C", 45)])
+    assert [(task.id, task.name, task.duration) for task in map(repo.get_task, ids)] == [
+        (ids[0], "A", 15), (ids[1], "B", 30), (ids[2], "C", 45)]
+    assert repo.add_tasks([]) == []
+
+
+def _fixed(repo, name, start, duration, recurrence):
+    task_id = repo.add_task(name, duration)
+    repo.set_task_type(task_id, "fixed", start)
+    repo.set_recurrence(task_id, recurrence)
+    repo.set_selected([task_id])
+    return task_id
+
+
+def test_fixed_tasks_conflict_only_on_shared_weekdays(user_id):
+    repo = TaskRepo(user_id)
+    repo.delete_tasks([task.id for task in repo.list_tasks()])
+    _fixed(repo, "Lecture", "9:00 AM", 60, "mon,wed")
+    _fixed(repo, "Lab", "9:00 AM", 60, "tue,thu")
+    # Sunday's late shift runs into Monday morning but never meets the Friday class
+    _fixed(repo, "Shift", "11:00 PM", 120, "sun")
+    _fixed(repo, "Class", "12:30 AM", 30, "fri")
+    assert repo.detect_fixed_task_conflicts() == []
+    assert repo.detect_fixed_task_conflict_groups() == []
+    assert detect_all_fixed_task_conflicts() == {}
+
+    _fixed(repo, "Seminar", "9:30 AM", 60, "wed")
+    _fixed(repo, "Gym", "12:00 AM", 60, "mon")
+    names = [(pair["task1"][1], pair["task2"][1]) for pair in repo.detect_fixed_task_conflicts()]
+    assert sorted(names) == [("Gym", "Shift"), ("Lecture", "Seminar")]
+    groups = detect_all_fixed_task_conflicts()[user_id]
+    assert sorted(sorted(task[1] for task in group) for group in groups) == [["Gym", "Shift"], ["Lecture", "Seminar"]]